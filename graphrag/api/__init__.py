@@ -24,11 +24,13 @@ from graphrag.api.query import (
     multi_index_local_search,
 )
 from graphrag.prompt_tune.types import DocSelectionType
+from graphrag.query.engine import QueryEngine
 
 __all__ = [  # noqa: RUF022
     # index API
     "build_index",
     # query API
+    "QueryEngine",
     "global_search",
     "global_search_streaming",
     "local_search",
@@ -13,6 +13,9 @@ Contains the following functions:
  - local_search: Perform a local search.
  - local_search_streaming: Perform a local search and stream results back.
 
+The single-index functions load the given tables into a QueryEngine for one search. To
+serve many searches over the same index, create a QueryEngine once and query it directly.
+
 WARNING: This API is under development and may undergo changes in future releases.
 Backwards compatibility is not guaranteed at this time.
 """
@@ -23,38 +26,10 @@ from typing import Any
 import pandas as pd
 from pydantic import validate_call
 
-from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
 from graphrag.callbacks.query_callbacks import QueryCallbacks
-from graphrag.config.embeddings import (
-    community_full_content_embedding,
-    entity_description_embedding,
-    text_unit_text_embedding,
-)
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.logger.print_progress import PrintProgressLogger
-from graphrag.query.factory import (
-    get_basic_search_engine,
-    get_drift_search_engine,
-    get_global_search_engine,
-    get_local_search_engine,
-)
-from graphrag.query.indexer_adapters import (
-    read_indexer_communities,
-    read_indexer_covariates,
-    read_indexer_entities,
-    read_indexer_relationships,
-    read_indexer_report_embeddings,
-    read_indexer_reports,
-    read_indexer_text_units,
-)
-from graphrag.utils.api import (
-    get_embedding_store,
-    load_search_prompt,
-    update_context_data,
-)
-from graphrag.utils.cli import redact
-
-logger = PrintProgressLogger("")
+from graphrag.query.engine import QueryEngine
+from graphrag.utils.api import update_context_data
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -93,31 +68,19 @@ async def global_search(
     ------
     TODO: Document any exceptions to expect.
     """
-    callbacks = callbacks or []
-    full_response = ""
-    context_data = {}
-
-    def on_context(context: Any) -> None:
-        nonlocal context_data
-        context_data = context
-
-    local_callbacks = NoopQueryCallbacks()
-    local_callbacks.on_context = on_context
-    callbacks.append(local_callbacks)
-
-    async for chunk in global_search_streaming(
-        config=config,
+    engine = QueryEngine(
+        config,
         entities=entities,
         communities=communities,
         community_reports=community_reports,
+    )
+    return await engine.global_search(
+        query,
         community_level=community_level,
         dynamic_community_selection=dynamic_community_selection,
         response_type=response_type,
-        query=query,
         callbacks=callbacks,
-    ):
-        full_response += chunk
-    return full_response, context_data
+    )
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -155,37 +118,19 @@ def global_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
-    communities_ = read_indexer_communities(communities, community_reports)
-    reports = read_indexer_reports(
-        community_reports,
-        communities,
+    engine = QueryEngine(
+        config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+    )
+    return engine.global_search_streaming(
+        query,
         community_level=community_level,
         dynamic_community_selection=dynamic_community_selection,
-    )
-    entities_ = read_indexer_entities(
-        entities, communities, community_level=community_level
-    )
-    map_prompt = load_search_prompt(config.root_dir, config.global_search.map_prompt)
-    reduce_prompt = load_search_prompt(
-        config.root_dir, config.global_search.reduce_prompt
-    )
-    knowledge_prompt = load_search_prompt(
-        config.root_dir, config.global_search.knowledge_prompt
-    )
-
-    search_engine = get_global_search_engine(
-        config,
-        reports=reports,
-        entities=entities_,
-        communities=communities_,
         response_type=response_type,
-        dynamic_community_selection=dynamic_community_selection,
-        map_system_prompt=map_prompt,
-        reduce_system_prompt=reduce_prompt,
-        general_knowledge_inclusion_prompt=knowledge_prompt,
         callbacks=callbacks,
     )
-    return search_engine.stream_search(query=query)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -367,33 +312,21 @@ async def local_search(
     ------
     TODO: Document any exceptions to expect.
     """
-    callbacks = callbacks or []
-    full_response = ""
-    context_data = {}
-
-    def on_context(context: Any) -> None:
-        nonlocal context_data
-        context_data = context
-
-    local_callbacks = NoopQueryCallbacks()
-    local_callbacks.on_context = on_context
-    callbacks.append(local_callbacks)
-
-    async for chunk in local_search_streaming(
-        config=config,
+    engine = QueryEngine(
+        config,
         entities=entities,
         communities=communities,
         community_reports=community_reports,
         text_units=text_units,
         relationships=relationships,
         covariates=covariates,
+    )
+    return await engine.local_search(
+        query,
         community_level=community_level,
         response_type=response_type,
-        query=query,
         callbacks=callbacks,
-    ):
-        full_response += chunk
-    return full_response, context_data
+    )
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -432,34 +365,21 @@ def local_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
-    vector_store_args = {}
-    for index, store in config.vector_store.items():
-        vector_store_args[index] = store.model_dump()
-    msg = f"Vector Store Args: {redact(vector_store_args)}"
-    logger.info(msg)
-
-    description_embedding_store = get_embedding_store(
-        config_args=vector_store_args,
-        embedding_name=entity_description_embedding,
+    engine = QueryEngine(
+        config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        covariates=covariates,
     )
-
-    entities_ = read_indexer_entities(entities, communities, community_level)
-    covariates_ = read_indexer_covariates(covariates) if covariates is not None else []
-    prompt = load_search_prompt(config.root_dir, config.local_search.prompt)
-
-    search_engine = get_local_search_engine(
-        config=config,
-        reports=read_indexer_reports(community_reports, communities, community_level),
-        text_units=read_indexer_text_units(text_units),
-        entities=entities_,
-        relationships=read_indexer_relationships(relationships),
-        covariates={"claims": covariates_},
-        description_embedding_store=description_embedding_store,
+    return engine.local_search_streaming(
+        query,
+        community_level=community_level,
         response_type=response_type,
-        system_prompt=prompt,
         callbacks=callbacks,
     )
-    return search_engine.stream_search(query=query)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -726,32 +646,20 @@ async def drift_search(
     ------
     TODO: Document any exceptions to expect.
     """
-    callbacks = callbacks or []
-    full_response = ""
-    context_data = {}
-
-    def on_context(context: Any) -> None:
-        nonlocal context_data
-        context_data = context
-
-    local_callbacks = NoopQueryCallbacks()
-    local_callbacks.on_context = on_context
-    callbacks.append(local_callbacks)
-
-    async for chunk in drift_search_streaming(
-        config=config,
+    engine = QueryEngine(
+        config,
         entities=entities,
         communities=communities,
         community_reports=community_reports,
         text_units=text_units,
         relationships=relationships,
+    )
+    return await engine.drift_search(
+        query,
         community_level=community_level,
         response_type=response_type,
-        query=query,
         callbacks=callbacks,
-    ):
-        full_response += chunk
-    return full_response, context_data
+    )
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -787,43 +695,20 @@ def drift_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
-    vector_store_args = {}
-    for index, store in config.vector_store.items():
-        vector_store_args[index] = store.model_dump()
-    msg = f"Vector Store Args: {redact(vector_store_args)}"
-    logger.info(msg)
-
-    description_embedding_store = get_embedding_store(
-        config_args=vector_store_args,
-        embedding_name=entity_description_embedding,
-    )
-
-    full_content_embedding_store = get_embedding_store(
-        config_args=vector_store_args,
-        embedding_name=community_full_content_embedding,
-    )
-
-    entities_ = read_indexer_entities(entities, communities, community_level)
-    reports = read_indexer_reports(community_reports, communities, community_level)
-    read_indexer_report_embeddings(reports, full_content_embedding_store)
-    prompt = load_search_prompt(config.root_dir, config.drift_search.prompt)
-    reduce_prompt = load_search_prompt(
-        config.root_dir, config.drift_search.reduce_prompt
+    engine = QueryEngine(
+        config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
     )
-
-    search_engine = get_drift_search_engine(
-        config=config,
-        reports=reports,
-        text_units=read_indexer_text_units(text_units),
-        entities=entities_,
-        relationships=read_indexer_relationships(relationships),
-        description_embedding_store=description_embedding_store,
-        local_system_prompt=prompt,
-        reduce_system_prompt=reduce_prompt,
+    return engine.drift_search_streaming(
+        query,
+        community_level=community_level,
         response_type=response_type,
         callbacks=callbacks,
     )
-    return search_engine.stream_search(query=query)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1058,26 +943,8 @@ async def basic_search(
     ------
     TODO: Document any exceptions to expect.
     """
-    callbacks = callbacks or []
-    full_response = ""
-    context_data = {}
-
-    def on_context(context: Any) -> None:
-        nonlocal context_data
-        context_data = context
-
-    local_callbacks = NoopQueryCallbacks()
-    local_callbacks.on_context = on_context
-    callbacks.append(local_callbacks)
-
-    async for chunk in basic_search_streaming(
-        config=config,
-        text_units=text_units,
-        query=query,
-        callbacks=callbacks,
-    ):
-        full_response += chunk
-    return full_response, context_data
+    engine = QueryEngine(config, text_units=text_units)
+    return await engine.basic_search(query, callbacks=callbacks)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1103,27 +970,8 @@ def basic_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
-    vector_store_args = {}
-    for index, store in config.vector_store.items():
-        vector_store_args[index] = store.model_dump()
-    msg = f"Vector Store Args: {redact(vector_store_args)}"
-    logger.info(msg)
-
-    description_embedding_store = get_embedding_store(
-        config_args=vector_store_args,
-        embedding_name=text_unit_text_embedding,
-    )
-
-    prompt = load_search_prompt(config.root_dir, config.basic_search.prompt)
-
-    search_engine = get_basic_search_engine(
-        config=config,
-        text_units=read_indexer_text_units(text_units),
-        text_unit_embeddings=description_embedding_store,
-        system_prompt=prompt,
-        callbacks=callbacks,
-    )
-    return search_engine.stream_search(query=query)
+    engine = QueryEngine(config, text_units=text_units)
+    return engine.basic_search_streaming(query, callbacks=callbacks)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -0,0 +1,206 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the content-addressed 'EmbeddingCache' model."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from hashlib import blake2b, sha256
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from graphrag.cache.pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+DIGEST_SIZE = 16
+"""Bytes of the blake2b text digest used as the content address."""
+
+GROWTH_FACTOR = 2
+"""Rows a segment must hold, relative to the next newer one, to not be merged with it."""
+
+
+def hash_texts(texts: Sequence[str]) -> list[bytes]:
+    """Return the content address of each text."""
+    return [
+        blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+        for text in texts
+    ]
+
+
+@dataclass
+class _Segment:
+    """An immutable run of cached rows, persisted as two binary cache entries."""
+
+    id: int
+    digests: list[bytes]
+    matrix: np.ndarray
+
+
+class EmbeddingCache:
+    """Content-addressed embedding store keyed by (model, text hash).
+
+    Vectors are persisted through a `PipelineCache` as immutable segments, each one a
+    raw little-endian float32 matrix and the packed digests of its rows, stored with
+    `set_bytes`. A JSON manifest lists the live segments. Like the runs of an LSM tree,
+    a new segment is merged with the previous one until that one holds at least
+    `GROWTH_FACTOR` times its rows, so there are O(log n) segments and every row is
+    rewritten O(log n) times. All segments are loaded into an in-memory digest -> row
+    index on first use, so lookups never touch the backing cache and only new text is
+    sent to the embedding endpoint.
+    """
+
+    _registry: ClassVar[WeakKeyDictionary[PipelineCache, dict[str, EmbeddingCache]]] = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self, cache: PipelineCache, model: str):
+        """Init method definition."""
+        self._cache = cache
+        self._namespace = f"embeddings-{sha256(model.encode('utf-8')).hexdigest()[:16]}"
+        self._segments: list[_Segment] = []
+        self._index: dict[bytes, tuple[int, int]] = {}
+        self._next_id = 0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_model(cls, cache: PipelineCache, model: str) -> EmbeddingCache:
+        """Get the shared embedding cache of a model, so segments load once per run."""
+        caches = cls._registry.setdefault(cache, {})
+        if model not in caches:
+            caches[model] = cls(cache, model)
+        return caches[model]
+
+    @property
+    def _manifest_key(self) -> str:
+        return f"{self._namespace}-manifest"
+
+    async def lookup(self, texts: Sequence[str]) -> list[np.ndarray | None]:
+        """Resolve all texts in bulk, returning None for the misses."""
+        await self._ensure_loaded()
+        result: list[np.ndarray | None] = []
+        for digest in hash_texts(texts):
+            location = self._index.get(digest)
+            if location is None:
+                result.append(None)
+            else:
+                segment, row = location
+                result.append(self._segments[segment].matrix[row])
+        return result
+
+    async def add(self, texts: Sequence[str], vectors: Sequence[np.ndarray]) -> None:
+        """Persist the vectors of newly embedded texts as a new segment."""
+        await self._ensure_loaded()
+        new_rows: dict[bytes, np.ndarray] = {}
+        for digest, vector in zip(hash_texts(texts), vectors, strict=True):
+            if digest not in self._index:
+                new_rows.setdefault(digest, vector)
+        if not new_rows:
+            return
+
+        matrix = np.asarray(np.stack(list(new_rows.values())), dtype=np.float32)
+        async with self._lock:
+            persisted = {segment.id for segment in self._segments}
+            self._register(self._new_segment(list(new_rows.keys()), matrix))
+            while self._last_segments_need_merge():
+                self._merge_last()
+            written = self._segments[-1]
+            await self._cache.set_bytes(
+                self._key(written.id, "digests"), b"".join(written.digests)
+            )
+            await self._cache.set_bytes(
+                self._key(written.id, "vectors"), written.matrix.astype("<f4").tobytes()
+            )
+            await self._cache.set(
+                self._manifest_key,
+                {
+                    "next_id": self._next_id,
+                    "segments": [
+                        [segment.id, len(segment.digests), segment.matrix.shape[1]]
+                        for segment in self._segments
+                    ],
+                },
+            )
+            # the manifest no longer lists the merged segments
+            for segment_id in persisted - {segment.id for segment in self._segments}:
+                await self._cache.delete(self._key(segment_id, "digests"))
+                await self._cache.delete(self._key(segment_id, "vectors"))
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            manifest = await self._cache.get(self._manifest_key) or {}
+            self._next_id = manifest.get("next_id", 0)
+            for segment_id, rows, dim in manifest.get("segments", []):
+                segment = await self._load_segment(segment_id, rows, dim)
+                if segment is None:
+                    log.warning("embedding cache segment %s is missing", segment_id)
+                    continue
+                self._register(segment)
+            self._loaded = True
+            log.info(
+                "loaded %d cached embeddings from %d segments",
+                len(self._index),
+                len(self._segments),
+            )
+
+    async def _load_segment(
+        self, segment_id: int, rows: int, dim: int
+    ) -> _Segment | None:
+        packed = await self._cache.get_bytes(self._key(segment_id, "digests"))
+        vectors = await self._cache.get_bytes(self._key(segment_id, "vectors"))
+        if (
+            packed is None
+            or vectors is None
+            or len(packed) != rows * DIGEST_SIZE
+            or len(vectors) != rows * dim * 4
+        ):
+            return None
+        digests = [
+            packed[start : start + DIGEST_SIZE]
+            for start in range(0, len(packed), DIGEST_SIZE)
+        ]
+        matrix = np.frombuffer(vectors, dtype="<f4").reshape(rows, dim)
+        return _Segment(segment_id, digests, matrix)
+
+    def _new_segment(self, digests: list[bytes], matrix: np.ndarray) -> _Segment:
+        self._next_id += 1
+        return _Segment(self._next_id - 1, digests, matrix)
+
+    def _register(self, segment: _Segment) -> None:
+        position = len(self._segments)
+        self._segments.append(segment)
+        for row, digest in enumerate(segment.digests):
+            self._index[digest] = (position, row)
+
+    def _last_segments_need_merge(self) -> bool:
+        if len(self._segments) < 2:
+            return False
+        older, newer = self._segments[-2:]
+        return len(older.digests) < GROWTH_FACTOR * len(newer.digests)
+
+    def _merge_last(self) -> None:
+        """Merge the two newest segments into one."""
+        newer = self._segments.pop()
+        older = self._segments.pop()
+        self._register(
+            self._new_segment(
+                older.digests + newer.digests,
+                np.concatenate([older.matrix, newer.matrix]),
+            )
+        )
+
+    def _key(self, segment_id: int, part: str) -> str:
+        return f"{self._namespace}-{segment_id}-{part}"
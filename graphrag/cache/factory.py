@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from graphrag.config.enums import CacheType
@@ -18,6 +19,10 @@ if TYPE_CHECKING:
 from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.packed_pipeline_cache import PackedPipelineCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
+
+PACKED_CACHE_FILE = "cache.packed"
 
 
 class CacheFactory:
@@ -49,15 +54,32 @@ class CacheFactory:
             case CacheType.memory:
                 return InMemoryCache()
             case CacheType.file:
-                return JsonPipelineCache(
+                backend = JsonPipelineCache(
                     FilePipelineStorage(root_dir=root_dir).child(kwargs["base_dir"])
                 )
             case CacheType.blob:
-                return JsonPipelineCache(create_blob_storage(**kwargs))
+                backend = JsonPipelineCache(create_blob_storage(**kwargs))
             case CacheType.cosmosdb:
-                return JsonPipelineCache(create_cosmosdb_storage(**kwargs))
+                # cosmosdb stores JSON documents, binary values are base64 encoded
+                backend = JsonPipelineCache(
+                    create_cosmosdb_storage(**kwargs), raw_bytes=False
+                )
+            case CacheType.packed:
+                backend = PackedPipelineCache(
+                    Path(root_dir) / kwargs["base_dir"] / PACKED_CACHE_FILE
+                )
             case _:
                 if cache_type in cls.cache_types:
                     return cls.cache_types[cache_type](**kwargs)
                 msg = f"Unknown cache type: {cache_type}"
                 raise ValueError(msg)
+        return _with_memory_tier(backend, kwargs)
+
+
+def _with_memory_tier(backend: PipelineCache, kwargs: dict) -> PipelineCache:
+    """Put the in-memory LRU tier in front of a persistent cache, unless disabled."""
+    max_entries = kwargs.get("memory_max_entries", 0)
+    max_bytes = kwargs.get("memory_max_bytes", 0)
+    if max_entries <= 0 or max_bytes <= 0:
+        return backend
+    return TieredPipelineCache(backend, max_entries, max_bytes)
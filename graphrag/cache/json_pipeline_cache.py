@@ -15,11 +15,17 @@ class JsonPipelineCache(PipelineCache):
 
     _storage: PipelineStorage
     _encoding: str
+    _raw_bytes: bool
 
-    def __init__(self, storage: PipelineStorage, encoding="utf-8"):
-        """Init method definition."""
+    def __init__(self, storage: PipelineStorage, encoding="utf-8", raw_bytes=True):
+        """Init method definition.
+
+        Binary values are written to the storage as they are, unless `raw_bytes` is
+        False for storages that only hold JSON documents.
+        """
         self._storage = storage
         self._encoding = encoding
+        self._raw_bytes = raw_bytes
 
     async def get(self, key: str) -> str | None:
         """Get method definition."""
@@ -47,6 +53,21 @@ class JsonPipelineCache(PipelineCache):
             key, json.dumps(data, ensure_ascii=False), encoding=self._encoding
         )
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get bytes method definition."""
+        if not self._raw_bytes:
+            return await super().get_bytes(key)
+        if await self.has(key):
+            return await self._storage.get(key, as_bytes=True)
+        return None
+
+    async def set_bytes(self, key: str, value: bytes) -> None:
+        """Set bytes method definition."""
+        if not self._raw_bytes:
+            await super().set_bytes(key, value)
+            return
+        await self._storage.set(key, value)
+
     async def has(self, key: str) -> bool:
         """Has method definition."""
         return await self._storage.has(key)
@@ -62,4 +83,8 @@ class JsonPipelineCache(PipelineCache):
 
     def child(self, name: str) -> "JsonPipelineCache":
         """Child method definition."""
-        return JsonPipelineCache(self._storage.child(name), encoding=self._encoding)
+        return JsonPipelineCache(
+            self._storage.child(name),
+            encoding=self._encoding,
+            raw_bytes=self._raw_bytes,
+        )
@@ -43,6 +43,14 @@ class InMemoryCache(PipelineCache):
         key = self._create_cache_key(key)
         self._cache[key] = value
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get the binary value for the given key."""
+        return await self.get(key)
+
+    async def set_bytes(self, key: str, value: bytes) -> None:
+        """Set a binary value for the given key."""
+        await self.set(key, value)
+
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
 
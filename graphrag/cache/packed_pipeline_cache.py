@@ -0,0 +1,322 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the log-structured 'PackedPipelineCache' model."""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import threading
+import weakref
+import zlib
+from pathlib import Path
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+_MAGIC = b"GRAPHRAG-PACKED-CACHE-1\n"
+# key length, value length, tombstone flag, crc32 of key + value
+_HEADER = struct.Struct("<IIBI")
+_PUT = 0
+_DELETE = 1
+
+DEFAULT_SYNC_EVERY = 256
+"""Number of appended records between two fsync calls."""
+
+COMPACTION_MIN_BYTES = 4 * 1024 * 1024
+"""Dead bytes that must accumulate before compaction is considered."""
+
+
+class _PackedLog:
+    """Append-only record log with an in-memory key -> value offset index.
+
+    Records are `header | key | value`; a delete appends a tombstone. The index is
+    rebuilt by one sequential scan when the file is opened, a torn tail from an
+    interrupted write is truncated away, and the file is rewritten with only the live
+    records once dead records outweigh live ones. Writes only append; they report when
+    an fsync or a compaction is due, which `maintain` then runs.
+    """
+
+    def __init__(self, path: Path, sync_every: int = DEFAULT_SYNC_EVERY):
+        self._path = path
+        self._sync_every = sync_every
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[int, int]] = {}
+        self._live_bytes = 0
+        self._dead_bytes = 0
+        self._unsynced = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = self._open()
+        self._finalizer = weakref.finalize(self, _close_fd, self._fd)
+        self._load()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            offset, length = location
+            return os.pread(self._fd, length, offset)
+
+    def has(self, key: str) -> bool:
+        return key in self._index
+
+    def live_keys(self) -> list[str]:
+        with self._lock:
+            return list(self._index)
+
+    def put(self, key: str, value: bytes) -> bool:
+        """Append a record, returning whether `maintain` is due."""
+        with self._lock:
+            self._append(key, value, _PUT)
+            return self._maintenance_due()
+
+    def delete(self, key: str) -> bool:
+        """Append a tombstone if the key is live, returning whether `maintain` is due."""
+        with self._lock:
+            if key in self._index:
+                self._append(key, b"", _DELETE)
+            return self._maintenance_due()
+
+    def maintain(self) -> None:
+        """Run the fsync or the compaction the appended records made due."""
+        with self._lock:
+            if self._unsynced >= self._sync_every:
+                os.fsync(self._fd)
+                self._unsynced = 0
+            self._maybe_compact()
+
+    def clear(self) -> None:
+        with self._lock:
+            os.ftruncate(self._fd, len(_MAGIC))
+            os.fsync(self._fd)
+            self._index.clear()
+            self._live_bytes = self._dead_bytes = self._unsynced = 0
+
+    def sync(self) -> None:
+        with self._lock:
+            os.fsync(self._fd)
+            self._unsynced = 0
+
+    def compact(self) -> None:
+        with self._lock:
+            self._compact()
+
+    def _open(self) -> int:
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        if os.fstat(fd).st_size == 0:
+            os.write(fd, _MAGIC)
+            os.fsync(fd)
+        return fd
+
+    def _load(self) -> None:
+        with self._path.open("rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                msg = f"{self._path} is not a packed cache file"
+                raise ValueError(msg)
+            offset = len(_MAGIC)
+            while header := file.read(_HEADER.size):
+                if len(header) < _HEADER.size:
+                    break
+                key_length, value_length, flag, crc = _HEADER.unpack(header)
+                body = file.read(key_length + value_length)
+                if len(body) < key_length + value_length or zlib.crc32(body) != crc:
+                    break
+                key = body[:key_length].decode("utf-8")
+                self._index_record(key, offset, key_length, value_length, flag)
+                offset += _HEADER.size + key_length + value_length
+        if offset < os.fstat(self._fd).st_size:
+            log.warning("truncating torn tail of packed cache %s", self._path)
+            os.ftruncate(self._fd, offset)
+        self._maybe_compact()
+
+    def _append(self, key: str, value: bytes, flag: int) -> None:
+        encoded_key = key.encode("utf-8")
+        body = encoded_key + value
+        record = (
+            _HEADER.pack(len(encoded_key), len(value), flag, zlib.crc32(body)) + body
+        )
+        offset = os.lseek(self._fd, 0, os.SEEK_END)
+        os.write(self._fd, record)
+        self._index_record(key, offset, len(encoded_key), len(value), flag)
+        self._unsynced += 1
+
+    def _maintenance_due(self) -> bool:
+        return self._unsynced >= self._sync_every or self._compaction_due()
+
+    def _index_record(
+        self, key: str, offset: int, key_length: int, value_length: int, flag: int
+    ) -> None:
+        record_length = _HEADER.size + key_length + value_length
+        previous = self._index.pop(key, None)
+        if previous is not None:
+            # the superseded record and this record's header now count as dead
+            self._live_bytes -= previous[1]
+            self._dead_bytes += previous[1] + _HEADER.size + key_length
+        if flag == _PUT:
+            self._index[key] = (offset + _HEADER.size + key_length, value_length)
+            self._live_bytes += value_length
+        else:
+            self._dead_bytes += record_length
+
+    def _compaction_due(self) -> bool:
+        return (
+            self._dead_bytes >= COMPACTION_MIN_BYTES
+            and self._dead_bytes > self._live_bytes
+        )
+
+    def _maybe_compact(self) -> None:
+        if self._compaction_due():
+            self._compact()
+
+    def _compact(self) -> None:
+        temp_path = self._path.with_suffix(self._path.suffix + ".compact")
+        index: dict[str, tuple[int, int]] = {}
+        with temp_path.open("wb") as file:
+            file.write(_MAGIC)
+            offset = len(_MAGIC)
+            for key, (value_offset, value_length) in self._index.items():
+                encoded_key = key.encode("utf-8")
+                body = encoded_key + os.pread(self._fd, value_length, value_offset)
+                file.write(
+                    _HEADER.pack(len(encoded_key), value_length, _PUT, zlib.crc32(body))
+                )
+                file.write(body)
+                index[key] = (offset + _HEADER.size + len(encoded_key), value_length)
+                offset += _HEADER.size + len(body)
+            file.flush()
+            os.fsync(file.fileno())
+        temp_path.replace(self._path)
+        self._finalizer.detach()
+        os.close(self._fd)
+        self._fd = self._open()
+        self._finalizer = weakref.finalize(self, _close_fd, self._fd)
+        self._index = index
+        self._dead_bytes = 0
+        self._unsynced = 0
+
+
+def _close_fd(fd: int) -> None:
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+_open_logs: weakref.WeakValueDictionary[Path, _PackedLog] = (
+    weakref.WeakValueDictionary()
+)
+_open_logs_lock = threading.Lock()
+
+
+def _shared_log(path: Path, sync_every: int) -> _PackedLog:
+    """Return the open log of a file, opening it if no cache of this process has.
+
+    Compaction replaces the file and reopens it, so a second log opened on the same
+    path would keep appending to the unlinked file and lose its writes.
+    """
+    path = path.resolve()
+    with _open_logs_lock:
+        packed_log = _open_logs.get(path)
+        if packed_log is None:
+            packed_log = _open_logs[path] = _PackedLog(path, sync_every)
+        return packed_log
+
+
+class PackedPipelineCache(PipelineCache):
+    """Pipeline cache storing every entry in a single append-only log file.
+
+    Entries use the same JSON envelope as `JsonPipelineCache`, but a lookup is a
+    dictionary probe plus one positional read instead of an exists check, an open and
+    a read per file. Child caches share the log and namespace their keys, and so do
+    caches of this process opened on the same path. The file must not be written by
+    another process at the same time. Writes append on the event loop, while the
+    periodic fsync and the compaction run in a worker thread.
+    """
+
+    _log: _PackedLog
+    _prefix: str
+
+    def __init__(
+        self,
+        path: str | Path,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        packed_log: _PackedLog | None = None,
+        prefix: str = "",
+    ):
+        """Init method definition."""
+        self._log = packed_log or _shared_log(Path(path), sync_every)
+        self._path = Path(path)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        data = self._log.get(self._prefix + key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data).get("result")
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+            await self._delete(key)
+            return None
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        data = {"result": value, **(debug_data or {})}
+        await self._put(key, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get bytes method definition."""
+        return self._log.get(self._prefix + key)
+
+    async def set_bytes(self, key: str, value: bytes) -> None:
+        """Set bytes method definition."""
+        await self._put(key, value)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return self._log.has(self._prefix + key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await self._delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        if not self._prefix:
+            await asyncio.to_thread(self._log.clear)
+            return
+        due = False
+        for key in self._log.live_keys():
+            if key.startswith(self._prefix):
+                due = self._log.delete(key) or due
+        if due:
+            await asyncio.to_thread(self._log.maintain)
+
+    def child(self, name: str) -> "PackedPipelineCache":
+        """Child method definition."""
+        return PackedPipelineCache(
+            self._path, packed_log=self._log, prefix=f"{self._prefix}{name}/"
+        )
+
+    async def _put(self, key: str, value: bytes) -> None:
+        if self._log.put(self._prefix + key, value):
+            await asyncio.to_thread(self._log.maintain)
+
+    async def _delete(self, key: str) -> None:
+        if self._log.delete(self._prefix + key):
+            await asyncio.to_thread(self._log.maintain)
+
+    def flush(self) -> None:
+        """Fsync every appended entry."""
+        self._log.sync()
+
+    def compact(self) -> None:
+        """Rewrite the log with only the live entries."""
+        self._log.compact()
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import base64
 from abc import ABCMeta, abstractmethod
 from typing import Any
 
@@ -34,6 +35,31 @@ class PipelineCache(metaclass=ABCMeta):
             - value - The value to set.
         """
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get the binary value for the given key.
+
+        Args:
+            - key - The key to get the value for.
+
+        Returns
+        -------
+            - output - The bytes stored by `set_bytes`, None if there are none.
+        """
+        value = await self.get(key)
+        return None if value is None else base64.b64decode(value)
+
+    async def set_bytes(self, key: str, value: bytes) -> None:
+        """Set a binary value for the given key.
+
+        Caches that can only hold JSON values store it base64 encoded; the others
+        override this to store the bytes as they are.
+
+        Args:
+            - key - The key to set the value for.
+            - value - The bytes to set.
+        """
+        await self.set(key, base64.b64encode(value).decode("ascii"))
+
     @abstractmethod
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the cache.
@@ -0,0 +1,179 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'TieredPipelineCache' model."""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Lookup statistics of a tiered cache."""
+
+    memory_hits: int = 0
+    """Lookups answered by the in-memory tier."""
+
+    backend_hits: int = 0
+    """Lookups answered by the persistent backend."""
+
+    misses: int = 0
+    """Lookups found in neither tier."""
+
+    evictions: int = 0
+    """Entries evicted from the in-memory tier."""
+
+    def snapshot(self) -> dict[str, int]:
+        """Return the current counters."""
+        return asdict(self)
+
+    def since(self, snapshot: dict[str, int]) -> dict[str, int]:
+        """Return the counters accumulated since the given snapshot."""
+        return {name: value - snapshot[name] for name, value in asdict(self).items()}
+
+
+class _LRUTier:
+    """Bounded LRU of JSON-encoded values, evicting by entry count and byte size.
+
+    Values are stored encoded so that callers mutating a returned value cannot
+    corrupt the cached copy, and the size of an entry is its encoded length.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, stats: CacheStats):
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._stats = stats
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> str | None:
+        encoded = self._entries.get(key)
+        if encoded is not None:
+            self._entries.move_to_end(key)
+        return encoded
+
+    def put(self, key: str, encoded: str) -> None:
+        self.pop(key)
+        if len(encoded) > self._max_bytes:
+            return
+        self._entries[key] = encoded
+        self._bytes += len(encoded)
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._stats.evictions += 1
+
+    def pop(self, key: str) -> None:
+        encoded = self._entries.pop(key, None)
+        if encoded is not None:
+            self._bytes -= len(encoded)
+
+    def clear(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self.pop(key)
+
+
+class TieredPipelineCache(PipelineCache):
+    """Bounded in-memory LRU tier in front of a persistent `PipelineCache`.
+
+    Reads are served from memory when possible and populate it on a backend hit,
+    writes go through to the backend. Child caches share one LRU and one set of
+    statistics, so the bounds apply to the whole pipeline.
+    """
+
+    _backend: PipelineCache
+    _tier: _LRUTier
+    _prefix: str
+    stats: CacheStats
+
+    def __init__(
+        self,
+        backend: PipelineCache,
+        max_entries: int,
+        max_bytes: int,
+        tier: _LRUTier | None = None,
+        stats: CacheStats | None = None,
+        prefix: str = "",
+    ):
+        """Init method definition."""
+        self._backend = backend
+        self.stats = stats or CacheStats()
+        self._tier = tier or _LRUTier(max_entries, max_bytes, self.stats)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        encoded = self._tier.get(self._prefix + key)
+        if encoded is not None:
+            self.stats.memory_hits += 1
+            return json.loads(encoded)
+        value = await self._backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.backend_hits += 1
+        self._remember(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        await self._backend.set(key, value, debug_data)
+        if value is not None:
+            self._remember(key, value)
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get bytes method definition, binary values are not kept in memory."""
+        return await self._backend.get_bytes(key)
+
+    async def set_bytes(self, key: str, value: bytes) -> None:
+        """Set bytes method definition."""
+        self._tier.pop(self._prefix + key)
+        await self._backend.set_bytes(key, value)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return self._prefix + key in self._tier or await self._backend.has(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        self._tier.pop(self._prefix + key)
+        await self._backend.delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._tier.clear(self._prefix)
+        await self._backend.clear()
+
+    def child(self, name: str) -> TieredPipelineCache:
+        """Child method definition."""
+        return TieredPipelineCache(
+            self._backend.child(name),
+            self._max_entries,
+            self._max_bytes,
+            tier=self._tier,
+            stats=self.stats,
+            prefix=f"{self._prefix}{name}/",
+        )
+
+    def _remember(self, key: str, value: Any) -> None:
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+        except TypeError:
+            log.debug("not keeping non JSON value of %s in memory", key)
+            self._tier.pop(self._prefix + key)
+            return
+        self._tier.put(self._prefix + key, encoded)
@@ -62,6 +62,8 @@ class CacheDefaults:
     container_name: None = None
     storage_account_blob_url: None = None
     cosmosdb_account_url: None = None
+    memory_max_entries: int = 0
+    memory_max_bytes: int = 256 * 1024 * 1024
 
 
 @dataclass
@@ -75,6 +77,7 @@ class ChunksDefaults:
     encoding_model: str = "cl100k_base"
     prepend_metadata: bool = False
     chunk_size_includes_metadata: bool = False
+    num_workers: int = 1
 
 
 @dataclass
@@ -219,6 +222,8 @@ class ExtractGraphNLPDefaults:
     normalize_edge_weights: bool = True
     text_analyzer: TextAnalyzerDefaults = field(default_factory=TextAnalyzerDefaults)
     concurrent_requests: int = 25
+    batch_size: int = 100
+    num_processes: int = 1
 
 
 @dataclass
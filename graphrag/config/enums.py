@@ -21,6 +21,8 @@ class CacheType(str, Enum):
     """The blob cache configuration type."""
     cosmosdb = "cosmosdb"
     """The cosmosdb cache configuration type"""
+    packed = "packed"
+    """The packed (single append-only file) cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -134,6 +136,7 @@ class AsyncType(str, Enum):
 
     AsyncIO = "asyncio"
     Threaded = "threaded"
+    Process = "process"
 
 
 class ChunkStrategyType(str, Enum):
@@ -36,3 +36,11 @@ class CacheConfig(BaseModel):
         description="The cosmosdb account url to use.",
         default=graphrag_config_defaults.cache.cosmosdb_account_url,
     )
+    memory_max_entries: int = Field(
+        description="The maximum number of entries kept in the in-memory cache tier, 0 disables the tier.",
+        default=graphrag_config_defaults.cache.memory_max_entries,
+    )
+    memory_max_bytes: int = Field(
+        description="The maximum size of the entries kept in the in-memory cache tier, when it is enabled.",
+        default=graphrag_config_defaults.cache.memory_max_bytes,
+    )
@@ -40,3 +40,7 @@ class ChunkingConfig(BaseModel):
         description="Count metadata in max tokens.",
         default=graphrag_config_defaults.chunks.chunk_size_includes_metadata,
     )
+    num_workers: int = Field(
+        description="The number of worker processes used to chunk documents. 1 chunks serially.",
+        default=graphrag_config_defaults.chunks.num_workers,
+    )
@@ -65,6 +65,14 @@ class ExtractGraphNLPConfig(BaseModel):
         description="The text analyzer configuration.", default=TextAnalyzerConfig()
     )
     concurrent_requests: int = Field(
-        description="The number of threads to use for the extraction process.",
+        description="The number of concurrent cache requests of the extraction process.",
         default=graphrag_config_defaults.extract_graph_nlp.concurrent_requests,
     )
+    batch_size: int = Field(
+        description="The number of text units the text analyzer processes per batch.",
+        default=graphrag_config_defaults.extract_graph_nlp.batch_size,
+    )
+    num_processes: int = Field(
+        description="The number of processes the text analyzer runs on.",
+        default=graphrag_config_defaults.extract_graph_nlp.num_processes,
+    )
@@ -37,6 +37,15 @@ class CommunityReport(Named):
     period: str | None = None
     """The period of the report (optional)."""
 
+    summary_n_tokens: int | None = None
+    """The number of tokens in the summary, as persisted by the indexer (optional)."""
+
+    full_content_n_tokens: int | None = None
+    """The number of tokens in the full content, as persisted by the indexer (optional)."""
+
+    tokens_encoding: str | None = None
+    """The encoding the persisted token counts were made with (optional)."""
+
     @classmethod
     def from_dict(
         cls,
@@ -51,6 +60,9 @@ class CommunityReport(Named):
         attributes_key: str = "attributes",
         size_key: str = "size",
         period_key: str = "period",
+        summary_n_tokens_key: str = "summary_n_tokens",
+        full_content_n_tokens_key: str = "full_content_n_tokens",
+        tokens_encoding_key: str = "tokens_encoding",
     ) -> "CommunityReport":
         """Create a new community report from the dict data."""
         return CommunityReport(
@@ -64,4 +76,7 @@ class CommunityReport(Named):
             attributes=d.get(attributes_key),
             size=d.get(size_key),
             period=d.get(period_key),
+            summary_n_tokens=d.get(summary_n_tokens_key),
+            full_content_n_tokens=d.get(full_content_n_tokens_key),
+            tokens_encoding=d.get(tokens_encoding_key),
         )
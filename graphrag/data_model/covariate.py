@@ -30,6 +30,12 @@ class Covariate(Identified):
     text_unit_ids: list[str] | None = None
     """List of text unit IDs in which the covariate info appears (optional)."""
 
+    n_tokens: int | None = None
+    """The number of tokens in the description attribute, as persisted by the indexer (optional)."""
+
+    tokens_encoding: str | None = None
+    """The encoding the persisted token counts were made with (optional)."""
+
     attributes: dict[str, Any] | None = None
 
     @classmethod
@@ -41,6 +47,8 @@ class Covariate(Identified):
         covariate_type_key: str = "covariate_type",
         short_id_key: str = "human_readable_id",
         text_unit_ids_key: str = "text_unit_ids",
+        n_tokens_key: str = "n_tokens",
+        tokens_encoding_key: str = "tokens_encoding",
         attributes_key: str = "attributes",
     ) -> "Covariate":
         """Create a new covariate from the dict data."""
@@ -50,5 +58,7 @@ class Covariate(Identified):
             subject_id=d[subject_id_key],
             covariate_type=d.get(covariate_type_key, "claim"),
             text_unit_ids=d.get(text_unit_ids_key),
+            n_tokens=d.get(n_tokens_key),
+            tokens_encoding=d.get(tokens_encoding_key),
             attributes=d.get(attributes_key),
         )
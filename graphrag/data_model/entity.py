@@ -34,6 +34,12 @@ class Entity(Named):
     rank: int | None = 1
     """Rank of the entity, used for sorting (optional). Higher rank indicates more important entity. This can be based on centrality or other metrics."""
 
+    n_tokens: int | None = None
+    """The number of tokens in the description, as persisted by the indexer (optional)."""
+
+    tokens_encoding: str | None = None
+    """The encoding the persisted token counts were made with (optional)."""
+
     attributes: dict[str, Any] | None = None
     """Additional attributes associated with the entity (optional), e.g. start time, end time, etc. To be included in the search prompt."""
 
@@ -51,6 +57,8 @@ class Entity(Named):
         community_key: str = "community",
         text_unit_ids_key: str = "text_unit_ids",
         rank_key: str = "degree",
+        n_tokens_key: str = "n_tokens",
+        tokens_encoding_key: str = "tokens_encoding",
         attributes_key: str = "attributes",
     ) -> "Entity":
         """Create a new entity from the dict data."""
@@ -65,5 +73,7 @@ class Entity(Named):
             community_ids=d.get(community_key),
             rank=d.get(rank_key, 1),
             text_unit_ids=d.get(text_unit_ids_key),
+            n_tokens=d.get(n_tokens_key),
+            tokens_encoding=d.get(tokens_encoding_key),
             attributes=d.get(attributes_key),
         )
@@ -34,6 +34,12 @@ class Relationship(Identified):
     rank: int | None = 1
     """Rank of the relationship, used for sorting (optional). Higher rank indicates more important relationship. This can be based on centrality or other metrics."""
 
+    n_tokens: int | None = None
+    """The number of tokens in the description, as persisted by the indexer (optional)."""
+
+    tokens_encoding: str | None = None
+    """The encoding the persisted token counts were made with (optional)."""
+
     attributes: dict[str, Any] | None = None
     """Additional attributes associated with the relationship (optional). To be included in the search prompt"""
 
@@ -49,6 +55,8 @@ class Relationship(Identified):
         rank_key: str = "rank",
         weight_key: str = "weight",
         text_unit_ids_key: str = "text_unit_ids",
+        n_tokens_key: str = "n_tokens",
+        tokens_encoding_key: str = "tokens_encoding",
         attributes_key: str = "attributes",
     ) -> "Relationship":
         """Create a new relationship from the dict data."""
@@ -61,5 +69,7 @@ class Relationship(Identified):
             description=d.get(description_key),
             weight=d.get(weight_key, 1.0),
             text_unit_ids=d.get(text_unit_ids_key),
+            n_tokens=d.get(n_tokens_key),
+            tokens_encoding=d.get(tokens_encoding_key),
             attributes=d.get(attributes_key),
         )
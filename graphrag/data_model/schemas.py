@@ -49,6 +49,8 @@ RATING = "rank"
 EXPLANATION = "rating_explanation"
 FULL_CONTENT = "full_content"
 FULL_CONTENT_JSON = "full_content_json"
+SUMMARY_N_TOKENS = "summary_n_tokens"
+FULL_CONTENT_N_TOKENS = "full_content_n_tokens"
 
 ENTITY_IDS = "entity_ids"
 RELATIONSHIP_IDS = "relationship_ids"
@@ -64,6 +66,8 @@ ENTITY_DEGREE = "entity_degree"
 ALL_DETAILS = "all_details"
 TEXT = "text"
 N_TOKENS = "n_tokens"
+TEXT_N_TOKENS = "text_n_tokens"
+TOKENS_ENCODING = "tokens_encoding"
 
 CREATION_DATE = "creation_date"
 METADATA = "metadata"
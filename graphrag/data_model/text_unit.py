@@ -28,6 +28,12 @@ class TextUnit(Identified):
     n_tokens: int | None = None
     """The number of tokens in the text (optional)."""
 
+    text_n_tokens: int | None = None
+    """The number of tokens in the text with its prepended metadata, as persisted by the indexer (optional)."""
+
+    tokens_encoding: str | None = None
+    """The encoding the persisted token counts were made with (optional)."""
+
     document_ids: list[str] | None = None
     """List of document IDs in which the text unit appears (optional)."""
 
@@ -45,6 +51,8 @@ class TextUnit(Identified):
         relationships_key: str = "relationship_ids",
         covariates_key: str = "covariate_ids",
         n_tokens_key: str = "n_tokens",
+        text_n_tokens_key: str = "text_n_tokens",
+        tokens_encoding_key: str = "tokens_encoding",
         document_ids_key: str = "document_ids",
         attributes_key: str = "attributes",
     ) -> "TextUnit":
@@ -57,6 +65,8 @@ class TextUnit(Identified):
             relationship_ids=d.get(relationships_key),
             covariate_ids=d.get(covariates_key),
             n_tokens=d.get(n_tokens_key),
+            text_n_tokens=d.get(text_n_tokens_key),
+            tokens_encoding=d.get(tokens_encoding_key),
             document_ids=d.get(document_ids_key),
             attributes=d.get(attributes_key),
         )
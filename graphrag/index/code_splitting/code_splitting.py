@@ -1,4 +1,8 @@
 import ast
+from bisect import bisect_right
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 from typing import List, Tuple
 import numpy as np  # Add this import at the top
 
@@ -101,6 +105,22 @@ def build_scope_string(scopes: list[tuple[str, str]]) -> str:
     return "\n".join(lines)
 
 
+def _analyze_source(code: str) -> tuple[list[str], str, list[list[tuple[str, str]]]]:
+    """Parse the code once and return its lines, import header and per-line scopes."""
+    source_lines = code.split('\n')
+    tree = ast.parse(code)
+
+    # Collect imports
+    import_collector = ImportCollector(source_lines)
+    import_collector.visit(tree)
+    import_header = '\n'.join(import_collector.imports)
+
+    # Get scope information
+    tracker = ScopeTracker(source_lines)
+    tracker.visit(tree)
+    return source_lines, import_header, tracker.line_scopes
+
+
 def chunk_code_with_ast_scope(
     code: str,
     tokenizer,
@@ -114,18 +134,7 @@ def chunk_code_with_ast_scope(
     4. Chunk from top to bottom until we reach max_tokens, only breaking on line boundaries.
     5. For each chunk, prepend imports and scope metadata.
     """
-    source_lines = code.split('\n')
-    tree = ast.parse(code)
-    
-    # Collect imports
-    import_collector = ImportCollector(source_lines)
-    import_collector.visit(tree)
-    import_header = '\n'.join(import_collector.imports)
-    
-    # Get scope information
-    tracker = ScopeTracker(source_lines)
-    tracker.visit(tree)
-    line_scopes = tracker.line_scopes
+    source_lines, import_header, line_scopes = _analyze_source(code)
     
     # Debug: Print scopes for each line
     #for i, scopes in enumerate(line_scopes):
@@ -214,29 +223,198 @@ def chunk_code_with_ast_scope(
     return chunks
 
 
+def chunk_code_with_ast_scope_incremental(
+    code: str,
+    tokenizer,
+    max_tokens: int,
+    token_overlap: int = 0,
+) -> list[tuple[str, int]]:
+    """
+    Linear-time variant of `chunk_code_with_ast_scope` returning (chunk, n_tokens) pairs.
+
+    Every source line and every distinct scope header is tokenized once. A prefix sum
+    over the cached per-line counts gives a cheap estimate of where each chunk ends;
+    the estimate is then reconciled against the exact token count of the joined chunk
+    (galloping + binary search), so only a handful of chunk-sized encodes happen per
+    chunk instead of one per added line. Chunk boundaries match the reference
+    implementation as long as the token count of a chunk never decreases when a line
+    is appended, which holds for BPE tokenizers.
+    """
+    source_lines, import_header, line_scopes = _analyze_source(code)
+    n_lines = len(source_lines)
+
+    line_tokens = [len(tokenizer.encode(line)) for line in source_lines]
+    # estimate(k lines from s) = prefix[s + k] - prefix[s] + (k - 1) newlines, so
+    # offsets[i] = prefix[i] + i lets one bisect find the largest k within budget
+    prefix = list(accumulate(line_tokens, initial=0))
+    offsets = [total + i for i, total in enumerate(prefix)]
+
+    headers: dict[tuple[tuple[str, str], ...], tuple[str, int]] = {}
+
+    def get_header(scopes: list[tuple[str, str]]) -> tuple[str, int]:
+        key = tuple(scopes)
+        if key not in headers:
+            parts = [
+                part for part in (import_header, build_scope_string(scopes)) if part
+            ]
+            header = "\n".join(parts)
+            headers[key] = (header, len(tokenizer.encode(header)) if parts else 0)
+        return headers[key]
+
+    chunks: list[tuple[str, int]] = []
+    start_idx = 0
+    header = ""
+    # exact (text, n_tokens) of the current chunk candidate, keyed by its line count
+    exact: dict[int, tuple[str, int]] = {}
+
+    def measure(k: int) -> int:
+        if k not in exact:
+            text = "\n".join(source_lines[start_idx : start_idx + k])
+            if header:
+                text = header + "\n" + text
+            exact[k] = (text, len(tokenizer.encode(text)))
+        return exact[k][1]
+
+    while start_idx < n_lines:
+        header, header_tokens = (
+            get_header(line_scopes[start_idx]) if chunks else ("", 0)
+        )
+        remaining = n_lines - start_idx
+        exact.clear()
+
+        # Estimate the number of lines that fit, then find the first line count whose
+        # exact token count reaches the budget by galloping from the estimate.
+        budget = max_tokens - header_tokens - (1 if header else 0) + 1
+        target = budget + prefix[start_idx] + start_idx
+        estimate = bisect_right(offsets, target, start_idx + 1, n_lines + 1) - 1
+        estimate = min(max(estimate - start_idx, 1), remaining)
+
+        first_reaching: int | None
+        if measure(estimate) >= max_tokens:
+            lo, hi, step = estimate - 1, estimate, 1
+            while lo >= 1 and measure(lo) >= max_tokens:
+                hi = lo
+                step *= 2
+                lo = hi - step
+            lo = max(lo, 0)
+            first_reaching = hi
+        else:
+            lo, step = estimate, 1
+            first_reaching = None
+            while lo < remaining:
+                hi = min(lo + step, remaining)
+                if measure(hi) >= max_tokens:
+                    first_reaching = hi
+                    break
+                lo = hi
+                step *= 2
+        if first_reaching is not None:
+            hi = first_reaching
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if measure(mid) >= max_tokens:
+                    hi = mid
+                else:
+                    lo = mid
+            # Keep the line that reached the budget only if it is the sole line or
+            # lands exactly on it; otherwise the chunk ends just before it.
+            n_chunk_lines = hi if hi == 1 or measure(hi) <= max_tokens else hi - 1
+        else:
+            n_chunk_lines = remaining
+
+        measure(n_chunk_lines)
+        chunks.append(exact[n_chunk_lines])
+
+        idx = start_idx + n_chunk_lines
+        if idx >= n_lines:
+            break
+
+        overlap_lines = 0
+        if token_overlap > 0:
+            overlap_tokens = 0
+            for line_idx in range(idx - 1, start_idx - 1, -1):
+                overlap_tokens += line_tokens[line_idx]
+                if overlap_tokens > token_overlap:
+                    break
+                overlap_lines += 1
+
+        start_idx = max(idx - overlap_lines, start_idx + 1)  # Ensure we always advance
+
+    return chunks
+
+
+def _chunk_code_text(tokenizer: Tokenizer, text: str) -> list[tuple[str, int]]:
+    """Chunk a single code text; module level so worker processes can unpickle it."""
+    return chunk_code_with_ast_scope_incremental(
+        text,
+        tokenizer,
+        tokenizer.tokens_per_chunk,
+        tokenizer.chunk_overlap,
+    )
+
+
 def split_multiple_code_texts_on_tokens(
     texts: list[str],
     tokenizer: Tokenizer,
     tick: ProgressTicker,
+    num_workers: int = 1,
 ) -> list[TextChunk]:
     """Split multiple code texts and return chunks with metadata using the tokenizer.
-    Respects line boundaries when splitting."""
-    result = []
-    
-    for source_doc_idx, text in enumerate(texts):
-        chunks = chunk_code_with_ast_scope(
-            text, 
-            tokenizer, 
-            tokenizer.tokens_per_chunk,
-            tokenizer.chunk_overlap
-        )
-        for chunk in chunks:
-            result.append(TextChunk(
-                text_chunk=chunk,
-                source_doc_indices=[source_doc_idx],
-                n_tokens=len(tokenizer.encode(chunk))
-            ))
-        if tick:
-            tick(1)
-            
-    return result
\ No newline at end of file
+    Respects line boundaries when splitting.
+
+    With `num_workers` > 1 the files are parsed and chunked in a process pool; the
+    tokenizer functions must then be picklable. Chunks are returned in source-document
+    order and progress ticks once per document as its results are collected.
+    """
+    return split_code_text_groups([texts], [tokenizer], tick, num_workers)[0]
+
+
+def split_code_text_groups(
+    groups: list[list[str]],
+    tokenizers: list[Tokenizer],
+    tick: ProgressTicker | None,
+    num_workers: int = 1,
+) -> list[list[TextChunk]]:
+    """Split the code texts of several groups, each group with its own tokenizer.
+
+    With `num_workers` > 1 the files of every group are chunked in one process pool,
+    created once for all the groups. Returns the chunks of every group in group order,
+    with source-document indices relative to the group.
+    """
+    documents = [
+        (group_idx, source_doc_idx)
+        for group_idx, texts in enumerate(groups)
+        for source_doc_idx in range(len(texts))
+    ]
+    doc_tokenizers = [tokenizers[group_idx] for group_idx, _ in documents]
+    doc_texts = [groups[group_idx][doc_idx] for group_idx, doc_idx in documents]
+    result: list[list[TextChunk]] = [[] for _ in groups]
+
+    def collect(doc_chunks: Iterable[list[tuple[str, int]]]) -> None:
+        for (group_idx, source_doc_idx), chunks in zip(
+            documents, doc_chunks, strict=True
+        ):
+            result[group_idx].extend(
+                TextChunk(
+                    text_chunk=chunk,
+                    source_doc_indices=[source_doc_idx],
+                    n_tokens=n_tokens,
+                )
+                for chunk, n_tokens in chunks
+            )
+            if tick:
+                tick(1)
+
+    if num_workers > 1 and len(doc_texts) > 1:
+        chunksize = max(1, len(doc_texts) // (num_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=min(num_workers, len(doc_texts))
+        ) as executor:
+            collect(
+                executor.map(
+                    _chunk_code_text, doc_tokenizers, doc_texts, chunksize=chunksize
+                )
+            )
+    else:
+        collect(map(_chunk_code_text, doc_tokenizers, doc_texts))
+    return result
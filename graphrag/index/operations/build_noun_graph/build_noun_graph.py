@@ -3,19 +3,24 @@
 
 """Graph extraction using NLP."""
 
+import asyncio
 import math
+from collections.abc import Callable, Coroutine, Iterator, Sequence
+from itertools import islice
+from typing import Any, TypeVar
 
+import numpy as np
 import pandas as pd
 
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.config.enums import AsyncType
 from graphrag.index.operations.build_noun_graph.np_extractors.base import (
     BaseNounPhraseExtractor,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.index.utils.hashing import gen_sha512_hash
 
+T = TypeVar("T")
+
 
 async def build_noun_graph(
     text_unit_df: pd.DataFrame,
@@ -23,11 +28,18 @@ async def build_noun_graph(
     normalize_edge_weights: bool,
     num_threads: int = 4,
     cache: PipelineCache | None = None,
+    batch_size: int = 100,
+    num_processes: int = 1,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Build a noun graph from text units."""
     text_units = text_unit_df.loc[:, ["id", "text"]]
     nodes_df = await _extract_nodes(
-        text_units, text_analyzer, num_threads=num_threads, cache=cache
+        text_units,
+        text_analyzer,
+        num_threads=num_threads,
+        cache=cache,
+        batch_size=batch_size,
+        num_processes=num_processes,
     )
     edges_df = _extract_edges(nodes_df, normalize_edge_weights=normalize_edge_weights)
 
@@ -39,32 +51,50 @@ async def _extract_nodes(
     text_analyzer: BaseNounPhraseExtractor,
     num_threads: int = 4,
     cache: PipelineCache | None = None,
+    batch_size: int = 100,
+    num_processes: int = 1,
 ) -> pd.DataFrame:
     """
     Extract initial nodes and edges from text units.
 
+    The noun phrases of all text units are looked up in the cache first, with up to
+    `num_threads` concurrent requests, and only the cache misses go through the text
+    analyzer, in a single batched extraction. Its results are consumed and cached
+    `batch_size` at a time, so an interrupted run keeps what was already extracted.
+
     Input: text unit df with schema [id, text, document_id]
     Returns a dataframe with schema [id, title, frequency, text_unit_ids].
     """
     cache = cache or NoopPipelineCache()
     cache = cache.child("extract_noun_phrases")
 
-    async def extract(row):
-        text = row["text"]
-        attrs = {"text": text, "analyzer": str(text_analyzer)}
-        key = gen_sha512_hash(attrs, attrs.keys())
-        result = await cache.get(key)
-        if not result:
-            result = text_analyzer.extract(text)
-            await cache.set(key, result)
-        return result
-
-    text_unit_df["noun_phrases"] = await derive_from_rows(
-        text_unit_df,
-        extract,
-        num_threads=num_threads,
-        async_type=AsyncType.Threaded,
-    )
+    texts = text_unit_df["text"].tolist()
+    analyzer = str(text_analyzer)
+    keys = []
+    for text in texts:
+        attrs = {"text": text, "analyzer": analyzer}
+        keys.append(gen_sha512_hash(attrs, attrs.keys()))
+
+    noun_phrases = await _gather_batched(cache.get, keys, num_threads)
+    misses = [index for index, result in enumerate(noun_phrases) if not result]
+    if misses:
+        extracted = text_analyzer.extract_batch(
+            (texts[index] for index in misses),
+            batch_size=batch_size,
+            n_process=num_processes,
+        )
+        for start in range(0, len(misses), max(batch_size, 1)):
+            batch = misses[start : start + max(batch_size, 1)]
+            results = await asyncio.to_thread(_take, extracted, len(batch))
+            for index, result in zip(batch, results, strict=True):
+                noun_phrases[index] = result
+            await _gather_batched(
+                lambda index: cache.set(keys[index], noun_phrases[index]),
+                batch,
+                num_threads,
+            )
+
+    text_unit_df["noun_phrases"] = noun_phrases
 
     noun_node_df = text_unit_df.explode("noun_phrases")
     noun_node_df = noun_node_df.rename(
@@ -81,6 +111,28 @@ async def _extract_nodes(
     return grouped_node_df.loc[:, ["title", "frequency", "text_unit_ids"]]
 
 
+async def _gather_batched(
+    call: Callable[[T], Coroutine[Any, Any, Any]], items: Sequence[T], concurrency: int
+) -> list[Any]:
+    """Await call(item) for every item in order, `concurrency` of them at a time.
+
+    The coroutines of a batch are only created when the batch starts.
+    """
+    results = []
+    for start in range(0, len(items), max(concurrency, 1)):
+        results.extend(
+            await asyncio.gather(
+                *(call(item) for item in items[start : start + max(concurrency, 1)])
+            )
+        )
+    return results
+
+
+def _take(iterator: Iterator[T], n: int) -> list[T]:
+    """Return the next n items of an iterator."""
+    return list(islice(iterator, n))
+
+
 def _extract_edges(
     nodes_df: pd.DataFrame,
     normalize_edge_weights: bool = True,
@@ -92,46 +144,57 @@ def _extract_edges(
     Input: nodes_df with schema [id, title, frequency, text_unit_ids]
     Returns: edges_df with schema [source, target, weight, text_unit_ids]
     """
-    text_units_df = nodes_df.explode("text_unit_ids")
-    text_units_df = text_units_df.rename(columns={"text_unit_ids": "text_unit_id"})
-    text_units_df = (
-        text_units_df.groupby("text_unit_id").agg({"title": list}).reset_index()
-    )
-    text_units_df["edges"] = text_units_df["title"].apply(
-        lambda x: _create_relationships(x)
+    memberships = nodes_df.loc[:, ["title", "text_unit_ids"]].explode("text_unit_ids")
+    memberships = memberships[memberships["text_unit_ids"].notna()]
+
+    # integer-encode titles and text units, with codes in sorted order
+    title_codes, titles = pd.factorize(memberships["title"], sort=True)
+    unit_codes, text_unit_ids = pd.factorize(memberships["text_unit_ids"], sort=True)
+    titles = titles.to_numpy()
+    text_unit_ids = text_unit_ids.to_numpy()
+
+    # the noun phrases of each text unit, in title order
+    order = np.lexsort((title_codes, unit_codes))
+    title_codes = title_codes[order]
+    unit_codes = unit_codes[order]
+
+    # pair every noun phrase with each one after it in the same text unit
+    unit_starts = np.flatnonzero(np.diff(unit_codes, prepend=-1))
+    unit_sizes = np.diff(unit_starts, append=len(unit_codes))
+    pairs_per_phrase = (
+        np.repeat(unit_starts + unit_sizes, unit_sizes) - np.arange(len(unit_codes)) - 1
     )
-    edge_df = text_units_df.explode("edges").loc[:, ["edges", "text_unit_id"]]
-
-    edge_df["source"] = edge_df["edges"].apply(
-        lambda x: x[0] if isinstance(x, tuple) else None
-    )
-    edge_df["target"] = edge_df["edges"].apply(
-        lambda x: x[1] if isinstance(x, tuple) else None
+    left = np.repeat(np.arange(len(unit_codes)), pairs_per_phrase)
+    pair_offsets = np.arange(len(left)) - np.repeat(
+        np.cumsum(pairs_per_phrase) - pairs_per_phrase, pairs_per_phrase
     )
-    edge_df = edge_df[(edge_df.source.notna()) & (edge_df.target.notna())]
-    edge_df = edge_df.drop(columns=["edges"])
+    right = left + 1 + pair_offsets
+    if len(left) == 0:
+        return pd.DataFrame(columns=["source", "target", "weight", "text_unit_ids"])
 
     # make sure source is always smaller than target
-    edge_df["source"], edge_df["target"] = zip(
-        *edge_df.apply(
-            lambda x: (x["source"], x["target"])
-            if x["source"] < x["target"]
-            else (x["target"], x["source"]),
-            axis=1,
-        ),
-        strict=False,
-    )
-
-    # group by source and target, count the number of text units and collect their ids
-    grouped_edge_df = (
-        edge_df.groupby(["source", "target"]).agg({"text_unit_id": list}).reset_index()
-    )
-    grouped_edge_df = grouped_edge_df.rename(columns={"text_unit_id": "text_unit_ids"})
-    grouped_edge_df["weight"] = grouped_edge_df["text_unit_ids"].apply(len)
-
-    grouped_edge_df = grouped_edge_df.loc[
-        :, ["source", "target", "weight", "text_unit_ids"]
-    ]
+    source = np.minimum(title_codes[left], title_codes[right])
+    target = np.maximum(title_codes[left], title_codes[right])
+
+    # group by source and target; the stable sort keeps the text units of an edge in order
+    keys = source.astype(np.int64) * len(titles) + target
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    pair_units = unit_codes[left][order]
+    edge_starts = np.flatnonzero(np.diff(keys, prepend=-1))
+    edge_ends = np.append(edge_starts[1:], len(keys))
+    edge_keys = keys[edge_starts]
+    edge_text_unit_ids = text_unit_ids[pair_units].tolist()
+
+    grouped_edge_df = pd.DataFrame({
+        "source": titles[edge_keys // len(titles)],
+        "target": titles[edge_keys % len(titles)],
+        "weight": edge_ends - edge_starts,
+        "text_unit_ids": [
+            edge_text_unit_ids[start:end]
+            for start, end in zip(edge_starts.tolist(), edge_ends.tolist(), strict=True)
+        ],
+    })
 
     if normalize_edge_weights:
         # use PMI weight instead of raw weight
@@ -140,18 +203,6 @@ def _extract_edges(
     return grouped_edge_df
 
 
-def _create_relationships(
-    noun_phrases: list[str],
-) -> list[tuple[str, str]]:
-    """Create a (source, target) tuple pairwise for all noun phrases in a list."""
-    relationships = []
-    if len(noun_phrases) >= 2:
-        for i in range(len(noun_phrases) - 1):
-            for j in range(i + 1, len(noun_phrases)):
-                relationships.extend([(noun_phrases[i], noun_phrases[j])])
-    return relationships
-
-
 def _calculate_pmi_edge_weights(
     nodes_df: pd.DataFrame,
     edges_df: pd.DataFrame,
@@ -192,8 +243,9 @@ def _calculate_pmi_edge_weights(
         .drop(columns=[node_name_col])
         .rename(columns={"prop_occurrence": "target_prop"})
     )
-    edges_df[edge_weight_col] = edges_df.apply(
-        lambda x: math.log2(x["prop_weight"] / (x["source_prop"] * x["target_prop"])),
-        axis=1,
+    ratios = edges_df["prop_weight"] / (
+        edges_df["source_prop"] * edges_df["target_prop"]
     )
+    # math.log2 rather than np.log2, which can differ in the last bit
+    edges_df[edge_weight_col] = list(map(math.log2, ratios.tolist()))
     return edges_df.drop(columns=["prop_weight", "source_prop", "target_prop"])
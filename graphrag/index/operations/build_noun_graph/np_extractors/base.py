@@ -5,6 +5,8 @@
 
 import logging
 from abc import ABCMeta, abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 
 import spacy
 
@@ -39,6 +41,34 @@ class BaseNounPhraseExtractor(metaclass=ABCMeta):
         Returns: List of noun phrases.
         """
 
+    def extract_batch(
+        self, texts: Iterable[str], batch_size: int = 100, n_process: int = 1
+    ) -> Iterator[list[str]]:
+        """
+        Extract noun phrases from a stream of texts.
+
+        Runs `extract` on every text, in a pool of `n_process` processes that receive
+        the texts in chunks of `batch_size` when `n_process` is more than 1.
+
+        Args:
+            texts: Texts.
+            batch_size: Number of texts processed per batch.
+            n_process: Number of processes.
+
+        Yields: The noun phrases of every text, in the order of the texts, as soon as
+        they are extracted.
+        """
+        if n_process <= 1:
+            for text in texts:
+                yield self.extract(text)
+            return
+        executor = ProcessPoolExecutor(max_workers=n_process)
+        try:
+            yield from executor.map(self.extract, texts, chunksize=batch_size)
+        finally:
+            # a consumer that stops early does not wait for the remaining texts
+            executor.shutdown(cancel_futures=True)
+
     @abstractmethod
     def __str__(self) -> str:
         """Return string representation of the extractor, used for cache key generation."""
@@ -3,6 +3,7 @@
 
 """CFG-based noun phrase extractor."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from spacy.tokens.doc import Doc
@@ -80,8 +81,27 @@ class CFGNounPhraseExtractor(BaseNounPhraseExtractor):
 
         Returns: List of noun phrases.
         """
-        doc = self.nlp(text)
+        return self._extract_from_doc(self.nlp(text))
 
+    def extract_batch(
+        self, texts: Iterable[str], batch_size: int = 100, n_process: int = 1
+    ) -> Iterator[list[str]]:
+        """
+        Extract noun phrases from a stream of texts, parsed in batches by SpaCy's `nlp.pipe`.
+
+        Args:
+            texts: Texts.
+            batch_size: Number of texts parsed per batch.
+            n_process: Number of processes.
+
+        Yields: The noun phrases of every text, in the order of the texts, as soon as
+        they are extracted.
+        """
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._extract_from_doc(doc)
+
+    def _extract_from_doc(self, doc: Doc) -> list[str]:
+        """Extract the noun phrases of a parsed text."""
         filtered_noun_phrases = set()
         if self.include_named_entities:
             # extract noun chunks + entities then filter overlapping spans
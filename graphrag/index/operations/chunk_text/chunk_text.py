@@ -3,18 +3,28 @@
 
 """A module containing _get_num_total, chunk, run_strategy and load_strategy methods definitions."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Any, cast
 
 import pandas as pd
+import tiktoken
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.chunking_config import ChunkingConfig, ChunkStrategyType
 from graphrag.index.operations.chunk_text.typing import (
     ChunkInput,
     ChunkStrategy,
+    TextChunk,
+)
+from graphrag.index.text_splitting.text_splitting import (
+    Tokenizer,
+    split_encoded_texts_on_tokens,
 )
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
+_TEXTS_PER_BATCH = 256
+
 
 def chunk_text(
     input: pd.DataFrame,
@@ -24,6 +34,7 @@ def chunk_text(
     encoding_model: str,
     strategy: ChunkStrategyType,
     callbacks: WorkflowCallbacks,
+    num_workers: int = 1,
 ) -> pd.Series:
     """
     Chunk a piece of text into smaller pieces.
@@ -53,6 +64,16 @@ def chunk_text(
     ```yaml
     strategy: sentence
     ```
+
+    ### code
+    This strategy chunks python source on line boundaries, prepending imports and enclosing scopes. The strategy config is as follows:
+
+    ```yaml
+    strategy: code
+    size: 1200 # Optional, The chunk size to use, default: 1200
+    overlap: 100 # Optional, The chunk overlap to use, default: 100
+    num_workers: 1 # Optional, The number of worker processes chunking files in parallel, default: 1
+    ```
     """
     strategy_exec = load_strategy(strategy)
 
@@ -60,7 +81,12 @@ def chunk_text(
     tick = progress_ticker(callbacks.progress, num_total)
 
     # collapse the config back to a single object to support "polymorphic" function call
-    config = ChunkingConfig(size=size, overlap=overlap, encoding_model=encoding_model)
+    config = ChunkingConfig(
+        size=size,
+        overlap=overlap,
+        encoding_model=encoding_model,
+        num_workers=num_workers,
+    )
 
     return cast(
         "pd.Series",
@@ -111,6 +137,115 @@ def run_strategy(
     return results
 
 
+def chunk_text_groups(
+    groups: list[list[str]],
+    sizes: list[int],
+    overlap: int,
+    encoding_model: str,
+    callbacks: WorkflowCallbacks,
+    num_workers: int = 1,
+) -> list[list[TextChunk]]:
+    """
+    Chunk groups of texts on tokens, each group with its own chunk size.
+
+    The texts of a group are chunked together, as the tokens strategy chunks the texts
+    of a row. Groups are chunked in batches of about `_TEXTS_PER_BATCH` texts, each
+    encoded with a single `encode_batch` call. With `num_workers` > 1 the batches are
+    spread over a process pool, where every process resolves the encoding once.
+    Returns the chunks of every group, in group order.
+    """
+    tick = progress_ticker(callbacks.progress, sum(len(texts) for texts in groups))
+    batches: list[list[tuple[list[str], int]]] = [[]]
+    batch_texts = 0
+    for texts, size in zip(groups, sizes, strict=True):
+        if batch_texts >= _TEXTS_PER_BATCH:
+            batches.append([])
+            batch_texts = 0
+        batches[-1].append((texts, size))
+        batch_texts += len(texts)
+
+    chunk_batch = partial(_chunk_group_batch, encoding_model, overlap)
+    results: list[list[TextChunk]] = []
+    if num_workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(num_workers, len(batches))
+        ) as executor:
+            for batch, chunks in zip(
+                batches, executor.map(chunk_batch, batches), strict=True
+            ):
+                results.extend(chunks)
+                tick(sum(len(texts) for texts, _ in batch))
+    else:
+        for batch in batches:
+            results.extend(chunk_batch(batch))
+            tick(sum(len(texts) for texts, _ in batch))
+    tick.done()
+    return results
+
+
+def chunk_code_groups(
+    groups: list[list[str]],
+    sizes: list[int],
+    overlap: int,
+    encoding_model: str,
+    callbacks: WorkflowCallbacks,
+    num_workers: int = 1,
+) -> list[list[TextChunk]]:
+    """
+    Chunk groups of code texts on tokens, each group with its own chunk size.
+
+    The files of every group are chunked as the code strategy chunks the texts of a
+    row. With `num_workers` > 1 they all go through a single process pool, so the
+    workers are started once instead of once per group. Returns the chunks of every
+    group, in group order.
+    """
+    from graphrag.index.code_splitting.code_splitting import split_code_text_groups
+    from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+
+    encode, decode = get_encoding_fn(encoding_model)
+    tokenizers = {
+        size: Tokenizer(
+            chunk_overlap=overlap,
+            tokens_per_chunk=size,
+            encode=encode,
+            decode=decode,
+        )
+        for size in set(sizes)
+    }
+    tick = progress_ticker(callbacks.progress, sum(len(texts) for texts in groups))
+    results = split_code_text_groups(
+        groups, [tokenizers[size] for size in sizes], tick, num_workers
+    )
+    tick.done()
+    return results
+
+
+def _chunk_group_batch(
+    encoding_model: str, overlap: int, batch: list[tuple[list[str], int]]
+) -> list[list[TextChunk]]:
+    """Chunk a batch of groups of texts, encoding all of their texts at once."""
+    encoding = tiktoken.get_encoding(encoding_model)
+    encoded = iter(
+        encoding.encode_batch([
+            text if isinstance(text, str) else f"{text}"
+            for texts, _ in batch
+            for text in texts
+        ])
+    )
+    return [
+        split_encoded_texts_on_tokens(
+            [next(encoded) for _ in texts],
+            Tokenizer(
+                chunk_overlap=overlap,
+                tokens_per_chunk=size,
+                encode=encoding.encode,
+                decode=encoding.decode,
+            ),
+        )
+        for texts, size in batch
+    ]
+
+
 def load_strategy(strategy: ChunkStrategyType) -> ChunkStrategy:
     """Load strategy method definition."""
     match strategy:
@@ -4,6 +4,7 @@
 """A module containing chunk strategies."""
 
 from collections.abc import Iterable
+from functools import partial
 
 import nltk
 import tiktoken
@@ -20,19 +21,19 @@ from graphrag.index.code_splitting.code_splitting import (
 from graphrag.logger.progress import ProgressTicker
 
 
-def get_encoding_fn(encoding_name):
-    """Get the encoding model."""
-    enc = tiktoken.get_encoding(encoding_name)
+def _encode(enc: tiktoken.Encoding, text: str) -> list[int]:
+    if not isinstance(text, str):
+        text = f"{text}"
+    return enc.encode(text)
 
-    def encode(text: str) -> list[int]:
-        if not isinstance(text, str):
-            text = f"{text}"
-        return enc.encode(text)
 
-    def decode(tokens: list[int]) -> str:
-        return enc.decode(tokens)
+def get_encoding_fn(encoding_name):
+    """Get the encoding model.
 
-    return encode, decode
+    The returned functions are picklable so they can be shipped to worker processes.
+    """
+    enc = tiktoken.get_encoding(encoding_name)
+    return partial(_encode, enc), enc.decode
 
 
 def run_tokens(
@@ -78,6 +79,7 @@ def run_tokens_code(
             decode=decode,
         ),
         tick,
+        num_workers=config.num_workers,
     )
 
 
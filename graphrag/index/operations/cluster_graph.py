@@ -7,7 +7,11 @@ import logging
 
 import networkx as nx
 
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.index.utils.stable_lcc import (
+    stable_largest_connected_component,
+    stable_largest_connected_component_csr,
+)
 
 Communities = list[tuple[int, int, int, list[str]]]
 
@@ -16,7 +20,7 @@ log = logging.getLogger(__name__)
 
 
 def cluster_graph(
-    graph: nx.Graph,
+    graph: nx.Graph | CSRGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
@@ -54,7 +58,7 @@ def cluster_graph(
 
 # Taken from graph_intelligence & adapted
 def _compute_leiden_communities(
-    graph: nx.Graph | nx.DiGraph,
+    graph: nx.Graph | nx.DiGraph | CSRGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
@@ -63,11 +67,20 @@ def _compute_leiden_communities(
     # NOTE: This import is done here to reduce the initial import time of the graphrag package
     from graspologic.partition import hierarchical_leiden
 
-    if use_lcc:
-        graph = stable_largest_connected_component(graph)
+    leiden_input: nx.Graph | list[tuple[str, str, float]]
+    if isinstance(graph, CSRGraph):
+        if use_lcc:
+            graph = stable_largest_connected_component_csr(graph)
+        # an edge list in networkx iteration order clusters exactly like the graph,
+        # except that graspologic drops self loops from edge lists
+        leiden_input = (
+            graph.to_networkx() if graph.has_self_loops() else graph.edge_list()
+        )
+    else:
+        leiden_input = stable_largest_connected_component(graph) if use_lcc else graph
 
     community_mapping = hierarchical_leiden(
-        graph, max_cluster_size=max_cluster_size, random_seed=seed
+        leiden_input, max_cluster_size=max_cluster_size, random_seed=seed
     )
     results: dict[int, dict[str, int]] = {}
     hierarchy: dict[int, int] = {}
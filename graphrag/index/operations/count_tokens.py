@@ -0,0 +1,21 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing count_tokens definition."""
+
+import pandas as pd
+import tiktoken
+
+
+def count_tokens(texts: pd.Series, token_encoder: tiktoken.Encoding) -> pd.Series:
+    """Return the number of tokens of every text, 0 for missing texts."""
+    present = texts.notna()
+    counts = pd.Series(0, index=texts.index, dtype="int64")
+    values = texts[present].astype(str).tolist()
+    if values:
+        # text is counted as plain text, special tokens included
+        counts[present] = [
+            len(tokens)
+            for tokens in token_encoder.encode_batch(values, disallowed_special=())
+        ]
+    return counts
@@ -3,11 +3,11 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
 from enum import Enum
 from typing import Any
 
-import numpy as np
 import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
@@ -23,6 +23,9 @@ log = logging.getLogger(__name__)
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
 
+# Number of embedded batches allowed to wait for the vector store while the next ones embed
+MAX_PENDING_WRITES = 2
+
 
 class TextEmbedStrategyType(str, Enum):
     """TextEmbedStrategyType class definition."""
@@ -163,48 +166,63 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {input.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in input[embed_column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
-
-    i = 0
-    starting_index = 0
-
     all_results = []
+    # Embedding of a batch overlaps with the vector store write of the previous ones.
+    # Writes run in order on a worker thread; the bounded queue applies backpressure.
+    pending: asyncio.Queue[list[VectorStoreDocument] | None] = asyncio.Queue(
+        maxsize=MAX_PENDING_WRITES
+    )
 
-    while insert_batch_size * i < input.shape[0]:
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
-        texts: list[str] = batch[embed_column].to_numpy().tolist()
-        titles: list[str] = batch[title].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(texts, callbacks, cache, strategy_config)
-        if result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
-
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for doc_id, doc_text, doc_title, doc_vector in zip(
-            ids, texts, titles, vectors, strict=True
-        ):
-            if type(doc_vector) is np.ndarray:
-                doc_vector = doc_vector.tolist()
-            document = VectorStoreDocument(
-                id=doc_id,
-                text=doc_text,
-                vector=doc_vector,
-                attributes={"title": doc_title},
+    async def write_batches() -> None:
+        first = True
+        while (documents := await pending.get()) is not None:
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and first
             )
-            documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+            first = False
+
+    writer = asyncio.create_task(write_batches())
+
+    async def enqueue(documents: list[VectorStoreDocument] | None) -> None:
+        put = asyncio.create_task(pending.put(documents))
+        await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            # the writer died while the queue was full, surface its error
+            put.cancel()
+            writer.result()
+
+    try:
+        for start in range(0, input.shape[0], insert_batch_size):
+            batch = input.iloc[start : start + insert_batch_size]
+            texts: list[str] = batch[embed_column].to_numpy().tolist()
+            titles: list[str] = batch[title].to_numpy().tolist()
+            ids: list[str] = batch[id_column].to_numpy().tolist()
+            result = await strategy_exec(texts, callbacks, cache, strategy_config)
+            if result.embeddings:
+                embeddings = [
+                    embedding
+                    for embedding in result.embeddings
+                    if embedding is not None
+                ]
+                all_results.extend(embeddings)
+
+            vectors = result.embeddings or []
+            documents = [
+                VectorStoreDocument(
+                    id=doc_id,
+                    text=doc_text,
+                    vector=doc_vector,
+                    attributes={"title": doc_title},
+                )
+                for doc_id, doc_text, doc_title, doc_vector in zip(
+                    ids, texts, titles, vectors, strict=True
+                )
+            ]
+            await enqueue(documents)
+        await enqueue(None)
+        await writer
+    finally:
+        writer.cancel()
 
     return all_results
 
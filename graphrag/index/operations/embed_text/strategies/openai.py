@@ -9,6 +9,7 @@ from typing import Any
 
 import numpy as np
 
+from graphrag.cache.embedding_cache import EmbeddingCache
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
@@ -48,16 +49,28 @@ async def run(
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
+
+    # Resolve previously embedded snippets in bulk, only the misses are batched
+    embedding_cache = EmbeddingCache.for_model(cache, llm_config.model)
+    snippet_embeddings = await embedding_cache.lookup(texts)
+    missing = list(
+        dict.fromkeys(
+            text
+            for text, embedding in zip(texts, snippet_embeddings, strict=True)
+            if embedding is None
+        )
+    )
     text_batches = _create_text_batches(
-        texts,
+        missing,
         batch_size,
         batch_max_tokens,
         splitter,
     )
     log.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
+        "embedding %d inputs via %d snippets (%d cached) using %d batches. max_batch_size=%d, max_tokens=%d",
         len(input),
         len(texts),
+        sum(embedding is not None for embedding in snippet_embeddings),
         len(text_batches),
         batch_size,
         batch_max_tokens,
@@ -65,8 +78,16 @@ async def run(
     ticker = progress_ticker(callbacks.progress, len(text_batches))
 
     # Embed each chunk of snippets
-    embeddings = await _execute(model, text_batches, ticker, semaphore)
-    embeddings = _reconstitute_embeddings(embeddings, input_sizes)
+    new_embeddings = await _execute(model, text_batches, ticker, semaphore)
+    await embedding_cache.add(missing, new_embeddings)
+    embedded = dict(zip(missing, new_embeddings, strict=True))
+    embeddings = _reconstitute_embeddings(
+        [
+            embedded[text] if embedding is None else embedding
+            for text, embedding in zip(texts, snippet_embeddings, strict=True)
+        ],
+        input_sizes,
+    )
 
     return TextEmbeddingResult(embeddings=embeddings)
 
@@ -85,17 +106,17 @@ async def _execute(
     chunks: list[list[str]],
     tick: ProgressTicker,
     semaphore: asyncio.Semaphore,
-) -> list[list[float]]:
+) -> list[np.ndarray]:
     async def embed(chunk: list[str]):
         async with semaphore:
             chunk_embeddings = await model.aembed_batch(chunk)
-            result = np.array(chunk_embeddings)
+            result = np.asarray(chunk_embeddings, dtype=np.float32)
             tick(1)
         return result
 
     futures = [embed(chunk) for chunk in chunks]
     results = await asyncio.gather(*futures)
-    # merge results in a single list of lists (reduce the collect dimension)
+    # merge results in a single list of row views (reduce the collect dimension)
     return [item for sublist in results for item in sublist]
 
 
@@ -151,10 +172,10 @@ def _prepare_embed_texts(
 
 
 def _reconstitute_embeddings(
-    raw_embeddings: list[list[float]], sizes: list[int]
-) -> list[list[float] | None]:
-    """Reconstitute the embeddings into the original input texts."""
-    embeddings: list[list[float] | None] = []
+    raw_embeddings: list[np.ndarray], sizes: list[int]
+) -> list[np.ndarray | None]:
+    """Reconstitute the embeddings into the original input texts as float32 vectors."""
+    embeddings: list[np.ndarray | None] = []
     cursor = 0
     for size in sizes:
         if size == 0:
@@ -167,6 +188,6 @@ def _reconstitute_embeddings(
             chunk = raw_embeddings[cursor : cursor + size]
             average = np.average(chunk, axis=0)
             normalized = average / np.linalg.norm(average)
-            embeddings.append(normalized.tolist())
+            embeddings.append(normalized.astype(np.float32))
             cursor += size
     return embeddings
@@ -6,6 +6,8 @@
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
+import numpy as np
+
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 
@@ -14,7 +16,8 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 class TextEmbeddingResult:
     """Text embedding result class definition."""
 
-    embeddings: list[list[float] | None] | None
+    embeddings: list[np.ndarray | list[float] | None] | None
+    """One vector per input text; strategies return contiguous float32 arrays where possible"""
 
 
 TextEmbeddingStrategy = Callable[
@@ -22,6 +22,8 @@ log = logging.getLogger(__name__)
 
 
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
+ENTITY_COLUMNS = ["title", "type", "description", "source_id"]
+RELATIONSHIP_COLUMNS = ["source", "target", "description", "source_id", "weight"]
 
 
 async def extract_graph(
@@ -98,6 +100,9 @@ async def extract_graph(
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
         strategy_config["llm"]["max_retries"] = len(text_units)
 
+    # only the entity and relationship rows are merged below, skip the per-row graphs
+    strategy_config.setdefault("build_graph", False)
+
     num_started = 0
 
     async def run_strategy(row):
@@ -112,7 +117,7 @@ async def extract_graph(
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.relationships, result.graph]
+        return [result.entities, result.relationships]
 
     results = await derive_from_rows(
         text_units,
@@ -122,15 +127,10 @@ async def extract_graph(
         num_threads=num_threads,
     )
 
-    entity_dfs = []
-    relationship_dfs = []
-    for result in results:
-        if result:
-            entity_dfs.append(pd.DataFrame(result[0]))
-            relationship_dfs.append(pd.DataFrame(result[1]))
-
-    entities = _merge_entities(entity_dfs)
-    relationships = _merge_relationships(relationship_dfs)
+    entities = _merge_entities(_collect_columns(results, 0, ENTITY_COLUMNS))
+    relationships = _merge_relationships(
+        _collect_columns(results, 1, RELATIONSHIP_COLUMNS)
+    )
 
     return (entities, relationships)
 
@@ -150,27 +150,64 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
-def _merge_entities(entity_dfs) -> pd.DataFrame:
-    all_entities = pd.concat(entity_dfs, ignore_index=True)
-    return (
-        all_entities.groupby(["title", "type"], sort=False)
-        .agg(
-            description=("description", list),
-            text_unit_ids=("source_id", list),
-            frequency=("source_id", "count"),
-        )
-        .reset_index()
+def _collect_columns(
+    results: list, index: int, columns: list[str]
+) -> dict[str, list[Any]]:
+    """Append the records of every strategy result to one buffer per column."""
+    buffers: dict[str, list[Any]] = {column: [] for column in columns}
+    for result in results:
+        if not result:
+            continue
+        records = result[index]
+        if isinstance(records, pd.DataFrame):
+            for column, buffer in buffers.items():
+                buffer.extend(records[column].tolist())
+        else:
+            for column, buffer in buffers.items():
+                buffer.extend(record.get(column) for record in records)
+    return buffers
+
+
+def _merge_entities(entity_columns: dict[str, list[Any]]) -> pd.DataFrame:
+    all_entities = pd.DataFrame(entity_columns)
+    grouped = all_entities.groupby(["title", "type"], sort=False)
+    entities = grouped.agg(frequency=("source_id", "count")).reset_index()
+    codes = grouped.ngroup().tolist()
+    entities["description"] = _group_lists(
+        codes, entity_columns["description"], len(entities)
+    )
+    entities["text_unit_ids"] = _group_lists(
+        codes, entity_columns["source_id"], len(entities)
     )
+    return entities.loc[
+        :, ["title", "type", "description", "text_unit_ids", "frequency"]
+    ]
+
+
+def _merge_relationships(relationship_columns: dict[str, list[Any]]) -> pd.DataFrame:
+    all_relationships = pd.DataFrame(relationship_columns)
+    grouped = all_relationships.groupby(["source", "target"], sort=False)
+    relationships = grouped.agg(weight=("weight", "sum")).reset_index()
+    codes = grouped.ngroup().tolist()
+    relationships["description"] = _group_lists(
+        codes, relationship_columns["description"], len(relationships)
+    )
+    relationships["text_unit_ids"] = _group_lists(
+        codes, relationship_columns["source_id"], len(relationships)
+    )
+    return relationships.loc[
+        :, ["source", "target", "description", "text_unit_ids", "weight"]
+    ]
 
 
-def _merge_relationships(relationship_dfs) -> pd.DataFrame:
-    all_relationships = pd.concat(relationship_dfs, ignore_index=False)
-    return (
-        all_relationships.groupby(["source", "target"], sort=False)
-        .agg(
-            description=("description", list),
-            text_unit_ids=("source_id", list),
-            weight=("weight", "sum"),
-        )
-        .reset_index()
-    )
+def _group_lists(codes: list[int], values: list[Any], num_groups: int) -> list[list]:
+    """Collect values into one list per group code, in row order.
+
+    Equivalent to aggregating a column with `list`, without calling back into Python
+    once per group. Rows with a null group key have code -1 and are dropped.
+    """
+    groups: list[list] = [[] for _ in range(num_groups)]
+    for code, value in zip(codes, values, strict=True):
+        if code >= 0:
+            groups[code].append(value)
+    return groups
@@ -4,18 +4,16 @@
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
 import logging
-import re
 import traceback
-from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import networkx as nx
 import tiktoken
 
 from graphrag.config.defaults import ENCODING_MODEL, graphrag_config_defaults
+from graphrag.index.operations.extract_graph.graph_records import ExtractedGraph
 from graphrag.index.typing.error_handler import ErrorHandlerFn
-from graphrag.index.utils.string import clean_str
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.prompts.index.extract_graph import (
     CONTINUE_PROMPT,
@@ -35,8 +33,10 @@ log = logging.getLogger(__name__)
 class GraphExtractionResult:
     """Unipartite graph extraction result class definition."""
 
-    output: nx.Graph
+    output: nx.Graph | None
     source_docs: dict[Any, Any]
+    entities: list[dict[str, Any]] = field(default_factory=list)
+    relationships: list[dict[str, Any]] = field(default_factory=list)
 
 
 class GraphExtractor:
@@ -56,6 +56,7 @@ class GraphExtractor:
     _loop_args: dict[str, Any]
     _max_gleanings: int
     _on_error: ErrorHandlerFn
+    _build_graph: bool
 
     def __init__(
         self,
@@ -70,11 +71,17 @@ class GraphExtractor:
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
         on_error: ErrorHandlerFn | None = None,
+        build_graph: bool = True,
     ):
-        """Init method definition."""
+        """Init method definition.
+
+        With `build_graph` off, results carry the extracted entity and relationship rows
+        only and no networkx graph is built.
+        """
         # TODO: streamline construction
         self._model = model_invoker
         self._join_descriptions = join_descriptions
+        self._build_graph = build_graph
         self._input_text_key = input_text_key or "input_text"
         self._tuple_delimiter_key = tuple_delimiter_key or "tuple_delimiter"
         self._record_delimiter_key = record_delimiter_key or "record_delimiter"
@@ -138,15 +145,22 @@ class GraphExtractor:
                     },
                 )
 
-        output = await self._process_results(
+        parsed = self._process_results(
             all_records,
             prompt_variables.get(self._tuple_delimiter_key, DEFAULT_TUPLE_DELIMITER),
             prompt_variables.get(self._record_delimiter_key, DEFAULT_RECORD_DELIMITER),
         )
 
+        if self._build_graph:
+            return GraphExtractionResult(
+                output=parsed.to_networkx(),
+                source_docs=source_doc_map,
+            )
         return GraphExtractionResult(
-            output=output,
+            output=None,
             source_docs=source_doc_map,
+            entities=parsed.entities(),
+            relationships=parsed.relationships(),
         )
 
     async def _process_document(
@@ -185,125 +199,24 @@ class GraphExtractor:
 
         return results
 
-    async def _process_results(
+    def _process_results(
         self,
         results: dict[int, str],
         tuple_delimiter: str,
         record_delimiter: str,
-    ) -> nx.Graph:
-        """Parse the result string to create an undirected unipartite graph.
+    ) -> ExtractedGraph:
+        """Parse the result strings into the entities and relationships of a unipartite graph.
 
         Args:
             - results - dict of results from the extraction chain
             - tuple_delimiter - delimiter between tuples in an output record, default is '<|>'
             - record_delimiter - delimiter between records, default is '##'
         Returns:
-            - output - unipartite graph in graphML format
+            - output - the parsed graph, as rows or a networkx graph
         """
-        graph = nx.Graph()
+        parsed = ExtractedGraph(
+            tuple_delimiter, record_delimiter, join_descriptions=self._join_descriptions
+        )
         for source_doc_id, extracted_data in results.items():
-            records = [r.strip() for r in extracted_data.split(record_delimiter)]
-
-            for record in records:
-                record = re.sub(r"^\(|\)$", "", record.strip())
-                record_attributes = record.split(tuple_delimiter)
-
-                if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
-                    # add this record as a node in the G
-                    entity_name = clean_str(record_attributes[1].upper())
-                    entity_type = clean_str(record_attributes[2].upper())
-                    entity_description = clean_str(record_attributes[3])
-
-                    if entity_name in graph.nodes():
-                        node = graph.nodes[entity_name]
-                        if self._join_descriptions:
-                            node["description"] = "\n".join(
-                                list({
-                                    *_unpack_descriptions(node),
-                                    entity_description,
-                                })
-                            )
-                        else:
-                            if len(entity_description) > len(node["description"]):
-                                node["description"] = entity_description
-                        node["source_id"] = ", ".join(
-                            list({
-                                *_unpack_source_ids(node),
-                                str(source_doc_id),
-                            })
-                        )
-                        node["type"] = (
-                            entity_type if entity_type != "" else node["type"]
-                        )
-                    else:
-                        graph.add_node(
-                            entity_name,
-                            type=entity_type,
-                            description=entity_description,
-                            source_id=str(source_doc_id),
-                        )
-
-                if (
-                    record_attributes[0] == '"relationship"'
-                    and len(record_attributes) >= 5
-                ):
-                    # add this record as edge
-                    source = clean_str(record_attributes[1].upper())
-                    target = clean_str(record_attributes[2].upper())
-                    edge_description = clean_str(record_attributes[3])
-                    edge_source_id = clean_str(str(source_doc_id))
-                    try:
-                        weight = float(record_attributes[-1])
-                    except ValueError:
-                        weight = 1.0
-
-                    if source not in graph.nodes():
-                        graph.add_node(
-                            source,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if target not in graph.nodes():
-                        graph.add_node(
-                            target,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if graph.has_edge(source, target):
-                        edge_data = graph.get_edge_data(source, target)
-                        if edge_data is not None:
-                            weight += edge_data["weight"]
-                            if self._join_descriptions:
-                                edge_description = "\n".join(
-                                    list({
-                                        *_unpack_descriptions(edge_data),
-                                        edge_description,
-                                    })
-                                )
-                            edge_source_id = ", ".join(
-                                list({
-                                    *_unpack_source_ids(edge_data),
-                                    str(source_doc_id),
-                                })
-                            )
-                    graph.add_edge(
-                        source,
-                        target,
-                        weight=weight,
-                        description=edge_description,
-                        source_id=edge_source_id,
-                    )
-
-        return graph
-
-
-def _unpack_descriptions(data: Mapping) -> list[str]:
-    value = data.get("description", None)
-    return [] if value is None else value.split("\n")
-
-
-def _unpack_source_ids(data: Mapping) -> list[str]:
-    value = data.get("source_id", None)
-    return [] if value is None else value.split(", ")
+            parsed.add_output(str(source_doc_id), extracted_data)
+        return parsed
@@ -3,13 +3,12 @@
 
 """A module containing run_graph_intelligence,  run_extract_graph and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
-
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.operations.extract_graph.graph_extractor import GraphExtractor
+from graphrag.index.operations.extract_graph.graph_records import graph_from_rows
 from graphrag.index.operations.extract_graph.typing import (
     Document,
     EntityExtractionResult,
@@ -58,6 +57,8 @@ async def run_extract_graph(
         "max_gleanings", graphrag_config_defaults.extract_graph.max_gleanings
     )
 
+    build_graph = args.get("build_graph", True)
+
     extractor = GraphExtractor(
         model_invoker=model,
         prompt=extraction_prompt,
@@ -66,6 +67,7 @@ async def run_extract_graph(
         on_error=lambda e, s, d: (
             callbacks.error("Entity Extraction Error", e, s, d) if callbacks else None
         ),
+        build_graph=False,
     )
     text_list = [doc.text.strip() for doc in docs]
 
@@ -79,26 +81,16 @@ async def run_extract_graph(
         },
     )
 
-    graph = results.output
     # Map the "source_id" back to the "id" field
-    for _, node in graph.nodes(data=True):  # type: ignore
-        if node is not None:
-            node["source_id"] = ",".join(
-                docs[int(id)].id for id in node["source_id"].split(",")
-            )
-
-    for _, _, edge in graph.edges(data=True):  # type: ignore
-        if edge is not None:
-            edge["source_id"] = ",".join(
-                docs[int(id)].id for id in edge["source_id"].split(",")
-            )
-
-    entities = [
-        ({"title": item[0], **(item[1] or {})})
-        for item in graph.nodes(data=True)
-        if item is not None
-    ]
-
-    relationships = nx.to_pandas_edgelist(graph)
+    for row in [*results.entities, *results.relationships]:
+        row["source_id"] = ",".join(
+            docs[int(id)].id for id in row["source_id"].split(",")
+        )
+
+    graph = (
+        graph_from_rows(results.entities, results.relationships)
+        if build_graph
+        else None
+    )
 
-    return EntityExtractionResult(entities, relationships, graph)
+    return EntityExtractionResult(results.entities, results.relationships, graph)
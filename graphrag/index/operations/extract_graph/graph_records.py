@@ -0,0 +1,195 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the single-pass parser of graph extraction output."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import networkx as nx
+
+from graphrag.index.utils.string import clean_str
+
+
+@dataclass(slots=True)
+class _Node:
+    type: str
+    # ordered sets, joined once when the rows are emitted
+    descriptions: dict[str, None]
+    source_ids: dict[str, None]
+
+
+@dataclass(slots=True)
+class _Edge:
+    weight: float
+    descriptions: dict[str, None]
+    source_ids: dict[str, None]
+
+
+class ExtractedGraph:
+    """Entities and relationships parsed from graph extraction output.
+
+    Records are merged as they are parsed: descriptions and source ids of repeated
+    entities and relationships are collected in ordered sets and only joined when rows are
+    emitted, so merging costs the same for the first and the thousandth mention. Rows come
+    out in the order, orientation and shape of the nodes and edges of the networkx graph
+    the extractor used to build.
+    """
+
+    def __init__(
+        self,
+        tuple_delimiter: str,
+        record_delimiter: str,
+        join_descriptions: bool = True,
+    ):
+        self._tuple_delimiter = tuple_delimiter
+        self._record_delimiter = record_delimiter
+        self._join_descriptions = join_descriptions
+        self._nodes: dict[str, _Node] = {}
+        self._edges: dict[tuple[str, str], _Edge] = {}
+        # edge keys per node, in the order the edges were added
+        self._adjacency: dict[str, list[tuple[str, str]]] = {}
+
+    def add_output(self, source_id: str, extracted_data: str) -> None:
+        """Parse the extraction output of one source document."""
+        for record in extracted_data.split(self._record_delimiter):
+            record = record.strip()
+            if record.startswith("("):
+                record = record[1:]
+            if record.endswith(")"):
+                record = record[:-1]
+            record_attributes = record.split(self._tuple_delimiter)
+
+            if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
+                self._add_entity(
+                    clean_str(record_attributes[1].upper()),
+                    clean_str(record_attributes[2].upper()),
+                    clean_str(record_attributes[3]),
+                    source_id,
+                )
+            elif (
+                record_attributes[0] == '"relationship"' and len(record_attributes) >= 5
+            ):
+                try:
+                    weight = float(record_attributes[-1])
+                except ValueError:
+                    weight = 1.0
+                self._add_relationship(
+                    clean_str(record_attributes[1].upper()),
+                    clean_str(record_attributes[2].upper()),
+                    clean_str(record_attributes[3]),
+                    weight,
+                    source_id,
+                )
+
+    def entities(self) -> list[dict[str, Any]]:
+        """Return one row per entity, with its title, type, description and source ids."""
+        return [
+            {
+                "title": title,
+                "type": node.type,
+                "description": "\n".join(node.descriptions),
+                "source_id": ", ".join(node.source_ids),
+            }
+            for title, node in self._nodes.items()
+        ]
+
+    def relationships(self) -> list[dict[str, Any]]:
+        """Return one row per relationship, oriented and ordered as networkx lists edges."""
+        rows = []
+        seen = set()
+        for title in self._nodes:
+            for key in self._adjacency.get(title, ()):
+                other = key[1] if key[0] == title else key[0]
+                if other in seen:
+                    continue
+                edge = self._edges[key]
+                rows.append({
+                    "source": title,
+                    "target": other,
+                    "weight": edge.weight,
+                    "description": "\n".join(edge.descriptions),
+                    "source_id": ", ".join(edge.source_ids),
+                })
+            seen.add(title)
+        return rows
+
+    def to_networkx(self) -> nx.Graph:
+        """Build an undirected graph with the entities as nodes and relationships as edges."""
+        return graph_from_rows(self.entities(), self.relationships())
+
+    def _add_entity(
+        self, title: str, entity_type: str, description: str, source_id: str
+    ) -> None:
+        node = self._nodes.get(title)
+        if node is None:
+            self._nodes[title] = _Node(
+                type=entity_type,
+                descriptions=dict.fromkeys(description.split("\n")),
+                source_ids={source_id: None},
+            )
+            return
+
+        if self._join_descriptions:
+            node.descriptions[description] = None
+        elif len(description) > len("\n".join(node.descriptions)):
+            node.descriptions = {description: None}
+        node.source_ids[source_id] = None
+        if entity_type != "":
+            node.type = entity_type
+
+    def _add_relationship(
+        self,
+        source: str,
+        target: str,
+        description: str,
+        weight: float,
+        source_id: str,
+    ) -> None:
+        for title in (source, target):
+            if title not in self._nodes:
+                self._nodes[title] = _Node(
+                    type="", descriptions={"": None}, source_ids={source_id: None}
+                )
+
+        key = (source, target)
+        if key not in self._edges and (target, source) in self._edges:
+            key = (target, source)
+        edge = self._edges.get(key)
+        if edge is None:
+            self._edges[key] = _Edge(
+                weight=weight,
+                descriptions=dict.fromkeys(description.split("\n")),
+                source_ids={source_id: None},
+            )
+            self._adjacency.setdefault(source, []).append(key)
+            if target != source:
+                self._adjacency.setdefault(target, []).append(key)
+            return
+
+        edge.weight += weight
+        if self._join_descriptions:
+            edge.descriptions[description] = None
+        else:
+            edge.descriptions = {description: None}
+        edge.source_ids[source_id] = None
+
+
+def graph_from_rows(
+    entities: list[dict[str, Any]], relationships: list[dict[str, Any]]
+) -> nx.Graph:
+    """Build an undirected graph from entity and relationship rows."""
+    graph = nx.Graph()
+    graph.add_nodes_from(
+        (entity["title"], {k: v for k, v in entity.items() if k != "title"})
+        for entity in entities
+    )
+    graph.add_edges_from(
+        (
+            relationship["source"],
+            relationship["target"],
+            {k: v for k, v in relationship.items() if k not in ("source", "target")},
+        )
+        for relationship in relationships
+    )
+    return graph
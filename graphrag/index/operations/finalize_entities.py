@@ -10,10 +10,9 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.data_model.schemas import ENTITIES_FINAL_COLUMNS
-from graphrag.index.operations.compute_degree import compute_degree
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.embed_graph.embed_graph import embed_graph
 from graphrag.index.operations.layout_graph.layout_graph import layout_graph
+from graphrag.index.utils.csr_graph import CSRGraph
 
 
 def finalize_entities(
@@ -24,20 +23,28 @@ def finalize_entities(
     layout_enabled: bool = False,
 ) -> pd.DataFrame:
     """All the steps to transform final entities."""
-    graph = create_graph(relationships)
-    graph_embeddings = None
-    if embed_config is not None and embed_config.enabled:
-        graph_embeddings = embed_graph(
-            graph,
-            embed_config,
+    graph = CSRGraph.from_edges(relationships)
+    embed_enabled = embed_config is not None and embed_config.enabled
+    if embed_enabled or layout_enabled:
+        nx_graph = graph.to_networkx()
+        graph_embeddings = None
+        if embed_config is not None and embed_config.enabled:
+            graph_embeddings = embed_graph(nx_graph, embed_config)
+        layout = layout_graph(
+            nx_graph,
+            callbacks,
+            layout_enabled,
+            embeddings=graph_embeddings,
         )
-    layout = layout_graph(
-        graph,
-        callbacks,
-        layout_enabled,
-        embeddings=graph_embeddings,
-    )
-    degrees = compute_degree(graph)
+    else:
+        # the zero layout places every node at the origin, no graph is needed for it
+        layout = pd.DataFrame({
+            "label": graph.nodes.astype(str),
+            "x": 0,
+            "y": 0,
+            "size": 0,
+        })
+    degrees = graph.degree_frame()
     final_entities = (
         entities.merge(layout, left_on="title", right_on="label", how="left")
         .merge(degrees, on="title", how="left")
@@ -8,28 +8,18 @@ from uuid import uuid4
 import pandas as pd
 
 from graphrag.data_model.schemas import RELATIONSHIPS_FINAL_COLUMNS
-from graphrag.index.operations.compute_degree import compute_degree
-from graphrag.index.operations.compute_edge_combined_degree import (
-    compute_edge_combined_degree,
-)
-from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.csr_graph import CSRGraph
 
 
 def finalize_relationships(
     relationships: pd.DataFrame,
 ) -> pd.DataFrame:
     """All the steps to transform final relationships."""
-    graph = create_graph(relationships)
-    degrees = compute_degree(graph)
+    graph = CSRGraph.from_edges(relationships)
 
     final_relationships = relationships.drop_duplicates(subset=["source", "target"])
-    final_relationships["combined_degree"] = compute_edge_combined_degree(
-        final_relationships,
-        degrees,
-        node_name_column="title",
-        node_degree_column="degree",
-        edge_source_column="source",
-        edge_target_column="target",
+    final_relationships["combined_degree"] = graph.edge_combined_degree(
+        final_relationships["source"], final_relationships["target"]
     )
 
     final_relationships.reset_index(inplace=True)
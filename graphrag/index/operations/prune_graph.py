@@ -3,20 +3,16 @@
 
 """Graph pruning."""
 
-from typing import TYPE_CHECKING, cast
-
-import graspologic as glc
-import networkx as nx
 import numpy as np
+import pandas as pd
 
 import graphrag.data_model.schemas as schemas
-
-if TYPE_CHECKING:
-    from networkx.classes.reportviews import DegreeView
+from graphrag.index.utils.csr_graph import CSRGraph
 
 
 def prune_graph(
-    graph: nx.Graph,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
     min_node_freq: int = 1,
     max_node_freq_std: float | None = None,
     min_node_degree: int = 1,
@@ -24,68 +20,118 @@ def prune_graph(
     min_edge_weight_pct: float = 0,
     remove_ego_nodes: bool = False,
     lcc_only: bool = False,
-) -> nx.Graph:
-    """Prune graph by removing nodes that are out of frequency/degree ranges and edges with low weights."""
-    # remove ego nodes if needed
-    degree = cast("DegreeView", graph.degree)
-    degrees = list(degree())  # type: ignore
-    if remove_ego_nodes:
-        # ego node is one with highest degree
-        ego_node = max(degrees, key=lambda x: x[1])
-        graph.remove_nodes_from([ego_node[0]])
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Prune graph by removing nodes that are out of frequency/degree ranges and edges with low weights.
 
-    # remove nodes that are not within the predefined degree range
-    graph.remove_nodes_from([
-        node for node, degree in degrees if degree < min_node_degree
+    The graph is the undirected graph of the relationships, with repeated edges
+    collapsed and keeping the weight of their last row, plus the entities. Degrees,
+    frequencies and edge weights are masked as integer-encoded arrays, and only the
+    largest connected component step builds a (CSR) graph. Ties for the ego node and
+    the largest component go to the node a networkx graph of the tables would list
+    first. Returns the entity and relationship rows of the remaining nodes and edges,
+    in their table order.
+    """
+    entity_nodes, nodes = pd.factorize(entities[schemas.TITLE], use_na_sentinel=False)
+    endpoints = np.concatenate([
+        relationships[schemas.EDGE_SOURCE].to_numpy(dtype=object),
+        relationships[schemas.EDGE_TARGET].to_numpy(dtype=object),
     ])
-    if max_node_degree_std is not None:
-        upper_threshold = _get_upper_threshold_by_std(
-            [degree for _, degree in degrees], max_node_degree_std
+    endpoint_nodes = nodes.get_indexer(endpoints)
+    missing = endpoint_nodes == -1
+    if missing.any():
+        # relationship endpoints that are not entities go after them
+        missing_nodes, missing_titles = pd.factorize(
+            endpoints[missing], use_na_sentinel=False
+        )
+        endpoint_nodes[missing] = len(nodes) + missing_nodes
+        nodes = nodes.append(pd.Index(missing_titles, dtype=object))
+    num_nodes = len(nodes)
+    row_sources, row_targets = np.split(endpoint_nodes.astype(np.int64), 2)
+
+    # collapse the relationship rows into undirected edges
+    row_keys = np.minimum(row_sources, row_targets) * num_nodes + np.maximum(
+        row_sources, row_targets
+    )
+    edge_keys, row_edges = np.unique(row_keys, return_inverse=True)
+    sources, targets = edge_keys // num_nodes, edge_keys % num_nodes
+
+    degree = np.bincount(sources, minlength=num_nodes) + np.bincount(
+        targets, minlength=num_nodes
+    )
+    frequency = np.full(num_nodes, np.nan)
+    frequency[entity_nodes] = entities[schemas.NODE_FREQUENCY].to_numpy(dtype=float)
+
+    keep = np.ones(num_nodes, dtype=bool)
+    # remove ego nodes if needed, the ego node is one with highest degree
+    if remove_ego_nodes and num_nodes > 0:
+        ego_node = _first_in_graph_order(
+            degree == degree.max(), row_sources, row_targets
         )
-        graph.remove_nodes_from([
-            node for node, degree in degrees if degree > upper_threshold
-        ])
+        keep[ego_node] = False
+
+    # remove nodes that are not within the predefined degree range
+    keep &= ~(degree < min_node_degree)
+    if max_node_degree_std is not None:
+        upper_threshold = _get_upper_threshold_by_std(degree, max_node_degree_std)
+        keep &= ~(degree > upper_threshold)
 
     # remove nodes that are not within the predefined frequency range
-    graph.remove_nodes_from([
-        node
-        for node, data in graph.nodes(data=True)
-        if data[schemas.NODE_FREQUENCY] < min_node_freq
-    ])
+    keep &= ~(frequency < min_node_freq)
     if max_node_freq_std is not None:
         upper_threshold = _get_upper_threshold_by_std(
-            [data[schemas.NODE_FREQUENCY] for _, data in graph.nodes(data=True)],
-            max_node_freq_std,
+            frequency[keep], max_node_freq_std
         )
-        graph.remove_nodes_from([
-            node
-            for node, data in graph.nodes(data=True)
-            if data[schemas.NODE_FREQUENCY] > upper_threshold
-        ])
+        keep &= ~(frequency > upper_threshold)
 
     # remove edges by min weight
-    if min_edge_weight_pct > 0:
-        min_edge_weight = np.percentile(
-            [data[schemas.EDGE_WEIGHT] for _, _, data in graph.edges(data=True)],
-            min_edge_weight_pct,
+    keep_edges = keep[sources] & keep[targets]
+    if min_edge_weight_pct > 0 and keep_edges.any():
+        # the weight of an edge is the one of its last relationship row
+        last_rows = np.zeros(len(edge_keys), dtype=np.int64)
+        np.maximum.at(last_rows, row_edges, np.arange(len(row_edges)))
+        weights = relationships[schemas.EDGE_WEIGHT].to_numpy(dtype=float)[last_rows]
+        min_edge_weight = np.percentile(weights[keep_edges], min_edge_weight_pct)
+        keep_edges &= ~(weights < min_edge_weight)
+
+    if lcc_only and keep.any():
+        graph = CSRGraph(
+            nodes.to_numpy(dtype=object), sources[keep_edges], targets[keep_edges]
+        ).subgraph(keep)
+        components = np.full(num_nodes, -1)
+        components[keep] = graph.connected_components()
+        sizes = np.bincount(components[keep])
+        largest = _first_in_graph_order(
+            np.isin(components, np.flatnonzero(sizes == sizes.max())),
+            row_sources,
+            row_targets,
         )
-        graph.remove_edges_from([
-            (source, target)
-            for source, target, data in graph.edges(data=True)
-            if source in graph.nodes()
-            and target in graph.nodes()
-            and data[schemas.EDGE_WEIGHT] < min_edge_weight
-        ])
+        keep &= components == components[largest]
+        keep_edges &= keep[sources] & keep[targets]
+
+    return (
+        entities.loc[keep[entity_nodes]].reset_index(drop=True),
+        relationships.loc[keep_edges[row_edges]].reset_index(drop=True),
+    )
 
-    if lcc_only:
-        return glc.utils.largest_connected_component(graph)  # type: ignore
 
-    return graph
+def _first_in_graph_order(
+    node_mask: np.ndarray, row_sources: np.ndarray, row_targets: np.ndarray
+) -> int:
+    """Return the masked node a networkx graph of the tables lists first.
+
+    networkx adds the nodes in the order they appear in the relationship rows, then
+    the entities that are in no relationship, in entity order.
+    """
+    rows = np.flatnonzero(node_mask[row_sources] | node_mask[row_targets])
+    if len(rows) > 0:
+        row = rows[0]
+        return int(
+            row_sources[row] if node_mask[row_sources[row]] else row_targets[row]
+        )
+    return int(np.flatnonzero(node_mask)[0])
 
 
-def _get_upper_threshold_by_std(
-    data: list[float] | list[int], std_trim: float
-) -> float:
+def _get_upper_threshold_by_std(data: np.ndarray, std_trim: float) -> float:
     """Get upper threshold by standard deviation."""
     mean = np.mean(data)
     std = np.std(data)
@@ -3,16 +3,81 @@
 
 """A module containing snapshot_graphml method definition."""
 
+import itertools
+from collections.abc import Iterable, Iterator
+from xml.sax.saxutils import escape
+
 import networkx as nx
 
+from graphrag.index.utils.csr_graph import CSRGraph
 from graphrag.storage.pipeline_storage import PipelineStorage
 
+_GRAPHML_HEADER = (
+    '<graphml xmlns="http://graphml.graphdrawing.org/xmlns"'
+    ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    ' xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns'
+    ' http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">'
+)
+# the escapes ElementTree applies to attribute values, on top of &, < and >
+_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+_LINES_PER_CHUNK = 10_000
+
 
 async def snapshot_graphml(
-    input: str | nx.Graph,
+    input: str | nx.Graph | CSRGraph,
     name: str,
     storage: PipelineStorage,
 ) -> None:
-    """Take a entire snapshot of a graph to standard graphml format."""
-    graphml = input if isinstance(input, str) else "\n".join(nx.generate_graphml(input))
-    await storage.set(name + ".graphml", graphml)
+    """Take a entire snapshot of a graph to standard graphml format.
+
+    The document is written to storage in chunks of lines as it is generated, off the
+    event loop. A CSRGraph is serialized line by line, a networkx graph goes through
+    `nx.generate_graphml`, which builds the whole document first.
+    """
+    if isinstance(input, str):
+        lines: Iterable[str] = [input]
+    elif isinstance(input, CSRGraph):
+        lines = generate_graphml(input)
+    else:
+        lines = nx.generate_graphml(input)
+    await storage.set_chunks(name + ".graphml", _join_lines(lines))
+
+
+def generate_graphml(graph: CSRGraph) -> Iterator[str]:
+    """Generate the GraphML lines of a graph without attributes.
+
+    The lines are the ones `nx.generate_graphml` generates for the networkx graph of
+    the same nodes and edges: node labels are written as strings, with non-ASCII
+    characters as character references.
+    """
+    yield _GRAPHML_HEADER
+    if graph.num_nodes == 0:
+        yield '  <graph edgedefault="undirected" />'
+    else:
+        yield '  <graph edgedefault="undirected">'
+        node_ids = [_escape_attribute(str(node)) for node in graph.nodes.tolist()]
+        for node_id in node_ids:
+            yield f'    <node id="{node_id}" />'
+        sources, targets = graph.oriented_edges(graph.edge_order())
+        for source, target in zip(sources.tolist(), targets.tolist(), strict=True):
+            yield f'    <edge source="{node_ids[source]}" target="{node_ids[target]}" />'
+        yield "  </graph>"
+    yield "</graphml>"
+
+
+def _escape_attribute(value: str) -> str:
+    """Escape an attribute value as ElementTree serializes it to ASCII."""
+    return (
+        escape(value, _ATTRIBUTE_ENTITIES)
+        .encode("ascii", "xmlcharrefreplace")
+        .decode("ascii")
+    )
+
+
+def _join_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Join the lines with newlines, in chunks of `_LINES_PER_CHUNK` lines."""
+    iterator = iter(lines)
+    separator = ""
+    while chunk := list(itertools.islice(iterator, _LINES_PER_CHUNK)):
+        yield separator + "\n".join(chunk)
+        separator = "\n"
@@ -4,17 +4,21 @@
 """Context builders for graphs."""
 
 import logging
+from functools import partial
 from typing import cast
 
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.enums import AsyncType
 from graphrag.index.operations.summarize_communities.build_mixed_context import (
     build_mixed_context,
 )
 from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
+    measure_context,
     parallel_sort_context_batch,
+    sort_community_context,
     sort_context,
 )
 from graphrag.index.operations.summarize_communities.utils import (
@@ -29,28 +33,46 @@ from graphrag.index.utils.dataframes import (
     union,
     where_column_equals,
 )
+from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.logger.progress import progress_iterable
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import get_token_counter
 
 log = logging.getLogger(__name__)
 
 
-def build_local_context(
+async def build_local_context(
     nodes,
     edges,
     claims,
     callbacks: WorkflowCallbacks,
     max_tokens: int = 16_000,
+    async_mode: AsyncType = AsyncType.AsyncIO,
+    num_threads: int = 4,
 ):
-    """Prep communities for report generation."""
+    """Prep communities for report generation.
+
+    With the `process` async mode the context strings of the communities of a level
+    are sorted and trimmed in a process pool of up to `num_threads` workers.
+    """
     levels = get_levels(nodes, schemas.COMMUNITY_LEVEL)
 
     dfs = []
 
     for level in progress_iterable(levels, callbacks.progress, len(levels)):
-        communities_at_level_df = _prepare_reports_at_level(
-            nodes, edges, claims, level, max_tokens
-        )
+        community_df = _prepare_reports_at_level(nodes, edges, claims, level)
+        if async_mode == AsyncType.Process:
+            community_df[schemas.CONTEXT_STRING] = await derive_from_rows(
+                community_df,
+                partial(sort_community_context, max_tokens=max_tokens),
+                callbacks,
+                num_threads,
+                async_mode,
+            )
+            communities_at_level_df = measure_context(community_df, max_tokens)
+        else:
+            communities_at_level_df = parallel_sort_context_batch(
+                community_df, max_tokens=max_tokens
+            )
 
         communities_at_level_df.loc[:, schemas.COMMUNITY_LEVEL] = level
         dfs.append(communities_at_level_df)
@@ -64,9 +86,8 @@ def _prepare_reports_at_level(
     edge_df: pd.DataFrame,
     claim_df: pd.DataFrame | None,
     level: int,
-    max_tokens: int = 16_000,
 ) -> pd.DataFrame:
-    """Prepare reports at a given level."""
+    """Group the node, edge and claim details of the communities at a given level."""
     # Filter and prepare node details
     level_node_df = node_df[node_df[schemas.COMMUNITY_LEVEL] == level]
     log.info("Number of nodes at level=%s => %s", level, len(level_node_df))
@@ -172,18 +193,12 @@ def _prepare_reports_at_level(
     )
 
     # group all node details by community
-    community_df = (
+    return (
         merged_node_df.groupby(schemas.COMMUNITY_ID)
         .agg({schemas.ALL_CONTEXT: list})
         .reset_index()
     )
 
-    # Generate community-level context strings using vectorized batch processing
-    return parallel_sort_context_batch(
-        community_df,
-        max_tokens=max_tokens,
-    )
-
 
 def build_level_context(
     report_df: pd.DataFrame | None,
@@ -221,9 +236,9 @@ def build_level_context(
         invalid_context_df.loc[:, schemas.CONTEXT_STRING] = _sort_and_trim_context(
             invalid_context_df, max_tokens
         )
-        invalid_context_df[schemas.CONTEXT_SIZE] = invalid_context_df.loc[
-            :, schemas.CONTEXT_STRING
-        ].map(num_tokens)
+        invalid_context_df[schemas.CONTEXT_SIZE] = get_token_counter().count_batch(
+            invalid_context_df[schemas.CONTEXT_STRING].tolist()
+        )
         invalid_context_df[schemas.CONTEXT_EXCEED_FLAG] = False
         return union(valid_context_df, invalid_context_df)
 
@@ -244,7 +259,9 @@ def build_level_context(
     )
 
     result = union(valid_context_df, community_df, remaining_df)
-    result[schemas.CONTEXT_SIZE] = result.loc[:, schemas.CONTEXT_STRING].map(num_tokens)
+    result[schemas.CONTEXT_SIZE] = get_token_counter().count_batch(
+        result[schemas.CONTEXT_STRING].tolist()
+    )
 
     result[schemas.CONTEXT_EXCEED_FLAG] = False
     return result
@@ -5,7 +5,11 @@
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import (
+    get_token_counter,
+    largest_fitting_prefix,
+    num_tokens,
+)
 
 
 def sort_context(
@@ -81,10 +85,10 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
-    # Deduplicate and build context incrementally
+    # Deduplicate, remembering how many records each edge brings into the context
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    prefix_sizes: list[tuple[int, int, int]] = []
 
     for edge in edges:
         source, target = edge[edge_source_column], edge[edge_target_column]
@@ -108,18 +112,30 @@ def sort_context(
             edge_ids.add(edge[schemas.SHORT_ID])
             sorted_edges.append(edge)
 
-        # Generate new context string
-        new_context_string = _get_context_string(
+        prefix_sizes.append((len(sorted_nodes), len(sorted_edges), len(sorted_claims)))
+
+    def _prefix_context_string(steps: int) -> str:
+        node_count, edge_count, claim_count = prefix_sizes[steps - 1]
+        return _get_context_string(
+            sorted_nodes[:node_count],
+            sorted_edges[:edge_count],
+            sorted_claims[:claim_count],
+            sub_community_reports,
+        )
+
+    if not max_tokens or not prefix_sizes:
+        return _get_context_string(
             sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
         )
-        if max_tokens and num_tokens(new_context_string) > max_tokens:
-            break
-        context_string = new_context_string
 
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+    # Token counts only grow with every added edge, so search for the longest
+    # fitting prefix instead of serializing and counting every one of them.
+    # If not even the first edge fits, its context is returned regardless.
+    steps = largest_fitting_prefix(
+        len(prefix_sizes),
+        lambda steps: num_tokens(_prefix_context_string(steps)) <= max_tokens,
     )
+    return _prefix_context_string(max(steps, 1))
 
 
 def parallel_sort_context_batch(community_df, max_tokens, parallel=False):
@@ -143,9 +159,18 @@ def parallel_sort_context_batch(community_df, max_tokens, parallel=False):
             lambda context_list: sort_context(context_list, max_tokens=max_tokens)
         )
 
-    # Calculate other columns
-    community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].apply(
-        num_tokens
+    return measure_context(community_df, max_tokens)
+
+
+def sort_community_context(community: pd.Series, max_tokens: int) -> str:
+    """Sort the context of a community row, module level so worker processes can unpickle it."""
+    return sort_context(community[schemas.ALL_CONTEXT], max_tokens=max_tokens)
+
+
+def measure_context(community_df: pd.DataFrame, max_tokens: int) -> pd.DataFrame:
+    """Add the token count of every context string and whether it exceeds max_tokens."""
+    community_df[schemas.CONTEXT_SIZE] = get_token_counter().count_batch(
+        community_df[schemas.CONTEXT_STRING].tolist()
     )
     community_df[schemas.CONTEXT_EXCEED_FLAG] = (
         community_df[schemas.CONTEXT_SIZE] > max_tokens
@@ -3,16 +3,19 @@
 
 """A module containing create_community_reports and load_strategy methods definition."""
 
+import asyncio
+import itertools
 import logging
+import time
+import traceback
 from collections.abc import Callable
+from typing import Any
 
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
-from graphrag.config.enums import AsyncType
 from graphrag.index.operations.summarize_communities.typing import (
     CommunityReport,
     CommunityReportsStrategy,
@@ -21,7 +24,7 @@ from graphrag.index.operations.summarize_communities.typing import (
 from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.derive_from_rows import ParallelizationError
 from graphrag.logger.progress import progress_ticker
 
 log = logging.getLogger(__name__)
@@ -36,11 +39,17 @@ async def summarize_communities(
     cache: PipelineCache,
     strategy: dict,
     max_input_length: int,
-    async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
 ):
-    """Generate community summaries."""
-    reports: list[CommunityReport | None] = []
+    """Generate community summaries.
+
+    Reports are generated by a pool of `num_threads` workers across all levels at once.
+    A community is queued as soon as its context is ready: right away when its local
+    context fits in `max_input_length` or it has no sub-communities, otherwise once the
+    reports of its own sub-communities are done, so that they can stand in for their
+    local context. Model calls are I/O bound, so reports are scheduled on the event
+    loop.
+    """
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     strategy_exec = load_strategy(strategy["type"])
     strategy_config = {**strategy}
@@ -56,43 +65,131 @@ async def summarize_communities(
     ).dropna()
 
     levels = get_levels(nodes)
+    level_contexts = local_contexts.loc[
+        local_contexts[schemas.COMMUNITY_LEVEL].isin(levels)
+    ]
+    sub_communities: dict[Any, list] = {}
+    for community, sub_community in zip(
+        community_hierarchy[schemas.COMMUNITY_ID],
+        community_hierarchy[schemas.SUB_COMMUNITY],
+        strict=True,
+    ):
+        sub_communities.setdefault(community, []).append(sub_community)
+    # the community ids of the contexts, with the type used for the hierarchy lookup
+    community_ids = level_contexts[schemas.COMMUNITY_ID].tolist()
+    community_levels = dict(
+        zip(community_ids, level_contexts[schemas.COMMUNITY_LEVEL], strict=True)
+    )
 
-    level_contexts = []
+    # communities whose context exceeds the limit wait for their sub-community reports
+    waiting_on: dict[Any, set] = {}
+    parents: dict[Any, Any] = {}
+    known_communities = set(community_ids)
+    for community, exceeded in zip(
+        community_ids, level_contexts[schemas.CONTEXT_EXCEED_FLAG], strict=True
+    ):
+        children = set(sub_communities.get(community, ())) & known_communities
+        if exceeded and children:
+            waiting_on[community] = children
+            for child in children:
+                parents[child] = community
+
+    reports: dict[Any, CommunityReport] = {}
+    errors: list[tuple[BaseException, str]] = []
+    queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+    sequence = itertools.count()
+
+    def enqueue(records: pd.DataFrame, priority: int) -> None:
+        for record in records.to_dict("records"):
+            queue.put_nowait((priority, next(sequence), record))
+
+    ready = local_contexts.loc[
+        ~local_contexts[schemas.COMMUNITY_ID].isin(waiting_on.keys())
+    ]
     for level in levels:
-        level_context = level_context_builder(
-            pd.DataFrame(reports),
-            community_hierarchy_df=community_hierarchy,
-            local_context_df=local_contexts,
-            level=level,
-            max_tokens=max_input_length,
+        enqueue(
+            level_context_builder(
+                None,
+                community_hierarchy_df=community_hierarchy,
+                local_context_df=ready,
+                level=level,
+                max_tokens=max_input_length,
+            ),
+            priority=1,
         )
-        level_contexts.append(level_context)
-
-    for level_context in level_contexts:
-
-        async def run_generate(record):
-            result = await _generate_report(
-                strategy_exec,
-                community_id=record[schemas.COMMUNITY_ID],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                callbacks=callbacks,
-                cache=cache,
-                strategy=strategy_config,
-            )
-            tick()
-            return result
-
-        local_reports = await derive_from_rows(
-            level_context,
-            run_generate,
-            callbacks=NoopWorkflowCallbacks(),
-            num_threads=num_threads,
-            async_type=async_mode,
+
+    def complete(community: Any) -> None:
+        parent = parents.get(community)
+        if parent is None:
+            return
+        pending = waiting_on[parent]
+        pending.discard(community)
+        if pending:
+            return
+        children = sub_communities[parent]
+        child_reports = [reports[child] for child in children if child in reports]
+        # parents are on the critical path of the levels above, so they go first
+        enqueue(
+            level_context_builder(
+                pd.DataFrame(child_reports) if child_reports else None,
+                community_hierarchy_df=community_hierarchy,
+                local_context_df=local_contexts.loc[
+                    local_contexts[schemas.COMMUNITY_ID].isin([parent, *children])
+                ],
+                level=community_levels[parent],
+                max_tokens=max_input_length,
+            ),
+            priority=0,
         )
-        reports.extend([lr for lr in local_reports if lr is not None])
 
-    return pd.DataFrame(reports)
+    async def worker() -> None:
+        while True:
+            _, _, record = await queue.get()
+            community = record[schemas.COMMUNITY_ID]
+            try:
+                report = await _generate_report(
+                    strategy_exec,
+                    community_id=community,
+                    community_level=record[schemas.COMMUNITY_LEVEL],
+                    community_context=record[schemas.CONTEXT_STRING],
+                    callbacks=callbacks,
+                    cache=cache,
+                    strategy=strategy_config,
+                )
+                if report is not None:
+                    reports[community] = report
+            except Exception as e:  # noqa: BLE001
+                errors.append((e, traceback.format_exc()))
+            tick()
+            try:
+                complete(community)
+            except Exception as e:  # noqa: BLE001
+                errors.append((e, traceback.format_exc()))
+            queue.task_done()
+
+    start = time.time()
+    workers = [asyncio.create_task(worker()) for _ in range(num_threads or 4)]
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+    tick.done()
+
+    elapsed = time.time() - start
+    log.info(
+        "Generated %s community reports in %.2fs (%.1f reports/minute)",
+        len(reports),
+        elapsed,
+        len(reports) / elapsed * 60 if elapsed > 0 else 0,
+    )
+    if errors:
+        raise ParallelizationError(len(errors), errors[0][1])
+
+    # reports in level order, deepest first, as they were generated level by level
+    return pd.DataFrame([
+        reports[community] for community in community_ids if community in reports
+    ])
 
 
 async def _generate_report(
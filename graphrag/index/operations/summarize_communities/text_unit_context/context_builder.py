@@ -138,14 +138,9 @@ def build_level_context(
     level_context_df = level_context_df[level_context_df["_merge"] == "left_only"].drop(
         "_merge", axis=1
     )
-    valid_context_df = cast(
-        "pd.DataFrame",
-        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG] is False],
-    )
-    invalid_context_df = cast(
-        "pd.DataFrame",
-        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG] is True],
-    )
+    exceeded = level_context_df[schemas.CONTEXT_EXCEED_FLAG].astype(bool)
+    valid_context_df = cast("pd.DataFrame", level_context_df[~exceeded])
+    invalid_context_df = cast("pd.DataFrame", level_context_df[exceeded])
 
     if invalid_context_df.empty:
         return valid_context_df
@@ -8,7 +8,7 @@ import logging
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import largest_fitting_prefix, num_tokens
 
 log = logging.getLogger(__name__)
 
@@ -65,18 +65,21 @@ def sort_context(
         local_context, key=lambda x: x[schemas.ENTITY_DEGREE], reverse=True
     )
 
-    current_text_units = []
     context_string = ""
-    for record in sorted_text_units:
-        current_text_units.append(record)
-        if max_tokens:
-            new_context_string = get_context_string(
-                current_text_units, sub_community_reports
+    if max_tokens:
+        # token counts only grow with every added text unit, so search for the
+        # longest fitting prefix instead of serializing and counting every one
+        size = largest_fitting_prefix(
+            len(sorted_text_units),
+            lambda size: num_tokens(
+                get_context_string(sorted_text_units[:size], sub_community_reports)
+            )
+            <= max_tokens,
+        )
+        if size:
+            context_string = get_context_string(
+                sorted_text_units[:size], sub_community_reports
             )
-            if num_tokens(new_context_string) > max_tokens:
-                break
-
-            context_string = new_context_string
 
     if context_string == "":
         return get_context_string(sorted_text_units, sub_community_reports)
@@ -14,6 +14,7 @@ from dataclasses import asdict
 import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
@@ -132,6 +133,9 @@ async def _run_pipeline(
     log.info("Final # of rows loaded: %s", len(dataset))
     context.stats.num_documents = len(dataset)
     last_workflow = "starting documents"
+    cache_stats = (
+        context.cache.stats if isinstance(context.cache, TieredPipelineCache) else None
+    )
 
     try:
         await _dump_json(context)
@@ -145,6 +149,7 @@ async def _run_pipeline(
             progress = logger.child(name, transient=False)
             callbacks.workflow_start(name, None)
             work_time = time.time()
+            cache_snapshot = cache_stats.snapshot() if cache_stats is not None else {}
             print("before")
             result = await workflow_function(config, context)
             print("after")
@@ -154,7 +159,12 @@ async def _run_pipeline(
                 workflow=name, result=result.result, state=context.state, errors=None
             )
 
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
+            context.stats.workflows[name] = {
+                "overall": time.time() - work_time,
+                **result.stats,
+            }
+            if cache_stats is not None:
+                context.stats.cache[name] = cache_stats.since(cache_snapshot)
 
         context.stats.total_runtime = time.time() - start_time
         await _dump_json(context)
@@ -3,6 +3,8 @@
 
 """A module containing the 'Tokenizer', 'TextSplitter', 'NoopTextSplitter' and 'TokenTextSplitter' models."""
 
+import bisect
+import itertools
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Collection, Iterable
@@ -165,30 +167,42 @@ def split_multiple_texts_on_tokens(
     texts: list[str], tokenizer: Tokenizer, tick: ProgressTicker
 ) -> list[TextChunk]:
     """Split multiple texts and return chunks with metadata using the tokenizer."""
-    result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
+    encoded_texts = []
+    for text in texts:
+        encoded_texts.append(tokenizer.encode(text))
         if tick:
             tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
 
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
+    return split_encoded_texts_on_tokens(encoded_texts, tokenizer)
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
 
+def split_encoded_texts_on_tokens(
+    encoded_texts: list[EncodedText], tokenizer: Tokenizer
+) -> list[TextChunk]:
+    """Split texts that are already encoded and return chunks with metadata.
+
+    The chunks are windows over the concatenated token ids of all texts, as
+    `split_multiple_texts_on_tokens` makes them.
+    """
+    result = []
+    input_ids = list(itertools.chain.from_iterable(encoded_texts))
+    # the offset of the first token of each text, and of the end of the last one
+    offsets = [0, *itertools.accumulate(len(ids) for ids in encoded_texts)]
+
+    start_idx = 0
     while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
         cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
+        chunk_text = tokenizer.decode(input_ids[start_idx:cur_idx])
+        # the texts with tokens in the chunk, as a set built in text order
+        first_doc = bisect.bisect_right(offsets, start_idx) - 1
+        last_doc = bisect.bisect_left(offsets, cur_idx) - 1
+        doc_indices = list({
+            doc_idx
+            for doc_idx in range(first_doc, last_doc + 1)
+            if offsets[doc_idx + 1] > offsets[doc_idx]
+        })
+        result.append(TextChunk(chunk_text, doc_indices, cur_idx - start_idx))
+        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
 
     return result
 
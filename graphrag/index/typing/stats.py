@@ -21,3 +21,6 @@ class PipelineRunStats:
 
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
     """A dictionary of workflows."""
+
+    cache: dict[str, dict[str, int]] = field(default_factory=dict)
+    """Cache lookup statistics per workflow, when the cache keeps them."""
@@ -4,7 +4,7 @@
 """Pipeline workflow types."""
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
@@ -18,6 +18,9 @@ class WorkflowFunctionOutput:
     result: Any | None
     """The result of the workflow function. This can be anything - we use it only for logging downstream, and expect each workflow function to write official outputs to the provided storage."""
 
+    stats: dict[str, float] = field(default_factory=dict)
+    """Measurements of the workflow run, recorded in the pipeline stats next to its runtime."""
+
 
 WorkflowFunction = Callable[
     [GraphRagConfig, PipelineRunContext],
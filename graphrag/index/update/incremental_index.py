@@ -27,6 +27,7 @@ from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.storage import (
     load_table_from_storage,
     storage_has_table,
+    write_memory_mappable_table_to_storage,
     write_table_to_storage,
 )
 
@@ -230,7 +231,9 @@ async def _update_text_units(
         old_text_units, delta_text_units, entity_id_mapping
     )
 
-    await write_table_to_storage(merged_text_units, "text_units", output_storage)
+    await write_memory_mappable_table_to_storage(
+        merged_text_units, "text_units", output_storage
+    )
 
     return merged_text_units
 
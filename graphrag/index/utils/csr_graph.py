@@ -0,0 +1,348 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the array-backed 'CSRGraph' model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+_EDGE_KEY_SEPARATOR = " -> "
+
+
+@dataclass(frozen=True)
+class CSRGraph:
+    """Undirected graph stored as integer-encoded numpy arrays.
+
+    Nodes are the positions of `nodes`, which holds their labels. Each undirected edge
+    is stored once in `sources`/`targets` in the order it was first added, mirroring
+    the insertion order a `networkx.Graph` would have. The CSR adjacency (`offsets`,
+    `neighbors`, `neighbor_edges`) is derived on first use.
+    """
+
+    nodes: np.ndarray
+    """Node labels, indexed by node id."""
+
+    sources: np.ndarray
+    """Node id of the first endpoint of each edge."""
+
+    targets: np.ndarray
+    """Node id of the second endpoint of each edge."""
+
+    weights: np.ndarray | None = None
+    """Optional weight of each edge."""
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: pd.DataFrame,
+        source: str = "source",
+        target: str = "target",
+        weight: str | None = None,
+        nodes: Iterable[Any] | None = None,
+    ) -> CSRGraph:
+        """Build a graph from an edge table, like `networkx.from_pandas_edgelist`.
+
+        Node ids follow the order nodes first appear in the edge rows, then in `nodes`.
+        Repeated edges, in either direction, are stored once at their first position
+        and keep the weight of their last occurrence.
+        """
+        # interleave source and target so factorize sees nodes in insertion order
+        endpoints = np.empty(2 * len(edges), dtype=object)
+        endpoints[0::2] = edges[source].to_numpy()
+        endpoints[1::2] = edges[target].to_numpy()
+        if nodes is not None:
+            endpoints = np.concatenate([
+                endpoints,
+                np.asarray(list(nodes), dtype=object),
+            ])
+        codes, labels = pd.factorize(endpoints, use_na_sentinel=False)
+        pairs = codes[: 2 * len(edges)]
+        weights = edges[weight].to_numpy() if weight is not None else None
+        return cls._from_pairs(
+            np.asarray(labels, dtype=object), pairs[0::2], pairs[1::2], weights
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph, weight: str | None = None) -> CSRGraph:
+        """Build a graph from a networkx graph, keeping its node and edge order."""
+        labels = np.empty(graph.number_of_nodes(), dtype=object)
+        labels[:] = list(graph.nodes)
+        index = pd.Index(labels)
+        edges = list(graph.edges(data=weight) if weight else graph.edges)
+        sources = index.get_indexer([edge[0] for edge in edges])
+        targets = index.get_indexer([edge[1] for edge in edges])
+        weights = np.asarray([edge[2] for edge in edges]) if weight else None
+        return cls(labels, sources.astype(np.int64), targets.astype(np.int64), weights)
+
+    @classmethod
+    def _from_pairs(
+        cls,
+        labels: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray | None,
+    ) -> CSRGraph:
+        """Build a graph from node id pairs, collapsing repeated undirected edges."""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keys = np.minimum(sources, targets) * len(labels) + np.maximum(sources, targets)
+        _, first = np.unique(keys, return_index=True)
+        _, last_reversed = np.unique(keys[::-1], return_index=True)
+        order = np.argsort(first)
+        first = first[order]
+        if weights is not None:
+            last = len(keys) - 1 - last_reversed[order]
+            weights = np.asarray(weights)[last]
+        return cls(labels, sources[first], targets[first], weights)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges."""
+        return len(self.sources)
+
+    @cached_property
+    def offsets(self) -> np.ndarray:
+        """CSR row offsets, the neighbors of node `i` are `neighbors[offsets[i]:offsets[i + 1]]`."""
+        return np.concatenate([[0], np.cumsum(self.degree())])
+
+    @cached_property
+    def neighbors(self) -> np.ndarray:
+        """CSR column indices, each node's neighbors in edge insertion order."""
+        return self._adjacency[0]
+
+    @cached_property
+    def neighbor_edges(self) -> np.ndarray:
+        """Edge id of each entry in `neighbors`."""
+        return self._adjacency[1]
+
+    @cached_property
+    def _adjacency(self) -> tuple[np.ndarray, np.ndarray]:
+        edge_ids = np.arange(self.num_edges)
+        rows = np.concatenate([self.sources, self.targets])
+        columns = np.concatenate([self.targets, self.sources])
+        ids = np.concatenate([edge_ids, edge_ids])
+        # a self loop is listed once per endpoint, as networkx counts it twice
+        order = np.lexsort((ids, rows))
+        return columns[order], ids[order]
+
+    def degree(self) -> np.ndarray:
+        """Degree of every node, counting self loops twice as networkx does."""
+        return np.bincount(self.sources, minlength=self.num_nodes) + np.bincount(
+            self.targets, minlength=self.num_nodes
+        )
+
+    def degree_frame(self, node_id: str = "title") -> pd.DataFrame:
+        """Degree of every node as a `node_id`, degree table."""
+        return pd.DataFrame({node_id: self.nodes, "degree": self.degree()})
+
+    def node_ids(self, labels: Sequence[Any] | pd.Series) -> np.ndarray:
+        """Node id of each label, -1 for labels that are not in the graph."""
+        return pd.Index(self.nodes).get_indexer(labels)
+
+    def edge_combined_degree(
+        self, sources: Sequence[Any] | pd.Series, targets: Sequence[Any] | pd.Series
+    ) -> np.ndarray:
+        """Sum of the endpoint degrees of each edge, missing endpoints count as 0."""
+        degree = np.append(self.degree(), 0)
+        return degree[self.node_ids(sources)] + degree[self.node_ids(targets)]
+
+    def connected_components(self) -> np.ndarray:
+        """Component label of every node, the smallest node id in its component."""
+        labels = np.arange(self.num_nodes)
+        sources, targets = self.sources, self.targets
+        while True:
+            source_labels, target_labels = labels[sources], labels[targets]
+            pending = source_labels != target_labels
+            if not pending.any():
+                return labels
+            sources, targets = sources[pending], targets[pending]
+            source_labels, target_labels = (
+                source_labels[pending],
+                target_labels[pending],
+            )
+            # hook the larger root under the smaller one, then compress every path
+            np.minimum.at(
+                labels,
+                np.maximum(source_labels, target_labels),
+                np.minimum(source_labels, target_labels),
+            )
+            while True:
+                compressed = labels[labels]
+                if np.array_equal(compressed, labels):
+                    break
+                labels = compressed
+
+    def largest_component_mask(self) -> np.ndarray:
+        """Mask of the nodes in the largest connected component.
+
+        Ties go to the component holding the earliest node, like
+        `max(nx.connected_components(graph), key=len)`.
+        """
+        if self.num_nodes == 0:
+            return np.zeros(0, dtype=bool)
+        labels = self.connected_components()
+        sizes = np.bincount(labels, minlength=self.num_nodes)
+        return labels == int(np.argmax(sizes))
+
+    def largest_connected_component(self) -> CSRGraph:
+        """Return the largest connected component, keeping node and edge order."""
+        return self.subgraph(self.largest_component_mask())
+
+    def subgraph(self, node_mask: np.ndarray) -> CSRGraph:
+        """Return the graph induced by the masked nodes, keeping node and edge order."""
+        new_ids = np.cumsum(node_mask) - 1
+        kept = node_mask[self.sources] & node_mask[self.targets]
+        return CSRGraph(
+            self.nodes[node_mask],
+            new_ids[self.sources[kept]],
+            new_ids[self.targets[kept]],
+            None if self.weights is None else self.weights[kept],
+        )
+
+    def relabel(self, mapping: Callable[[Any], Any]) -> CSRGraph:
+        """Relabel the nodes, merging the nodes and edges that collide.
+
+        Follows `networkx.relabel_nodes`: merged nodes take the position of their first
+        member and merged edges keep the weight of the last one in edge order.
+        """
+        codes, labels = pd.factorize(
+            np.asarray([mapping(node) for node in self.nodes], dtype=object),
+            use_na_sentinel=False,
+        )
+        order = self.edge_order()
+        sources, targets = self.oriented_edges(order)
+        return CSRGraph._from_pairs(
+            np.asarray(labels, dtype=object),
+            codes[sources],
+            codes[targets],
+            None if self.weights is None else self.weights[order],
+        )
+
+    def stable(self) -> CSRGraph:
+        """Return the graph with sorted nodes and edges in a deterministic order.
+
+        Nodes are sorted by label; each edge is oriented from the smaller to the larger
+        label and edges are sorted by their `"{source} -> {target}"` key, matching
+        `stable_largest_connected_component`.
+        """
+        node_order = np.argsort(self.nodes, kind="stable")
+        positions = np.empty(self.num_nodes, dtype=np.int64)
+        positions[node_order] = np.arange(self.num_nodes)
+        sources, targets = positions[self.sources], positions[self.targets]
+        sources, targets = np.minimum(sources, targets), np.maximum(sources, targets)
+        nodes = self.nodes[node_order]
+        if _has_ambiguous_edge_keys(nodes):
+            keys = np.asarray(
+                [
+                    f"{nodes[source]}{_EDGE_KEY_SEPARATOR}{nodes[target]}"
+                    for source, target in zip(sources, targets, strict=True)
+                ],
+                dtype=object,
+            )
+            edge_order = np.argsort(keys, kind="stable")
+        else:
+            # keys sharing a source compare by target, other keys by their source
+            # prefix, so only one string per node is needed
+            edge_order = np.lexsort((targets, _edge_key_ranks(nodes)[sources]))
+        return CSRGraph(
+            nodes,
+            sources[edge_order],
+            targets[edge_order],
+            None if self.weights is None else self.weights[edge_order],
+        )
+
+    def edge_order(self) -> np.ndarray:
+        """Order in which `networkx.Graph.edges` would yield the edges.
+
+        networkx walks the nodes in order and yields each edge from its earlier
+        endpoint, in the order the edges were added.
+        """
+        return np.lexsort((
+            np.arange(self.num_edges),
+            np.minimum(self.sources, self.targets),
+        ))
+
+    def oriented_edges(
+        self, order: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Edge endpoints oriented from the earlier node, as networkx yields them."""
+        sources, targets = self.sources, self.targets
+        if order is not None:
+            sources, targets = sources[order], targets[order]
+        return np.minimum(sources, targets), np.maximum(sources, targets)
+
+    def edge_list(self, default_weight: float = 1.0) -> list[tuple[Any, Any, float]]:
+        """Labelled `(source, target, weight)` edges in networkx iteration order."""
+        order = self.edge_order()
+        sources, targets = self.oriented_edges(order)
+        weights = (
+            np.full(len(order), default_weight)
+            if self.weights is None
+            else self.weights[order]
+        )
+        return list(
+            zip(
+                self.nodes[sources].tolist(),
+                self.nodes[targets].tolist(),
+                weights.astype(float).tolist(),
+                strict=True,
+            )
+        )
+
+    def has_self_loops(self) -> bool:
+        """Return True if any edge connects a node to itself."""
+        return bool((self.sources == self.targets).any())
+
+    def to_networkx(self, weight: str = "weight") -> nx.Graph:
+        """Materialize the graph as a `networkx.Graph` with the same node and edge order."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes.tolist())
+        sources = self.nodes[self.sources].tolist()
+        targets = self.nodes[self.targets].tolist()
+        if self.weights is None:
+            graph.add_edges_from(zip(sources, targets, strict=True))
+        else:
+            graph.add_edges_from(
+                (source, target, {weight: value})
+                for source, target, value in zip(
+                    sources, targets, self.weights.tolist(), strict=True
+                )
+            )
+        return graph
+
+
+def _edge_key_ranks(nodes: np.ndarray) -> np.ndarray:
+    """Rank of each node's `"{label} -> "` edge key prefix."""
+    prefixes = np.asarray(
+        [f"{node}{_EDGE_KEY_SEPARATOR}" for node in nodes.tolist()], dtype=object
+    )
+    ranks = np.empty(len(nodes), dtype=np.int64)
+    ranks[np.argsort(prefixes, kind="stable")] = np.arange(len(nodes))
+    return ranks
+
+
+def _has_ambiguous_edge_keys(nodes: np.ndarray) -> bool:
+    """Return True if the edge key order can not be derived from node ranks.
+
+    That is the case when a label contains the key separator, since one key prefix
+    can then be a prefix of another, or when labels are not all strings.
+    """
+    labels = pd.Series(nodes, dtype=object)
+    if not labels.map(type).eq(str).all():
+        return True
+    return bool(labels.str.contains(_EDGE_KEY_SEPARATOR, regex=False).any())
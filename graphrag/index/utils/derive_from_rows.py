@@ -6,8 +6,11 @@
 import asyncio
 import inspect
 import logging
+import os
+import pickle  # noqa: S403
 import traceback
 from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, TypeVar, cast
 
 import pandas as pd
@@ -49,6 +52,10 @@ async def derive_from_rows(
             return await derive_from_rows_asyncio_threads(
                 input, transform, callbacks, num_threads
             )
+        case AsyncType.Process:
+            return await derive_from_rows_process(
+                input, transform, callbacks, num_threads
+            )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
             raise ValueError(msg)
@@ -96,25 +103,125 @@ async def derive_from_rows_asyncio(
     """
     Derive from rows asynchronously.
 
-    This is useful for IO bound operations.
+    This is useful for IO bound operations. Rows are streamed to a fixed pool of
+    `num_threads` workers, so memory use does not grow with the number of rows.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
+    num_workers = num_threads or 4
 
     async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        async def execute_row_protected(
-            row: tuple[Hashable, pd.Series],
-        ) -> ItemType | None:
-            async with semaphore:
-                return await execute(row)
+        results: list[ItemType | None] = [None] * len(input)
+        # a single shared iterator: each worker pulls the next row when it is free
+        rows = enumerate(input.iterrows())
+
+        async def worker() -> None:
+            for position, row in rows:
+                results[position] = await execute(row)
 
-        tasks = [
-            asyncio.create_task(execute_row_protected(row)) for row in input.iterrows()
-        ]
-        return await asyncio.gather(*tasks)
+        await asyncio.gather(*[worker() for _ in range(min(num_workers, len(input)))])
+        return results
 
     return await _derive_from_rows_base(input, transform, callbacks, gather)
 
 
+async def derive_from_rows_process(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Awaitable[ItemType]]
+    | Callable[[pd.Series], ItemType],
+    callbacks: WorkflowCallbacks,
+    num_processes: int = 4,
+) -> list[ItemType | None]:
+    """
+    Derive from rows in a process pool.
+
+    This is useful for CPU bound operations. The transform must be picklable (e.g. a
+    module-level function); it may be synchronous or a coroutine function. Rows are
+    sent to the workers in batches, with at most one batch in flight per worker.
+    Transforms that cannot be pickled fall back to the threaded mode.
+    """
+    try:
+        pickle.dumps(transform)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        logger.warning(
+            "Transform %r cannot be pickled, falling back to threaded execution",
+            transform,
+        )
+        return await derive_from_rows_asyncio_threads(
+            input,
+            cast("Callable[[pd.Series], Awaitable[ItemType]]", transform),
+            callbacks,
+            num_processes,
+        )
+
+    num_workers = max(1, min(num_processes or 4, os.cpu_count() or 1, len(input)))
+    batch_size = max(1, len(input) // (num_workers * 8))
+    tick = progress_ticker(callbacks.progress, num_total=len(input))
+    errors: list[tuple[BaseException, str]] = []
+    results: list[ItemType | None] = [None] * len(input)
+    batches = (
+        (start, [row for _, row in input.iloc[start : start + batch_size].iterrows()])
+        for start in range(0, len(input), batch_size)
+    )
+    loop = asyncio.get_running_loop()
+    executor = ProcessPoolExecutor(max_workers=num_workers)
+
+    async def worker() -> None:
+        for start, rows in batches:
+            try:
+                outcomes = await loop.run_in_executor(
+                    executor, _execute_batch, transform, rows
+                )
+            except Exception as e:
+                # the batch was not run or its results could not be sent back, e.g.
+                # a result that cannot be pickled or a broken pool
+                errors.extend((e, traceback.format_exc()) for _ in rows)
+                raise
+            for offset, (result, error) in enumerate(outcomes):
+                if error is not None:
+                    errors.append(error)
+                else:
+                    results[start + offset] = result
+            tick(len(rows))
+
+    workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+    try:
+        await asyncio.gather(*workers)
+    except Exception:  # noqa: BLE001
+        # the failure is in errors, stop the other workers and report it below
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    finally:
+        # joining the worker processes blocks, so it must not run on the loop
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    tick.done()
+    _report_errors(errors, callbacks)
+    return results
+
+
+def _execute_batch(
+    transform: Callable[[pd.Series], Any], rows: list[pd.Series]
+) -> list[tuple[Any, tuple[BaseException, str] | None]]:
+    """Run the transform over a batch of rows inside a worker process."""
+    outcomes = []
+    for row in rows:
+        try:
+            result = transform(row)
+            if inspect.iscoroutine(result):
+                result = asyncio.run(result)
+        except Exception as e:  # noqa: BLE001
+            error: BaseException = e
+            try:
+                pickle.dumps(error)
+            except Exception:  # noqa: BLE001
+                # the parent only needs the message and the stack
+                error = RuntimeError(str(e))
+            outcomes.append((None, (error, traceback.format_exc())))
+        else:
+            outcomes.append((result, None))
+    return outcomes
+
+
 ItemType = TypeVar("ItemType")
 
 ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
@@ -151,11 +258,16 @@ async def _derive_from_rows_base(
     result = await gather(execute)
 
     tick.done()
+    _report_errors(errors, callbacks)
+
+    return result
 
+
+def _report_errors(
+    errors: list[tuple[BaseException, str]], callbacks: WorkflowCallbacks
+) -> None:
     for error, stack in errors:
         callbacks.error("parallel transformation error", error, stack)
 
     if len(errors) > 0:
         raise ParallelizationError(len(errors), errors[0][1])
-
-    return result
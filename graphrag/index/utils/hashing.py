@@ -12,3 +12,11 @@ def gen_sha512_hash(item: dict[str, Any], hashcode: Iterable[str]):
     """Generate a SHA512 hash."""
     hashed = "".join([str(item[column]) for column in hashcode])
     return f"{sha512(hashed.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+
+def gen_sha512_hashes(values: Iterable[Any]) -> list[str]:
+    """Generate the SHA512 hash of every value, as `gen_sha512_hash` does for one column."""
+    return [
+        sha512(str(value).encode("utf-8"), usedforsecurity=False).hexdigest()
+        for value in values
+    ]
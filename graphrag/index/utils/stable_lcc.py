@@ -7,10 +7,47 @@ import html
 from typing import Any, cast
 
 import networkx as nx
+import numpy as np
+
+from graphrag.index.utils.csr_graph import CSRGraph
 
 
 def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph:
     """Return the largest connected component of the graph, with nodes and edges sorted in a stable way."""
+    if graph.is_directed() or graph.is_multigraph():
+        return _stable_largest_connected_component_networkx(graph)
+
+    # components, normalization and ordering run on integer arrays; the edge ids
+    # travel as weights so the attributes can be attached to the result
+    arrays = CSRGraph.from_networkx(graph)
+    edge_data = [data for _, _, data in graph.edges(data=True)]
+    arrays = CSRGraph(
+        arrays.nodes, arrays.sources, arrays.targets, np.arange(arrays.num_edges)
+    )
+    lcc = arrays.largest_connected_component()
+    stable = lcc.relabel(normalize_node_name).stable()
+
+    # merged nodes and edges keep the attributes of their last member
+    node_data = {
+        normalize_node_name(node): graph.nodes[node] for node in lcc.nodes.tolist()
+    }
+    labels = stable.nodes.tolist()
+    result = nx.Graph()
+    result.add_nodes_from((label, node_data[label]) for label in labels)
+    result.add_edges_from(
+        (labels[source], labels[target], edge_data[edge])
+        for source, target, edge in zip(
+            stable.sources.tolist(),
+            stable.targets.tolist(),
+            stable.weights.tolist(),  # type: ignore[union-attr]
+            strict=True,
+        )
+    )
+    return result
+
+
+def _stable_largest_connected_component_networkx(graph: nx.Graph) -> nx.Graph:
+    """Compute the stable largest connected component with networkx operations."""
     # NOTE: The import is done here to reduce the initial import time of the module
     from graspologic.utils import largest_connected_component
 
@@ -61,7 +98,21 @@ def _stabilize_graph(graph: nx.Graph) -> nx.Graph:
     return fixed_graph
 
 
+def stable_largest_connected_component_csr(graph: CSRGraph) -> CSRGraph:
+    """Return the stable largest connected component of an array-backed graph.
+
+    Produces the same nodes and edges, in the same order, as
+    `stable_largest_connected_component` does for the equivalent networkx graph.
+    """
+    return graph.largest_connected_component().relabel(normalize_node_name).stable()
+
+
 def normalize_node_names(graph: nx.Graph | nx.DiGraph) -> nx.Graph | nx.DiGraph:
     """Normalize node names."""
-    node_mapping = {node: html.unescape(node.upper().strip()) for node in graph.nodes()}  # type: ignore
+    node_mapping = {node: normalize_node_name(node) for node in graph.nodes()}  # type: ignore
     return nx.relabel_nodes(graph, node_mapping)
+
+
+def normalize_node_name(node: str) -> str:
+    """Normalize a node name."""
+    return html.unescape(node.upper().strip())
@@ -7,6 +7,9 @@ import html
 import re
 from typing import Any
 
+# https://stackoverflow.com/questions/4324790/removing-control-characters-from-a-string-in-python
+_CONTROL_CHARACTERS = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+
 
 def clean_str(input: Any) -> str:
     """Clean an input string by removing HTML escapes, control characters, and other unwanted characters."""
@@ -15,5 +18,4 @@ def clean_str(input: Any) -> str:
         return input
 
     result = html.unescape(input.strip())
-    # https://stackoverflow.com/questions/4324790/removing-control-characters-from-a-string-in-python
-    return re.sub(r"[\x00-\x1f\x7f-\x9f]", "", result)
+    return _CONTROL_CHARACTERS.sub("", result)
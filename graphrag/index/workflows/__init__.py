@@ -6,6 +6,9 @@
 
 from graphrag.index.workflows.factory import PipelineFactory
 
+from .count_tokens import (
+    run_workflow as run_count_tokens,
+)
 from .create_base_text_units import (
     run_workflow as run_create_base_text_units,
 )
@@ -45,6 +48,7 @@ from .prune_graph import (
 
 # register all of our built-in workflows at once
 PipelineFactory.register_all({
+    "count_tokens": run_count_tokens,
     "create_base_text_units": run_create_base_text_units,
     "create_communities": run_create_communities,
     "create_community_reports_text": run_create_community_reports_text,
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import pandas as pd
+import tiktoken
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.schemas import (
+    DESCRIPTION,
+    FULL_CONTENT,
+    FULL_CONTENT_N_TOKENS,
+    N_TOKENS,
+    SUMMARY,
+    SUMMARY_N_TOKENS,
+    TEXT,
+    TEXT_N_TOKENS,
+    TOKENS_ENCODING,
+)
+from graphrag.index.operations.count_tokens import count_tokens
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
+
+TOKEN_COUNT_COLUMNS: dict[str, dict[str, str]] = {
+    "entities": {DESCRIPTION: N_TOKENS},
+    "relationships": {DESCRIPTION: N_TOKENS},
+    "community_reports": {
+        SUMMARY: SUMMARY_N_TOKENS,
+        FULL_CONTENT: FULL_CONTENT_N_TOKENS,
+    },
+    "covariates": {DESCRIPTION: N_TOKENS},
+    # n_tokens of a text unit counts its chunk, without the prepended metadata
+    "text_units": {TEXT: TEXT_N_TOKENS},
+}
+"""Text columns of each output table and the column their token count is stored in."""
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """All the steps to persist the token counts of the index outputs."""
+    # the same encoding the text unit n_tokens are counted with
+    token_encoder = tiktoken.get_encoding(config.chunks.encoding_model)
+
+    output = {}
+    for name, columns in TOKEN_COUNT_COLUMNS.items():
+        if not await storage_has_table(name, context.storage):
+            continue
+        table = await load_table_from_storage(name, context.storage)
+        output[name] = add_token_counts(table, columns, token_encoder)
+        await write_table_to_storage(output[name], name, context.storage)
+
+    return WorkflowFunctionOutput(result=output)
+
+
+def add_token_counts(
+    table: pd.DataFrame,
+    columns: dict[str, str],
+    token_encoder: tiktoken.Encoding,
+) -> pd.DataFrame:
+    """Add the token count column of every text column present in the table.
+
+    The name of the encoding is stored alongside, so that queries only use the counts
+    when they budget with the same encoding.
+    """
+    for text_column, tokens_column in columns.items():
+        if text_column in table.columns:
+            table[tokens_column] = count_tokens(table[text_column], token_encoder)
+            table[TOKENS_ENCODING] = token_encoder.name
+    return table
@@ -11,11 +11,15 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.chunking_config import ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.chunk_text.chunk_text import chunk_text
+from graphrag.index.operations.chunk_text.chunk_text import (
+    chunk_code_groups,
+    chunk_text,
+    chunk_text_groups,
+)
 from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.index.utils.hashing import gen_sha512_hashes
 from graphrag.logger.progress import Progress
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
@@ -39,6 +43,7 @@ async def run_workflow(
         strategy=chunks.strategy,
         prepend_metadata=chunks.prepend_metadata,
         chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+        num_workers=chunks.num_workers,
     )
 
     await write_table_to_storage(output, "text_units", context.storage)
@@ -56,6 +61,7 @@ def create_base_text_units(
     strategy: ChunkStrategyType,
     prepend_metadata: bool = False,
     chunk_size_includes_metadata: bool = False,
+    num_workers: int = 1,
 ) -> pd.DataFrame:
     """All the steps to transform base text_units."""
     sort = documents.sort_values(by=["id"], ascending=[True])
@@ -81,56 +87,74 @@ def create_base_text_units(
     )
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
-    def chunker(row: dict[str, Any]) -> Any:
-        line_delimiter = "\n"
-        metadata_str = ""
-        metadata_tokens = 0
-
-        prepend_metadata = True ############################################################ NOTE
-
-        if prepend_metadata and "metadata" in row:
-            metadata = row["metadata"]
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-            if isinstance(metadata, dict):
-                metadata_str = (
-                    line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
-                    + line_delimiter
-                )
-
-            if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
+    prepend_metadata = True ############################################################ NOTE
+
+    metadata_strs = [""] * len(aggregated)
+    sizes = [size] * len(aggregated)
+    if prepend_metadata and "metadata" in aggregated:
+        metadata_strs = [
+            _metadata_str(metadata) for metadata in aggregated["metadata"].tolist()
+        ]
+        if chunk_size_includes_metadata:
+            encode, _ = get_encoding_fn(encoding_model)
+            sizes = []
+            for metadata_str in metadata_strs:
                 metadata_tokens = len(encode(metadata_str))
                 if metadata_tokens >= size:
                     message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
                     raise ValueError(message)
-
-        chunked = chunk_text(
-            pd.DataFrame([row]).reset_index(drop=True),
-            column="texts",
-            size=size - metadata_tokens,
+                sizes.append(size - metadata_tokens)
+
+    groups = aggregated["texts"].tolist()
+    if strategy in (ChunkStrategyType.tokens, ChunkStrategyType.code):
+        # chunk all groups at once, resolving the encoding and starting the workers
+        # once per run
+        chunk_groups = (
+            chunk_text_groups
+            if strategy == ChunkStrategyType.tokens
+            else chunk_code_groups
+        )
+        group_chunks = chunk_groups(
+            [[text for _, text in texts] for texts in groups],
+            sizes,
             overlap=overlap,
             encoding_model=encoding_model,
-            strategy=strategy,
             callbacks=callbacks,
-        )[0]
-
-        if prepend_metadata:
-            for index, chunk in enumerate(chunked):
-                if isinstance(chunk, str):
-                    chunked[index] = metadata_str + chunk
-                elif hasattr(chunk, 'text_chunk'):  # Handle TextChunk objects
-                    chunk.text_chunk = metadata_str + chunk.text_chunk
-                    chunked[index] = chunk
-                else:
-                    chunked[index] = (
-                        (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
-                    )
-
-        row["chunks"] = chunked
-        return row
-
-    aggregated = aggregated.apply(lambda row: chunker(row), axis=1)
+            num_workers=num_workers,
+        )
+        chunked = [
+            [
+                (
+                    [texts[doc_idx][0] for doc_idx in chunk.source_doc_indices],
+                    metadata_str + chunk.text_chunk,
+                    chunk.n_tokens,
+                )
+                for chunk in chunks
+            ]
+            for texts, chunks, metadata_str in zip(
+                groups, group_chunks, metadata_strs, strict=True
+            )
+        ]
+    else:
+        chunked = [
+            [
+                (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
+                for chunk in chunk_text(
+                    pd.DataFrame({"texts": [texts]}),
+                    column="texts",
+                    size=group_size,
+                    overlap=overlap,
+                    encoding_model=encoding_model,
+                    strategy=strategy,
+                    callbacks=callbacks,
+                    num_workers=num_workers,
+                )[0]
+            ]
+            for texts, group_size, metadata_str in zip(
+                groups, sizes, metadata_strs, strict=True
+            )
+        ]
+    aggregated["chunks"] = chunked
 
     aggregated = cast("pd.DataFrame", aggregated[[*group_by_columns, "chunks"]])
     aggregated = aggregated.explode("chunks")
@@ -140,9 +164,7 @@ def create_base_text_units(
         },
         inplace=True,
     )
-    aggregated["id"] = aggregated.apply(
-        lambda row: gen_sha512_hash(row, ["chunk"]), axis=1
-    )
+    aggregated["id"] = gen_sha512_hashes(aggregated["chunk"])
     aggregated[["document_ids", "chunk", "n_tokens"]] = pd.DataFrame(
         aggregated["chunk"].tolist(), index=aggregated.index
     )
@@ -152,3 +174,16 @@ def create_base_text_units(
     return cast(
         "pd.DataFrame", aggregated[aggregated["text"].notna()].reset_index(drop=True)
     )
+
+
+def _metadata_str(metadata: Any) -> str:
+    """Format the metadata of a document as the lines prepended to its chunks."""
+    line_delimiter = "\n"
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    if isinstance(metadata, dict):
+        return (
+            line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
+            + line_delimiter
+        )
+    return ""
@@ -13,9 +13,9 @@ import pandas as pd
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.schemas import COMMUNITIES_FINAL_COLUMNS
 from graphrag.index.operations.cluster_graph import cluster_graph
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.csr_graph import CSRGraph
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
@@ -52,7 +52,7 @@ def create_communities(
     seed: int | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final communities."""
-    graph = create_graph(relationships)
+    graph = CSRGraph.from_edges(relationships)
 
     clusters = cluster_graph(
         graph,
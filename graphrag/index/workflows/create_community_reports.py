@@ -3,6 +3,8 @@
 
 """A module containing run_workflow method definition."""
 
+import time
+
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -56,6 +58,7 @@ async def run_workflow(
         config.root_dir, community_reports_llm_settings
     )
     print("1")
+    start = time.time()
     output = await create_community_reports(
         edges_input=edges,
         entities=entities,
@@ -67,10 +70,14 @@ async def run_workflow(
         async_mode=async_mode,
         num_threads=num_threads,
     )
+    elapsed = time.time() - start
     print("2")
     await write_table_to_storage(output, "community_reports", context.storage)
     print("3")
-    return WorkflowFunctionOutput(result=output)
+    return WorkflowFunctionOutput(
+        result=output,
+        stats={"reports_per_minute": len(output) / elapsed * 60 if elapsed else 0},
+    )
 
 
 async def create_community_reports(
@@ -100,12 +107,14 @@ async def create_community_reports(
         "max_input_length", graphrag_config_defaults.community_reports.max_input_length
     )
 
-    local_contexts = build_local_context(
+    local_contexts = await build_local_context(
         nodes,
         edges,
         claims,
         callbacks,
         max_input_length,
+        async_mode=async_mode,
+        num_threads=num_threads,
     )
 
     community_reports = await summarize_communities(
@@ -117,7 +126,6 @@ async def create_community_reports(
         cache,
         summarization_strategy,
         max_input_length=max_input_length,
-        async_mode=async_mode,
         num_threads=num_threads,
     )
 
@@ -4,13 +4,13 @@
 """A module containing run_workflow method definition."""
 
 import logging
+import time
 
 import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.defaults import graphrag_config_defaults
-from graphrag.config.enums import AsyncType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.finalize_community_reports import (
     finalize_community_reports,
@@ -45,12 +45,12 @@ async def run_workflow(
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
     )
-    async_mode = community_reports_llm_settings.async_mode
     num_threads = community_reports_llm_settings.concurrent_requests
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
 
+    start = time.time()
     output = await create_community_reports_text(
         entities,
         communities,
@@ -58,13 +58,16 @@ async def run_workflow(
         context.callbacks,
         context.cache,
         summarization_strategy,
-        async_mode=async_mode,
         num_threads=num_threads,
     )
+    elapsed = time.time() - start
 
     await write_table_to_storage(output, "community_reports", context.storage)
 
-    return WorkflowFunctionOutput(result=output)
+    return WorkflowFunctionOutput(
+        result=output,
+        stats={"reports_per_minute": len(output) / elapsed * 60 if elapsed else 0},
+    )
 
 
 async def create_community_reports_text(
@@ -74,7 +77,6 @@ async def create_community_reports_text(
     callbacks: WorkflowCallbacks,
     cache: PipelineCache,
     summarization_strategy: dict,
-    async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
@@ -99,7 +101,6 @@ async def create_community_reports_text(
         cache,
         summarization_strategy,
         max_input_length=max_input_length,
-        async_mode=async_mode,
         num_threads=num_threads,
     )
 
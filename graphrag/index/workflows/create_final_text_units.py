@@ -12,7 +12,7 @@ from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.utils.storage import (
     load_table_from_storage,
     storage_has_table,
-    write_table_to_storage,
+    write_memory_mappable_table_to_storage,
 )
 
 
@@ -39,7 +39,7 @@ async def run_workflow(
         final_covariates,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await write_memory_mappable_table_to_storage(output, "text_units", context.storage)
 
     return WorkflowFunctionOutput(result=output)
 
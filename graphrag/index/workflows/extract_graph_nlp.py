@@ -55,6 +55,8 @@ async def extract_graph_nlp(
         normalize_edge_weights=extraction_config.normalize_edge_weights,
         num_threads=extraction_config.concurrent_requests,
         cache=cache,
+        batch_size=extraction_config.batch_size,
+        num_processes=extraction_config.num_processes,
     )
 
     # add in any other columns required by downstream workflows
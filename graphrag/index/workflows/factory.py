@@ -53,6 +53,7 @@ def _get_workflows_list(
                 #"create_communities",
                 #"create_final_text_units",
                 #"create_community_reports",
+                "count_tokens",
                 "generate_text_embeddings",
             ]
         case IndexingMethod.Fast:
@@ -65,5 +66,6 @@ def _get_workflows_list(
                 "create_communities",
                 "create_final_text_units",
                 "create_community_reports_text",
+                "count_tokens",
                 "generate_text_embeddings",
             ]
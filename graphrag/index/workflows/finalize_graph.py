@@ -3,17 +3,19 @@
 
 """A module containing run_workflow method definition."""
 
+import asyncio
+
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.finalize_entities import finalize_entities
 from graphrag.index.operations.finalize_relationships import finalize_relationships
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.csr_graph import CSRGraph
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
@@ -38,7 +40,7 @@ async def run_workflow(
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
-        graph = create_graph(relationships)
+        graph = await asyncio.to_thread(CSRGraph.from_edges, relationships)
         await snapshot_graphml(
             graph,
             name="graph",
@@ -73,6 +73,7 @@ async def load_docs_in_chunks(
         strategy=chunk_config.strategy,
         prepend_metadata=chunk_config.prepend_metadata,
         chunk_size_includes_metadata=chunk_config.chunk_size_includes_metadata,
+        num_workers=chunk_config.num_workers,
     )
 
     # Depending on the select method, build the dataset
@@ -12,7 +12,12 @@ import tiktoken
 
 from graphrag.data_model.community_report import CommunityReport
 from graphrag.data_model.entity import Entity
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import (
+    TokenHint,
+    get_token_counter,
+    num_tokens,
+    row_token_hint,
+)
 
 log = logging.getLogger(__name__)
 
@@ -63,7 +68,7 @@ def build_community_context(
 
     def _report_context_text(
         report: CommunityReport, attributes: list[str]
-    ) -> tuple[str, list[str]]:
+    ) -> tuple[str, list[str], TokenHint | None]:
         context: list[str] = [
             report.short_id if report.short_id else "",
             report.title,
@@ -72,11 +77,27 @@ def build_community_context(
                 for field in attributes
             ],
         ]
+        content_field = len(context)
         context.append(report.summary if use_community_summary else report.full_content)
         if include_community_rank:
             context.append(str(report.rank))
         result = column_delimiter.join(context) + "\n"
-        return result, context
+        content_tokens = (
+            report.summary_n_tokens
+            if use_community_summary
+            else report.full_content_n_tokens
+        )
+        return (
+            result,
+            context,
+            row_token_hint(
+                context,
+                content_field,
+                content_tokens,
+                report.tokens_encoding,
+                column_delimiter,
+            ),
+        )
 
     compute_community_weights = (
         entities
@@ -150,10 +171,12 @@ def build_community_context(
     # initialize the first batch
     _init_batch()
 
-    for report in selected_reports:
-        new_context_text, new_context = _report_context_text(report, attributes)
-        new_tokens = num_tokens(new_context_text, token_encoder)
-
+    report_contexts = (
+        _report_context_text(report, attributes) for report in selected_reports
+    )
+    for new_context_text, new_context, new_tokens in get_token_counter(
+        token_encoder
+    ).counted(report_contexts):
         if batch_tokens + new_tokens > max_tokens:
             # add the current batch to the context data and start a new batch if we are in multi-batch mode
             _cut_batch()
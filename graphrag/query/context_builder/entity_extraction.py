@@ -9,9 +9,8 @@ from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.query.input.retrieval.entities import (
+    EntityIndex,
     get_entity_by_id,
-    get_entity_by_key,
-    get_entity_by_name,
 )
 from graphrag.vector_stores.base import BaseVectorStore
 
@@ -44,13 +43,18 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    entity_index: EntityIndex | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    Pass an `entity_index` over the values of `all_entities_dict` to reuse its lookups across queries.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
         exclude_entity_names = []
-    all_entities = list(all_entities_dict.values())
+    if entity_index is None:
+        entity_index = EntityIndex(all_entities_dict.values())
     matched_entities = []
     if query != "":
         # get entities with highest semantic similarity to query
@@ -66,29 +70,28 @@ def map_query_to_entities(
             ):
                 matched = get_entity_by_id(all_entities_dict, result.document.id)
             else:
-                matched = get_entity_by_key(
-                    entities=all_entities,
+                matched = entity_index.get_by_key(
                     key=embedding_vectorstore_key,
                     value=result.document.id,
                 )
             if matched:
                 matched_entities.append(matched)
     else:
-        all_entities.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
-        matched_entities = all_entities[:k]
+        matched_entities = entity_index.top_ranked(k)
 
     # filter out excluded entities
     if exclude_entity_names:
+        excluded_entity_names = set(exclude_entity_names)
         matched_entities = [
             entity
             for entity in matched_entities
-            if entity.title not in exclude_entity_names
+            if entity.title not in excluded_entity_names
         ]
 
     # add entities in the include_entity list
     included_entities = []
     for entity_name in include_entity_names:
-        included_entities.extend(get_entity_by_name(all_entities, entity_name))
+        included_entities.extend(entity_index.get_by_name(entity_name))
     return included_entities + matched_entities
 
 
@@ -4,6 +4,7 @@
 """Local Context Builder."""
 
 from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any, cast
 
 import pandas as pd
@@ -13,18 +14,20 @@ from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.query.input.retrieval.covariates import (
+    CovariateIndex,
     get_candidate_covariates,
     to_covariate_dataframe,
 )
 from graphrag.query.input.retrieval.entities import to_entity_dataframe
 from graphrag.query.input.retrieval.relationships import (
+    RelationshipIndex,
     get_candidate_relationships,
     get_entities_from_relationships,
     get_in_network_relationships,
     get_out_network_relationships,
     to_relationship_dataframe,
 )
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import TokenBudget, TokenHint, row_token_hint
 
 
 def build_entity_context(
@@ -52,31 +55,41 @@ def build_entity_context(
     )
     header.extend(attribute_cols)
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
+    budget = TokenBudget(max_tokens, token_encoder)
+    budget.spend(current_context_text)
+
+    def _records() -> Iterator[tuple[str, list[str], TokenHint | None]]:
+        for entity in selected_entities:
+            new_context = [
+                entity.short_id if entity.short_id else "",
+                entity.title,
+                entity.description if entity.description else "",
+            ]
+            if include_entity_rank:
+                new_context.append(str(entity.rank))
+            for field in attribute_cols:
+                field_value = (
+                    str(entity.attributes.get(field))
+                    if entity.attributes and entity.attributes.get(field)
+                    else ""
+                )
+                new_context.append(field_value)
+            yield (
+                column_delimiter.join(new_context) + "\n",
+                new_context,
+                row_token_hint(
+                    new_context,
+                    2,
+                    entity.n_tokens,
+                    entity.tokens_encoding,
+                    column_delimiter,
+                ),
+            )
 
     all_context_records = [header]
-    for entity in selected_entities:
-        new_context = [
-            entity.short_id if entity.short_id else "",
-            entity.title,
-            entity.description if entity.description else "",
-        ]
-        if include_entity_rank:
-            new_context.append(str(entity.rank))
-        for field in attribute_cols:
-            field_value = (
-                str(entity.attributes.get(field))
-                if entity.attributes and entity.attributes.get(field)
-                else ""
-            )
-            new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
+    for new_context_text, new_context in budget.fit(_records()):
         current_context_text += new_context_text
         all_context_records.append(new_context)
-        current_tokens += new_tokens
 
     if len(all_context_records) > 1:
         record_df = pd.DataFrame(
@@ -90,19 +103,26 @@ def build_entity_context(
 
 def build_covariates_context(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: list[Covariate] | CovariateIndex,
     token_encoder: tiktoken.Encoding | None = None,
     max_tokens: int = 8000,
     column_delimiter: str = "|",
     context_name: str = "Covariates",
 ) -> tuple[str, pd.DataFrame]:
     """Prepare covariate data tables as context data for system prompt."""
+    if isinstance(covariates, CovariateIndex):
+        covariate_index = covariates
+        covariates = covariate_index.covariates
+    else:
+        selected_entity_names = {entity.title for entity in selected_entities}
+        covariate_index = CovariateIndex(
+            cov for cov in covariates if cov.subject_id in selected_entity_names
+        )
     # create an empty list of covariates
     if len(selected_entities) == 0 or len(covariates) == 0:
         return "", pd.DataFrame()
 
     selected_covariates = list[Covariate]()
-    record_df = pd.DataFrame()
 
     # add context header
     current_context_text = f"-----{context_name}-----" + "\n"
@@ -113,48 +133,62 @@ def build_covariates_context(
     attribute_cols = list(attributes.keys()) if len(covariates) > 0 else []
     header.extend(attribute_cols)
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
+    budget = TokenBudget(max_tokens, token_encoder)
+    budget.spend(current_context_text)
 
-    all_context_records = [header]
     for entity in selected_entities:
-        selected_covariates.extend([
-            cov for cov in covariates if cov.subject_id == entity.title
-        ])
-
-    for covariate in selected_covariates:
-        new_context = [
-            covariate.short_id if covariate.short_id else "",
-            covariate.subject_id,
-        ]
-        for field in attribute_cols:
-            field_value = (
-                str(covariate.attributes.get(field))
-                if covariate.attributes and covariate.attributes.get(field)
-                else ""
+        selected_covariates.extend(covariate_index.by_subject(entity.title))
+
+    # the persisted token count covers the description attribute
+    description_field = (
+        header.index("description") if "description" in attribute_cols else None
+    )
+
+    def _records() -> Iterator[tuple[str, list[str], TokenHint | None]]:
+        for covariate in selected_covariates:
+            new_context = [
+                covariate.short_id if covariate.short_id else "",
+                covariate.subject_id,
+            ]
+            for field in attribute_cols:
+                field_value = (
+                    str(covariate.attributes.get(field))
+                    if covariate.attributes and covariate.attributes.get(field)
+                    else ""
+                )
+                new_context.append(field_value)
+            yield (
+                column_delimiter.join(new_context) + "\n",
+                new_context,
+                row_token_hint(
+                    new_context,
+                    description_field,
+                    covariate.n_tokens,
+                    covariate.tokens_encoding,
+                    column_delimiter,
+                )
+                if description_field is not None
+                else None,
             )
-            new_context.append(field_value)
 
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
+    all_context_records = [header]
+    for new_context_text, new_context in budget.fit(_records()):
         current_context_text += new_context_text
         all_context_records.append(new_context)
-        current_tokens += new_tokens
 
-        if len(all_context_records) > 1:
-            record_df = pd.DataFrame(
-                all_context_records[1:], columns=cast("Any", all_context_records[0])
-            )
-        else:
-            record_df = pd.DataFrame()
+    if len(all_context_records) > 1:
+        record_df = pd.DataFrame(
+            all_context_records[1:], columns=cast("Any", all_context_records[0])
+        )
+    else:
+        record_df = pd.DataFrame()
 
     return current_context_text, record_df
 
 
 def build_relationship_context(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: list[Relationship] | RelationshipIndex,
     token_encoder: tiktoken.Encoding | None = None,
     include_relationship_weight: bool = False,
     max_tokens: int = 8000,
@@ -188,32 +222,38 @@ def build_relationship_context(
     header.extend(attribute_cols)
 
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
+    budget = TokenBudget(max_tokens, token_encoder)
+    budget.spend(current_context_text)
+
+    def _records() -> Iterator[tuple[str, list[str], TokenHint | None]]:
+        for rel in selected_relationships:
+            new_context = [
+                rel.short_id if rel.short_id else "",
+                rel.source,
+                rel.target,
+                rel.description if rel.description else "",
+            ]
+            if include_relationship_weight:
+                new_context.append(str(rel.weight if rel.weight else ""))
+            for field in attribute_cols:
+                field_value = (
+                    str(rel.attributes.get(field))
+                    if rel.attributes and rel.attributes.get(field)
+                    else ""
+                )
+                new_context.append(field_value)
+            yield (
+                column_delimiter.join(new_context) + "\n",
+                new_context,
+                row_token_hint(
+                    new_context, 3, rel.n_tokens, rel.tokens_encoding, column_delimiter
+                ),
+            )
 
     all_context_records = [header]
-    for rel in selected_relationships:
-        new_context = [
-            rel.short_id if rel.short_id else "",
-            rel.source,
-            rel.target,
-            rel.description if rel.description else "",
-        ]
-        if include_relationship_weight:
-            new_context.append(str(rel.weight if rel.weight else ""))
-        for field in attribute_cols:
-            field_value = (
-                str(rel.attributes.get(field))
-                if rel.attributes and rel.attributes.get(field)
-                else ""
-            )
-            new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
+    for new_context_text, new_context in budget.fit(_records()):
         current_context_text += new_context_text
         all_context_records.append(new_context)
-        current_tokens += new_tokens
 
     if len(all_context_records) > 1:
         record_df = pd.DataFrame(
@@ -227,7 +267,7 @@ def build_relationship_context(
 
 def _filter_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: list[Relationship] | RelationshipIndex,
     top_k_relationships: int = 10,
     relationship_ranking_attribute: str = "rank",
 ) -> list[Relationship]:
@@ -251,33 +291,17 @@ def _filter_relationships(
 
     # within out-of-network relationships, prioritize mutual relationships
     # (i.e. relationships with out-network entities that are shared with multiple selected entities)
-    selected_entity_names = [entity.title for entity in selected_entities]
-    out_network_source_names = [
-        relationship.source
-        for relationship in out_network_relationships
-        if relationship.source not in selected_entity_names
-    ]
-    out_network_target_names = [
-        relationship.target
-        for relationship in out_network_relationships
-        if relationship.target not in selected_entity_names
-    ]
-    out_network_entity_names = list(
-        set(out_network_source_names + out_network_target_names)
-    )
-    out_network_entity_links = defaultdict(int)
-    for entity_name in out_network_entity_names:
-        targets = [
-            relationship.target
-            for relationship in out_network_relationships
-            if relationship.source == entity_name
-        ]
-        sources = [
-            relationship.source
-            for relationship in out_network_relationships
-            if relationship.target == entity_name
-        ]
-        out_network_entity_links[entity_name] = len(set(targets + sources))
+    selected_entity_names = {entity.title for entity in selected_entities}
+    out_network_entity_neighbors = defaultdict(set)
+    for relationship in out_network_relationships:
+        if relationship.source not in selected_entity_names:
+            out_network_entity_neighbors[relationship.source].add(relationship.target)
+        if relationship.target not in selected_entity_names:
+            out_network_entity_neighbors[relationship.target].add(relationship.source)
+    out_network_entity_links = {
+        entity_name: len(neighbors)
+        for entity_name, neighbors in out_network_entity_neighbors.items()
+    }
 
     # sort out-network relationships by number of links and rank_attributes
     for rel in out_network_relationships:
@@ -316,8 +340,8 @@ def _filter_relationships(
 def get_candidate_context(
     selected_entities: list[Entity],
     entities: list[Entity],
-    relationships: list[Relationship],
-    covariates: dict[str, list[Covariate]],
+    relationships: list[Relationship] | RelationshipIndex,
+    covariates: dict[str, list[Covariate]] | dict[str, CovariateIndex],
     include_entity_rank: bool = True,
     entity_rank_description: str = "number of relationships",
     include_relationship_weight: bool = False,
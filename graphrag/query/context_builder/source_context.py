@@ -4,6 +4,7 @@
 """Context Build utility methods."""
 
 import random
+from collections.abc import Iterator
 from typing import Any, cast
 
 import pandas as pd
@@ -11,7 +12,7 @@ import tiktoken
 
 from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import TokenBudget, TokenHint, row_token_hint
 
 """
 Contain util functions to build text unit context for the search's system prompt
@@ -47,27 +48,35 @@ def build_text_unit_context(
     header.extend(attribute_cols)
 
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
+    budget = TokenBudget(max_tokens, token_encoder)
+    budget.spend(current_context_text)
     all_context_records = [header]
 
-    for unit in text_units:
-        new_context = [
-            unit.short_id,
-            unit.text,
-            *[
-                str(unit.attributes.get(field, "")) if unit.attributes else ""
-                for field in attribute_cols
-            ],
-        ]
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-
-        if current_tokens + new_tokens > max_tokens:
-            break
-
+    def _records() -> Iterator[tuple[str, list[str], TokenHint | None]]:
+        for unit in text_units:
+            new_context = [
+                unit.short_id,
+                unit.text,
+                *[
+                    str(unit.attributes.get(field, "")) if unit.attributes else ""
+                    for field in attribute_cols
+                ],
+            ]
+            yield (
+                column_delimiter.join(new_context) + "\n",
+                new_context,
+                row_token_hint(
+                    new_context,
+                    1,
+                    unit.text_n_tokens,
+                    unit.tokens_encoding,
+                    column_delimiter,
+                ),
+            )
+
+    for new_context_text, new_context in budget.fit(_records()):
         current_context_text += new_context_text
         all_context_records.append(new_context)
-        current_tokens += new_tokens
 
     if len(all_context_records) > 1:
         record_df = pd.DataFrame(
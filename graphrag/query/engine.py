@@ -0,0 +1,440 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A long-lived query engine serving searches over one loaded index."""
+
+import threading
+from collections.abc import AsyncGenerator, Callable, Mapping
+from typing import Any, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.embeddings import (
+    community_full_content_embedding,
+    entity_description_embedding,
+    text_unit_text_embedding,
+)
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.community import Community
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.logger.print_progress import PrintProgressLogger
+from graphrag.query.factory import (
+    get_basic_search_engine,
+    get_drift_search_engine,
+    get_global_search_engine,
+    get_local_search_engine,
+)
+from graphrag.query.indexer_adapters import (
+    read_indexer_communities,
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_report_embeddings,
+    read_indexer_reports,
+    read_indexer_text_unit_records,
+    read_indexer_text_units,
+)
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.api import (
+    create_storage_from_config,
+    get_embedding_store,
+    load_search_prompt,
+)
+from graphrag.utils.cli import redact
+from graphrag.utils.storage import (
+    load_memory_mapped_table_from_storage,
+    load_table_from_storage,
+    storage_has_table,
+)
+from graphrag.vector_stores.base import BaseVectorStore
+
+logger = PrintProgressLogger("")
+
+T = TypeVar("T")
+
+SearchResult = tuple[
+    str | dict[str, Any] | list[dict[str, Any]],
+    str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+]
+
+
+class QueryEngine:
+    """Serve searches of any method over an index that is loaded once.
+
+    The index tables are adapted to query objects on first use, per community level where
+    the adapters depend on it, and kept for the lifetime of the engine together with the
+    vector store connections, the search prompts and the context builders (which hold the
+    token encoder and the lookup indexes over entities, relationships and covariates).
+    Every search only creates the lightweight search object that carries its callbacks and
+    per-query state, so concurrent searches of any method share the loaded index. Global
+    searches with dynamic community selection build their context builder every time, so
+    that the engine can serve searches from more than one event loop.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        entities: pd.DataFrame | None = None,
+        communities: pd.DataFrame | None = None,
+        community_reports: pd.DataFrame | None = None,
+        text_units: pd.DataFrame | pa.Table | None = None,
+        relationships: pd.DataFrame | None = None,
+        covariates: pd.DataFrame | None = None,
+        embedding_stores: dict[str, BaseVectorStore] | None = None,
+    ):
+        """Init method definition.
+
+        Text units given as an Arrow table are converted to data objects lazily, as search
+        results reference them. Vector stores missing from `embedding_stores`, keyed by
+        embedding name, are connected from the config on first use.
+        """
+        self.config = config
+        self._tables: dict[str, pd.DataFrame | pa.Table | None] = {
+            "entities": entities,
+            "communities": communities,
+            "community_reports": community_reports,
+            "text_units": text_units,
+            "relationships": relationships,
+            "covariates": covariates,
+        }
+        self._embedding_stores = dict(embedding_stores or {})
+        self._cache: dict[tuple, Any] = {}
+        self._context_builders: dict[tuple, Any] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    async def load(
+        cls,
+        config: GraphRagConfig,
+        storage: PipelineStorage | None = None,
+        embedding_stores: dict[str, BaseVectorStore] | None = None,
+    ) -> "QueryEngine":
+        """Load the index tables present in the output storage of the config.
+
+        Tables that do not exist are left out; searches that need them raise a ValueError.
+        """
+        storage = storage or create_storage_from_config(config.output)
+        tables = {}
+        for name in [
+            "entities",
+            "communities",
+            "community_reports",
+            "relationships",
+            "covariates",
+        ]:
+            if await storage_has_table(name, storage):
+                tables[name] = await load_table_from_storage(name, storage)
+        if await storage_has_table("text_units", storage):
+            tables["text_units"] = await load_memory_mapped_table_from_storage(
+                "text_units", storage
+            )
+        return cls(config, **tables, embedding_stores=embedding_stores)
+
+    async def global_search(
+        self,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> SearchResult:
+        """Perform a global search and return the response and context data."""
+        return await self._collect(
+            lambda callbacks: self.global_search_streaming(
+                query,
+                community_level=community_level,
+                dynamic_community_selection=dynamic_community_selection,
+                response_type=response_type,
+                callbacks=callbacks,
+            ),
+            callbacks,
+        )
+
+    def global_search_streaming(
+        self,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a global search and stream the response back."""
+        search_engine = get_global_search_engine(
+            self.config,
+            reports=self._reports(community_level, dynamic_community_selection),
+            entities=self._entities(community_level),
+            communities=self._communities(),
+            response_type=response_type,
+            dynamic_community_selection=dynamic_community_selection,
+            map_system_prompt=self._prompt(self.config.global_search.map_prompt),
+            reduce_system_prompt=self._prompt(self.config.global_search.reduce_prompt),
+            general_knowledge_inclusion_prompt=self._prompt(
+                self.config.global_search.knowledge_prompt
+            ),
+            callbacks=callbacks,
+            # the dynamic community selection holds an asyncio semaphore, which is
+            # bound to the event loop of its search, so its builder is not kept
+            context_builder=None
+            if dynamic_community_selection
+            else self._context_builder(("global", community_level)),
+        )
+        if not dynamic_community_selection:
+            self._keep_context_builder(("global", community_level), search_engine)
+        return search_engine.stream_search(query=query)
+
+    async def local_search(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> SearchResult:
+        """Perform a local search and return the response and context data."""
+        return await self._collect(
+            lambda callbacks: self.local_search_streaming(
+                query,
+                community_level=community_level,
+                response_type=response_type,
+                callbacks=callbacks,
+            ),
+            callbacks,
+        )
+
+    def local_search_streaming(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a local search and stream the response back."""
+        search_engine = get_local_search_engine(
+            config=self.config,
+            reports=self._reports(community_level),
+            text_units=self._text_units(),
+            entities=self._entities(community_level),
+            relationships=self._relationships(),
+            covariates={"claims": self._covariates()},
+            description_embedding_store=self._embedding_store(
+                entity_description_embedding
+            ),
+            response_type=response_type,
+            system_prompt=self._prompt(self.config.local_search.prompt),
+            callbacks=callbacks,
+            context_builder=self._context_builder(("local", community_level)),
+        )
+        self._keep_context_builder(("local", community_level), search_engine)
+        return search_engine.stream_search(query=query)
+
+    async def drift_search(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> SearchResult:
+        """Perform a DRIFT search and return the response and context data."""
+        return await self._collect(
+            lambda callbacks: self.drift_search_streaming(
+                query,
+                community_level=community_level,
+                response_type=response_type,
+                callbacks=callbacks,
+            ),
+            callbacks,
+        )
+
+    def drift_search_streaming(
+        self,
+        query: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a DRIFT search and stream the response back."""
+        # the DRIFT context builder bakes the response type into its prompts
+        key = ("drift", community_level, response_type)
+        search_engine = get_drift_search_engine(
+            config=self.config,
+            reports=self._drift_reports(community_level),
+            text_units=self._text_units(),
+            entities=self._entities(community_level),
+            relationships=self._relationships(),
+            description_embedding_store=self._embedding_store(
+                entity_description_embedding
+            ),
+            local_system_prompt=self._prompt(self.config.drift_search.prompt),
+            reduce_system_prompt=self._prompt(self.config.drift_search.reduce_prompt),
+            response_type=response_type,
+            callbacks=callbacks,
+            context_builder=self._context_builder(key),
+        )
+        self._keep_context_builder(key, search_engine)
+        return search_engine.stream_search(query=query)
+
+    async def basic_search(
+        self,
+        query: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> SearchResult:
+        """Perform a basic search and return the response and context data."""
+        return await self._collect(
+            lambda callbacks: self.basic_search_streaming(query, callbacks=callbacks),
+            callbacks,
+        )
+
+    def basic_search_streaming(
+        self,
+        query: str,
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator:
+        """Perform a basic search and stream the response back."""
+        search_engine = get_basic_search_engine(
+            config=self.config,
+            text_units=self._text_units(),
+            text_unit_embeddings=self._embedding_store(text_unit_text_embedding),
+            system_prompt=self._prompt(self.config.basic_search.prompt),
+            callbacks=callbacks,
+            context_builder=self._context_builder(("basic",)),
+        )
+        self._keep_context_builder(("basic",), search_engine)
+        return search_engine.stream_search(query=query)
+
+    async def _collect(
+        self,
+        stream: Callable[[list[QueryCallbacks]], AsyncGenerator],
+        callbacks: list[QueryCallbacks] | None,
+    ) -> SearchResult:
+        full_response = ""
+        context_data = {}
+
+        def on_context(context: Any) -> None:
+            nonlocal context_data
+            context_data = context
+
+        local_callbacks = NoopQueryCallbacks()
+        local_callbacks.on_context = on_context
+
+        async for chunk in stream([*(callbacks or []), local_callbacks]):
+            full_response += chunk
+        return full_response, context_data
+
+    def _cached(self, key: tuple, create: Callable[[], T]) -> T:
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = create()
+            return self._cache[key]
+
+    def _context_builder(self, key: tuple) -> Any:
+        with self._lock:
+            return self._context_builders.get(key)
+
+    def _keep_context_builder(self, key: tuple, search_engine: Any) -> None:
+        # the first search of a kind builds the context builder, later ones reuse it
+        with self._lock:
+            self._context_builders.setdefault(key, search_engine.context_builder)
+
+    def _table(self, name: str) -> Any:
+        table = self._tables[name]
+        if table is None:
+            msg = f"The {name} table is required for this search but was not loaded"
+            raise ValueError(msg)
+        return table
+
+    def _prompt(self, prompt_config: str | None) -> str | None:
+        return self._cached(
+            ("prompt", prompt_config),
+            lambda: load_search_prompt(self.config.root_dir, prompt_config),
+        )
+
+    def _embedding_store(self, embedding_name: str) -> BaseVectorStore:
+        def connect() -> BaseVectorStore:
+            if embedding_name in self._embedding_stores:
+                return self._embedding_stores[embedding_name]
+            vector_store_args = {
+                index: store.model_dump()
+                for index, store in self.config.vector_store.items()
+            }
+            msg = f"Vector Store Args: {redact(vector_store_args)}"
+            logger.info(msg)
+            return get_embedding_store(
+                config_args=vector_store_args,
+                embedding_name=embedding_name,
+            )
+
+        return self._cached(("embedding_store", embedding_name), connect)
+
+    def _entities(self, community_level: int | None) -> list[Entity]:
+        return self._cached(
+            ("entities", community_level),
+            lambda: read_indexer_entities(
+                self._table("entities"),
+                self._table("communities"),
+                community_level=community_level,
+            ),
+        )
+
+    def _reports(
+        self, community_level: int | None, dynamic_community_selection: bool = False
+    ) -> list[CommunityReport]:
+        return self._cached(
+            ("reports", community_level, dynamic_community_selection),
+            lambda: read_indexer_reports(
+                self._table("community_reports"),
+                self._table("communities"),
+                community_level=community_level,
+                dynamic_community_selection=dynamic_community_selection,
+            ),
+        )
+
+    def _drift_reports(self, community_level: int) -> list[CommunityReport]:
+        def read() -> list[CommunityReport]:
+            reports = read_indexer_reports(
+                self._table("community_reports"),
+                self._table("communities"),
+                community_level=community_level,
+            )
+            read_indexer_report_embeddings(
+                reports, self._embedding_store(community_full_content_embedding)
+            )
+            return reports
+
+        return self._cached(("drift_reports", community_level), read)
+
+    def _communities(self) -> list[Community]:
+        return self._cached(
+            ("communities",),
+            lambda: read_indexer_communities(
+                self._table("communities"), self._table("community_reports")
+            ),
+        )
+
+    def _relationships(self) -> list[Relationship]:
+        return self._cached(
+            ("relationships",),
+            lambda: read_indexer_relationships(self._table("relationships")),
+        )
+
+    def _covariates(self) -> list[Covariate]:
+        covariates = self._tables["covariates"]
+        if covariates is None:
+            return []
+        return self._cached(
+            ("covariates",), lambda: read_indexer_covariates(covariates)
+        )
+
+    def _text_units(self) -> list[TextUnit] | Mapping[str, TextUnit]:
+        def read() -> list[TextUnit] | Mapping[str, TextUnit]:
+            text_units = self._table("text_units")
+            if isinstance(text_units, pa.Table):
+                return read_indexer_text_unit_records(text_units)
+            return read_indexer_text_units(text_units)
+
+        return self._cached(("text_units",), read)
@@ -3,6 +3,8 @@
 
 """Query Factory methods to support CLI."""
 
+from collections.abc import Mapping
+
 import tiktoken
 
 from graphrag.callbacks.query_callbacks import QueryCallbacks
@@ -37,7 +39,7 @@ from graphrag.vector_stores.base import BaseVectorStore
 def get_local_search_engine(
     config: GraphRagConfig,
     reports: list[CommunityReport],
-    text_units: list[TextUnit],
+    text_units: list[TextUnit] | Mapping[str, TextUnit],
     entities: list[Entity],
     relationships: list[Relationship],
     covariates: dict[str, list[Covariate]],
@@ -45,8 +47,13 @@ def get_local_search_engine(
     description_embedding_store: BaseVectorStore,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: LocalSearchMixedContext | None = None,
 ) -> LocalSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    A prebuilt `context_builder` is reused as is, so that searches over the same loaded
+    index do not rebuild it.
+    """
     model_settings = config.get_language_model_config(config.local_search.chat_model_id)
 
     if model_settings.max_retries == -1:
@@ -77,10 +84,8 @@ def get_local_search_engine(
 
     ls_config = config.local_search
 
-    return LocalSearch(
-        model=chat_model,
-        system_prompt=system_prompt,
-        context_builder=LocalSearchMixedContext(
+    if context_builder is None:
+        context_builder = LocalSearchMixedContext(
             community_reports=reports,
             text_units=text_units,
             entities=entities,
@@ -90,7 +95,12 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=embedding_model,
             token_encoder=token_encoder,
-        ),
+        )
+
+    return LocalSearch(
+        model=chat_model,
+        system_prompt=system_prompt,
+        context_builder=context_builder,
         token_encoder=token_encoder,
         model_params={
             "max_tokens": ls_config.llm_max_tokens,  # change this based on the token limit you have on your model (if you are using a model with 8k limit, a good setting could be 1000=1500)
@@ -128,8 +138,13 @@ def get_global_search_engine(
     reduce_system_prompt: str | None = None,
     general_knowledge_inclusion_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: GlobalCommunityContext | None = None,
 ) -> GlobalSearch:
-    """Create a global search engine based on data + configuration."""
+    """Create a global search engine based on data + configuration.
+
+    A prebuilt `context_builder` is reused as is, so that searches over the same loaded
+    index do not rebuild it.
+    """
     # TODO: Global search should select model based on config??
     model_settings = config.get_language_model_config(
         config.global_search.chat_model_id
@@ -148,7 +163,7 @@ def get_global_search_engine(
     gs_config = config.global_search
 
     dynamic_community_selection_kwargs = {}
-    if dynamic_community_selection:
+    if dynamic_community_selection and context_builder is None:
         # TODO: Allow for another llm definition only for Global Search to leverage -mini models
 
         dynamic_community_selection_kwargs.update({
@@ -163,19 +178,22 @@ def get_global_search_engine(
             "max_level": gs_config.dynamic_search_max_level,
         })
 
-    return GlobalSearch(
-        model=model,
-        map_system_prompt=map_system_prompt,
-        reduce_system_prompt=reduce_system_prompt,
-        general_knowledge_inclusion_prompt=general_knowledge_inclusion_prompt,
-        context_builder=GlobalCommunityContext(
+    if context_builder is None:
+        context_builder = GlobalCommunityContext(
             community_reports=reports,
             communities=communities,
             entities=entities,
             token_encoder=token_encoder,
             dynamic_community_selection=dynamic_community_selection,
             dynamic_community_selection_kwargs=dynamic_community_selection_kwargs,
-        ),
+        )
+
+    return GlobalSearch(
+        model=model,
+        map_system_prompt=map_system_prompt,
+        reduce_system_prompt=reduce_system_prompt,
+        general_knowledge_inclusion_prompt=general_knowledge_inclusion_prompt,
+        context_builder=context_builder,
         token_encoder=token_encoder,
         max_data_tokens=gs_config.data_max_tokens,
         map_llm_params={
@@ -213,7 +231,7 @@ def get_global_search_engine(
 def get_drift_search_engine(
     config: GraphRagConfig,
     reports: list[CommunityReport],
-    text_units: list[TextUnit],
+    text_units: list[TextUnit] | Mapping[str, TextUnit],
     entities: list[Entity],
     relationships: list[Relationship],
     description_embedding_store: BaseVectorStore,
@@ -221,8 +239,13 @@ def get_drift_search_engine(
     local_system_prompt: str | None = None,
     reduce_system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: DRIFTSearchContextBuilder | None = None,
 ) -> DRIFTSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    A prebuilt `context_builder` is reused as is, so that searches over the same loaded
+    index do not rebuild it.
+    """
     chat_model_settings = config.get_language_model_config(
         config.drift_search.chat_model_id
     )
@@ -255,9 +278,8 @@ def get_drift_search_engine(
     )
     token_encoder = tiktoken.get_encoding(chat_model_settings.encoding_model)
 
-    return DRIFTSearch(
-        model=chat_model,
-        context_builder=DRIFTSearchContextBuilder(
+    if context_builder is None:
+        context_builder = DRIFTSearchContextBuilder(
             model=chat_model,
             text_embedder=embedding_model,
             entities=entities,
@@ -269,20 +291,29 @@ def get_drift_search_engine(
             reduce_system_prompt=reduce_system_prompt,
             config=config.drift_search,
             response_type=response_type,
-        ),
+        )
+
+    return DRIFTSearch(
+        model=chat_model,
+        context_builder=context_builder,
         token_encoder=token_encoder,
         callbacks=callbacks,
     )
 
 
 def get_basic_search_engine(
-    text_units: list[TextUnit],
+    text_units: list[TextUnit] | Mapping[str, TextUnit],
     text_unit_embeddings: BaseVectorStore,
     config: GraphRagConfig,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: BasicSearchContext | None = None,
 ) -> BasicSearch:
-    """Create a basic search engine based on data + configuration."""
+    """Create a basic search engine based on data + configuration.
+
+    A prebuilt `context_builder` is reused as is, so that searches over the same loaded
+    index do not rebuild it.
+    """
     chat_model_settings = config.get_language_model_config(
         config.basic_search.chat_model_id
     )
@@ -312,15 +343,18 @@ def get_basic_search_engine(
 
     ls_config = config.basic_search
 
-    return BasicSearch(
-        model=chat_model,
-        system_prompt=system_prompt,
-        context_builder=BasicSearchContext(
+    if context_builder is None:
+        context_builder = BasicSearchContext(
             text_embedder=embedding_model,
             text_unit_embeddings=text_unit_embeddings,
             text_units=text_units,
             token_encoder=token_encoder,
-        ),
+        )
+
+    return BasicSearch(
+        model=chat_model,
+        system_prompt=system_prompt,
+        context_builder=context_builder,
         token_encoder=token_encoder,
         model_params={
             "max_tokens": ls_config.llm_max_tokens,  # change this based on the token limit you have on your model (if you are using a model with 8k limit, a good setting could be 1000=1500)
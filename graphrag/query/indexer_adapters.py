@@ -10,6 +10,7 @@ import logging
 from typing import cast
 
 import pandas as pd
+import pyarrow as pa
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.community import Community
@@ -20,6 +21,7 @@ from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol.base import EmbeddingModel
+from graphrag.query.input.loaders.arrow import ArrowRecords
 from graphrag.query.input.loaders.dfs import (
     read_communities,
     read_community_reports,
@@ -42,6 +44,13 @@ def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
     )
 
 
+def read_indexer_text_unit_records(
+    final_text_units: pa.Table,
+) -> ArrowRecords[TextUnit]:
+    """Read in the Text Units from an Arrow table, converting rows only when looked up."""
+    return ArrowRecords(final_text_units, read_indexer_text_units)
+
+
 def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
     """Read in the Claims from the raw indexing outputs."""
     covariate_df = final_covariates
@@ -57,6 +66,7 @@ def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
             "description",
         ],
         text_unit_ids_col=None,
+        tokens_col="n_tokens",
     )
 
 
@@ -67,6 +77,7 @@ def read_indexer_relationships(final_relationships: pd.DataFrame) -> list[Relati
         short_id_col="human_readable_id",
         rank_col="combined_degree",
         description_embedding_col=None,
+        tokens_col="n_tokens",
         attributes_cols=None,
     )
 
@@ -124,6 +135,8 @@ def read_indexer_reports(
         id_col="id",
         short_id_col="community",
         content_embedding_col=content_embedding_col,
+        summary_tokens_col="summary_n_tokens",
+        content_tokens_col="full_content_n_tokens",
     )
 
 
@@ -175,6 +188,7 @@ def read_indexer_entities(
         name_embedding_col=None,
         description_embedding_col="description_embedding",
         text_unit_ids_col="text_unit_ids",
+        tokens_col="n_tokens",
     )
 
 
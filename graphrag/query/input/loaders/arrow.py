@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Serve data objects from Arrow tables without converting every row up front."""
+
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Generic, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+
+T = TypeVar("T")
+
+
+class ArrowRecords(Mapping[str, T], Generic[T]):
+    """Rows of an Arrow table keyed by id, converted to data objects on first access.
+
+    Only the key column is decoded to Python up front. Other columns stay in the table,
+    which is memory-mapped when it was read from an Arrow IPC file, see
+    `load_memory_mapped_table_from_storage`, and are exposed as Arrow arrays through
+    `column`.
+    Rows are converted with the same dataframe reader as an eagerly loaded index, a batch
+    of rows at a time, and the resulting objects are kept for later lookups.
+    """
+
+    def __init__(
+        self,
+        table: pa.Table,
+        read_rows: Callable[[pd.DataFrame], list[T]],
+        key_col: str = "id",
+    ):
+        self.table = table
+        self._read_rows = read_rows
+        # later rows win over earlier rows with the same key, as in a dict comprehension
+        self._positions = {
+            key: position
+            for position, key in enumerate(table.column(key_col).to_pylist())
+        }
+        self._rows: dict[str, T] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def materialized(self) -> int:
+        """Number of rows converted to data objects so far."""
+        return len(self._rows)
+
+    def column(self, name: str) -> pa.ChunkedArray:
+        """Return a column as an Arrow array, in table order, without converting it."""
+        return self.table.column(name)
+
+    def sort_keys(self, keys: Iterable[str]) -> list[str]:
+        """Return the given keys that have a row, in table order, without converting them."""
+        return sorted(
+            (key for key in set(keys) if key in self._positions),
+            key=self._positions.__getitem__,
+        )
+
+    def get_many(self, keys: Iterable[str]) -> list[T]:
+        """Return the objects of the given keys, converting missing rows in one batch."""
+        keys = list(keys)
+        with self._lock:
+            missing = list(dict.fromkeys(key for key in keys if key not in self._rows))
+        if missing:
+            positions = [self._positions[key] for key in missing]
+            rows = self.table.take(positions).to_pandas()
+            # keep the table positions, readers derive fallback short ids from the index
+            rows.index = pd.Index(positions)
+            converted = dict(zip(missing, self._read_rows(rows), strict=True))
+            with self._lock:
+                for key, row in converted.items():
+                    self._rows.setdefault(key, row)
+        with self._lock:
+            return [self._rows[key] for key in keys]
+
+    def __getitem__(self, key: str) -> T:
+        """Return the object of a key, converting its row if needed."""
+        if key not in self._positions:
+            raise KeyError(key)
+        return self.get_many([key])[0]
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the table has a row with the key, without converting it."""
+        return key in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in table order."""
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._positions)
@@ -44,6 +44,8 @@ def read_entities(
     community_col: str | None = "community_ids",
     text_unit_ids_col: str | None = "text_unit_ids",
     rank_col: str | None = "degree",
+    tokens_col: str | None = "n_tokens",
+    tokens_encoding_col: str | None = "tokens_encoding",
     attributes_cols: list[str] | None = None,
 ) -> list[Entity]:
     """Read entities from a dataframe using pre-converted records."""
@@ -64,6 +66,12 @@ def read_entities(
             community_ids=to_optional_list(row, community_col, item_type=str),
             text_unit_ids=to_optional_list(row, text_unit_ids_col),
             rank=to_optional_int(row, rank_col),
+            n_tokens=to_optional_int(row, tokens_col),
+            tokens_encoding=(
+                to_optional_str(row, tokens_encoding_col)
+                if tokens_encoding_col in row
+                else None
+            ),
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
                 if attributes_cols
@@ -85,6 +93,8 @@ def read_relationships(
     description_embedding_col: str | None = "description_embedding",
     weight_col: str | None = "weight",
     text_unit_ids_col: str | None = "text_unit_ids",
+    tokens_col: str | None = "n_tokens",
+    tokens_encoding_col: str | None = "tokens_encoding",
     attributes_cols: list[str] | None = None,
 ) -> list[Relationship]:
     """Read relationships from a dataframe using pre-converted records."""
@@ -104,6 +114,12 @@ def read_relationships(
             weight=to_optional_float(row, weight_col),
             text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
             rank=to_optional_int(row, rank_col),
+            n_tokens=to_optional_int(row, tokens_col),
+            tokens_encoding=(
+                to_optional_str(row, tokens_encoding_col)
+                if tokens_encoding_col in row
+                else None
+            ),
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
                 if attributes_cols
@@ -121,6 +137,8 @@ def read_covariates(
     subject_col: str = "subject_id",
     covariate_type_col: str | None = "type",
     text_unit_ids_col: str | None = "text_unit_ids",
+    tokens_col: str | None = "n_tokens",
+    tokens_encoding_col: str | None = "tokens_encoding",
     attributes_cols: list[str] | None = None,
 ) -> list[Covariate]:
     """Read covariates from a dataframe using pre-converted records."""
@@ -136,6 +154,12 @@ def read_covariates(
                 to_str(row, covariate_type_col) if covariate_type_col else "claim"
             ),
             text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
+            n_tokens=to_optional_int(row, tokens_col),
+            tokens_encoding=(
+                to_optional_str(row, tokens_encoding_col)
+                if tokens_encoding_col in row
+                else None
+            ),
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
                 if attributes_cols
@@ -196,6 +220,9 @@ def read_community_reports(
     content_col: str = "full_content",
     rank_col: str | None = "rank",
     content_embedding_col: str | None = "full_content_embedding",
+    summary_tokens_col: str | None = "summary_n_tokens",
+    content_tokens_col: str | None = "full_content_n_tokens",
+    tokens_encoding_col: str | None = "tokens_encoding",
     attributes_cols: list[str] | None = None,
 ) -> list[CommunityReport]:
     """Read community reports from a dataframe using pre-converted records."""
@@ -214,6 +241,13 @@ def read_community_reports(
             full_content_embedding=to_optional_list(
                 row, content_embedding_col, item_type=float
             ),
+            summary_n_tokens=to_optional_int(row, summary_tokens_col),
+            full_content_n_tokens=to_optional_int(row, content_tokens_col),
+            tokens_encoding=(
+                to_optional_str(row, tokens_encoding_col)
+                if tokens_encoding_col in row
+                else None
+            ),
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
                 if attributes_cols
@@ -232,6 +266,8 @@ def read_text_units(
     relationships_col: str | None = "relationship_ids",
     covariates_col: str | None = "covariate_ids",
     tokens_col: str | None = "n_tokens",
+    text_tokens_col: str | None = "text_n_tokens",
+    tokens_encoding_col: str | None = "tokens_encoding",
     document_ids_col: str | None = "document_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[TextUnit]:
@@ -248,6 +284,12 @@ def read_text_units(
                 row, covariates_col, key_type=str, value_type=str
             ),
             n_tokens=to_optional_int(row, tokens_col),
+            text_n_tokens=to_optional_int(row, text_tokens_col),
+            tokens_encoding=(
+                to_optional_str(row, tokens_encoding_col)
+                if tokens_encoding_col in row
+                else None
+            ),
             document_ids=to_optional_list(row, document_ids_col, item_type=str),
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
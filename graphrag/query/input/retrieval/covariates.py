@@ -3,6 +3,9 @@
 
 """Util functions to retrieve covariates from a collection."""
 
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import chain
 from typing import Any, cast
 
 import pandas as pd
@@ -11,12 +14,44 @@ from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
 
 
+class CovariateIndex:
+    """Query-time index of a fixed collection of covariates by subject.
+
+    Built once when the covariates are loaded, so that selecting the covariates of a
+    set of entities costs the number of matching covariates rather than a scan of the
+    whole collection.
+    """
+
+    def __init__(self, covariates: Iterable[Covariate]):
+        self.covariates = list(covariates)
+        positions: dict[str, list[int]] = defaultdict(list)
+        for position, covariate in enumerate(self.covariates):
+            positions[covariate.subject_id].append(position)
+        self._positions = dict(positions)
+
+    def by_subject(self, subject_id: str) -> list[Covariate]:
+        """Get the covariates of a subject, in collection order."""
+        return [
+            self.covariates[position]
+            for position in self._positions.get(subject_id, ())
+        ]
+
+    def by_subjects(self, subject_ids: Iterable[str]) -> list[Covariate]:
+        """Get the covariates of any of the subjects, in collection order."""
+        positions = chain.from_iterable(
+            self._positions.get(subject_id, ()) for subject_id in set(subject_ids)
+        )
+        return [self.covariates[position] for position in sorted(positions)]
+
+
 def get_candidate_covariates(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: list[Covariate] | CovariateIndex,
 ) -> list[Covariate]:
     """Get all covariates that are related to selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if isinstance(covariates, CovariateIndex):
+        return covariates.by_subjects(selected_entity_names)
     return [
         covariate
         for covariate in covariates
@@ -4,6 +4,7 @@
 """Util functions to get entities from a collection."""
 
 import uuid
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any, cast
 
@@ -12,6 +13,66 @@ import pandas as pd
 from graphrag.data_model.entity import Entity
 
 
+class EntityIndex:
+    """Query-time lookup index over a fixed collection of entities.
+
+    Lookups by an entity attribute go through a dictionary from attribute value to the
+    position of the first entity holding it, built on the first lookup by that
+    attribute. The entities sorted by rank are cached as well, so mapping a query to
+    entities does not scan the collection. Results are identical to the scanning
+    helpers in this module.
+    """
+
+    def __init__(self, entities: Iterable[Entity]):
+        self.entities = list(entities)
+        self._positions: dict[str, dict[Any, int]] = {}
+        self._by_title: dict[str, list[Entity]] | None = None
+        self._by_rank: list[Entity] | None = None
+
+    def get_by_key(self, key: str, value: str | int) -> Entity | None:
+        """Get entity by key, like `get_entity_by_key`."""
+        positions = self._key_positions(key)
+        if positions is None:
+            return get_entity_by_key(self.entities, key, value)
+        candidates = (
+            (value, value.replace("-", ""))
+            if isinstance(value, str) and is_valid_uuid(value)
+            else (value,)
+        )
+        # the first entity holding either form of the value wins
+        matches = [positions[value] for value in candidates if value in positions]
+        return self.entities[min(matches)] if matches else None
+
+    def get_by_name(self, entity_name: str) -> list[Entity]:
+        """Get entities by name, like `get_entity_by_name`."""
+        if self._by_title is None:
+            self._by_title = defaultdict(list)
+            for entity in self.entities:
+                self._by_title[entity.title].append(entity)
+        return list(self._by_title.get(entity_name, []))
+
+    def top_ranked(self, k: int) -> list[Entity]:
+        """Get the k entities with the highest rank, ties in collection order."""
+        if self._by_rank is None:
+            self._by_rank = sorted(
+                self.entities, key=lambda x: x.rank if x.rank else 0, reverse=True
+            )
+        return self._by_rank[:k]
+
+    def _key_positions(self, key: str) -> dict[Any, int] | None:
+        positions = self._positions.get(key)
+        if positions is None:
+            positions = {}
+            try:
+                for position, entity in enumerate(self.entities):
+                    positions.setdefault(getattr(entity, key), position)
+            except TypeError:
+                # unhashable attribute values can only be scanned
+                return None
+            self._positions[key] = positions
+        return positions
+
+
 def get_entity_by_id(entities: dict[str, Entity], value: str) -> Entity | None:
     """Get entity by id."""
     entity = entities.get(value)
@@ -3,6 +3,9 @@
 
 """Util functions to retrieve relationships from a collection."""
 
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import chain
 from typing import Any, cast
 
 import pandas as pd
@@ -11,13 +14,121 @@ from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 
 
+class RelationshipIndex:
+    """Query-time adjacency index over a fixed collection of relationships.
+
+    Maps every entity title to the positions of the relationships it takes part in and
+    pre-sorts the relationships by rank once, so that selecting the relationships of a
+    set of entities costs the size of their neighborhood rather than a scan of the
+    whole collection. Results are identical to the list based selection, including the
+    order of relationships with equal ranks.
+    """
+
+    def __init__(self, relationships: Iterable[Relationship]):
+        self.relationships = list(relationships)
+        adjacency: dict[str, list[int]] = defaultdict(list)
+        for position, relationship in enumerate(self.relationships):
+            adjacency[relationship.source].append(position)
+            if relationship.target != relationship.source:
+                adjacency[relationship.target].append(position)
+        self._adjacency = dict(adjacency)
+
+        # dense rank buckets, 0 being the highest rank, ties keep their collection order
+        ranks = [
+            _relationship_rank(relationship) for relationship in self.relationships
+        ]
+        buckets = {
+            rank: bucket for bucket, rank in enumerate(sorted(set(ranks), reverse=True))
+        }
+        self._rank_buckets = [buckets[rank] for rank in ranks]
+
+    def neighborhood(self, entity_names: Iterable[str]) -> list[Relationship]:
+        """Get the relationships attached to any of the entities, in collection order."""
+        return [
+            self.relationships[position]
+            for position in self._neighborhood_positions(entity_names)
+        ]
+
+    def in_network(
+        self, entity_names: set[str], ranking_attribute: str = "rank"
+    ) -> list[Relationship]:
+        """Get the relationships between the entities, sorted by ranking_attribute."""
+        positions = [
+            position
+            for position in self._neighborhood_positions(entity_names)
+            if self.relationships[position].source in entity_names
+            and self.relationships[position].target in entity_names
+        ]
+        if len(positions) <= 1:
+            return [self.relationships[position] for position in positions]
+        return self._sort_by_rank(positions, [], ranking_attribute)
+
+    def out_network(
+        self, entity_names: set[str], ranking_attribute: str = "rank"
+    ) -> list[Relationship]:
+        """Get the relationships from the entities to other entities, sorted by ranking_attribute.
+
+        Outgoing relationships precede incoming ones among equally ranked relationships.
+        """
+        source_positions = []
+        target_positions = []
+        for position in self._neighborhood_positions(entity_names):
+            relationship = self.relationships[position]
+            source_selected = relationship.source in entity_names
+            if source_selected != (relationship.target in entity_names):
+                if source_selected:
+                    source_positions.append(position)
+                else:
+                    target_positions.append(position)
+        return self._sort_by_rank(source_positions, target_positions, ranking_attribute)
+
+    def _neighborhood_positions(self, entity_names: Iterable[str]) -> list[int]:
+        return sorted(
+            set(
+                chain.from_iterable(
+                    self._adjacency.get(name, ()) for name in entity_names
+                )
+            )
+        )
+
+    def _sort_by_rank(
+        self,
+        first_positions: list[int],
+        second_positions: list[int],
+        ranking_attribute: str,
+    ) -> list[Relationship]:
+        """Sort the concatenation of both position lists like `sort_relationships_by_rank`."""
+        selected = [
+            self.relationships[position]
+            for position in chain(first_positions, second_positions)
+        ]
+        first = selected[0] if selected else None
+        if (
+            first is None
+            or ranking_attribute != "rank"
+            or (first.attributes and ranking_attribute in first.attributes)
+        ):
+            return sort_relationships_by_rank(selected, ranking_attribute)
+        buckets = self._rank_buckets
+        keyed = [(buckets[position], 0, position) for position in first_positions]
+        keyed.extend((buckets[position], 1, position) for position in second_positions)
+        keyed.sort()
+        return [self.relationships[position] for _, _, position in keyed]
+
+
+def _relationship_rank(relationship: Relationship) -> float:
+    return relationship.rank if relationship.rank else 0.0
+
+
 def get_in_network_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: list[Relationship] | RelationshipIndex,
     ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Get all directed relationships between selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if isinstance(relationships, RelationshipIndex):
+        return relationships.in_network(selected_entity_names, ranking_attribute)
     selected_relationships = [
         relationship
         for relationship in relationships
@@ -33,11 +144,13 @@ def get_in_network_relationships(
 
 def get_out_network_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: list[Relationship] | RelationshipIndex,
     ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if isinstance(relationships, RelationshipIndex):
+        return relationships.out_network(selected_entity_names, ranking_attribute)
     source_relationships = [
         relationship
         for relationship in relationships
@@ -56,10 +169,12 @@ def get_out_network_relationships(
 
 def get_candidate_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: list[Relationship] | RelationshipIndex,
 ) -> list[Relationship]:
     """Get all relationships that are associated with the selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    if isinstance(relationships, RelationshipIndex):
+        return relationships.neighborhood(selected_entity_names)
     return [
         relationship
         for relationship in relationships
@@ -72,9 +187,9 @@ def get_entities_from_relationships(
     relationships: list[Relationship], entities: list[Entity]
 ) -> list[Entity]:
     """Get all entities that are associated with the selected relationships."""
-    selected_entity_names = [relationship.source for relationship in relationships] + [
+    selected_entity_names = {relationship.source for relationship in relationships} | {
         relationship.target for relationship in relationships
-    ]
+    }
     return [entity for entity in entities if entity.title in selected_entity_names]
 
 
@@ -3,24 +3,47 @@
 
 """Util functions to retrieve text units from a collection."""
 
+from collections.abc import Iterable, Mapping
 from typing import Any, cast
 
 import pandas as pd
 
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.input.loaders.arrow import ArrowRecords
+
+
+def get_text_units(
+    text_units: Mapping[str, TextUnit], text_ids: Iterable[str]
+) -> dict[str, TextUnit]:
+    """Look up the text units of the ids that are in the collection, in id order.
+
+    The rows of an ArrowRecords collection are converted in one batch.
+    """
+    text_ids = [text_id for text_id in dict.fromkeys(text_ids) if text_id in text_units]
+    if isinstance(text_units, ArrowRecords):
+        return dict(zip(text_ids, text_units.get_many(text_ids), strict=True))
+    return {text_id: text_units[text_id] for text_id in text_ids}
 
 
 def get_candidate_text_units(
     selected_entities: list[Entity],
-    text_units: list[TextUnit],
+    text_units: list[TextUnit] | Mapping[str, TextUnit],
 ) -> pd.DataFrame:
     """Get all text units that are associated to selected entities."""
-    selected_text_ids = [
-        entity.text_unit_ids for entity in selected_entities if entity.text_unit_ids
-    ]
-    selected_text_ids = [item for sublist in selected_text_ids for item in sublist]
-    selected_text_units = [unit for unit in text_units if unit.id in selected_text_ids]
+    selected_text_ids = {
+        text_id
+        for entity in selected_entities
+        for text_id in entity.text_unit_ids or []
+    }
+    if isinstance(text_units, ArrowRecords):
+        # only look up the selected units, in table order, in one batch
+        selected_text_units = text_units.get_many(
+            text_units.sort_keys(selected_text_ids)
+        )
+    else:
+        units = text_units.values() if isinstance(text_units, Mapping) else text_units
+        selected_text_units = [unit for unit in units if unit.id in selected_text_ids]
     return to_text_unit_dataframe(selected_text_units)
 
 
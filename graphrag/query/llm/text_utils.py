@@ -3,11 +3,16 @@
 
 """Text Utilities for LLM."""
 
+import hashlib
 import json
 import logging
 import re
-from collections.abc import Iterator
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from itertools import islice
+from typing import NamedTuple, TypeVar
 
 import tiktoken
 from json_repair import repair_json
@@ -16,12 +21,293 @@ import graphrag.config.defaults as defs
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+TOKEN_COUNT_CACHE_SIZE = 100_000
+"""Default number of token counts a `TokenCounter` remembers, under 20 MB."""
+
+TOKEN_COUNT_BATCH_SIZE = 32
+"""Number of candidate rows encoded together by `TokenCounter.counted`."""
+
+TOKEN_HINT_MARGIN = 2
+"""Tokens added to a hinted row, one for each end of its pre-counted field."""
+
 
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
     """Return the number of tokens in the given text."""
+    return get_token_counter(token_encoder).count(text)
+
+
+class TokenHint(NamedTuple):
+    """Token count of a row whose long field was counted ahead of time.
+
+    The indexer persists the token count of descriptions, report contents and text
+    units, so a row is counted as the tokens of the text before and after that field,
+    each encoded on its own, plus the persisted count and `TOKEN_HINT_MARGIN`.
+    Encoding the two sides separately keeps their delimiters from merging into one
+    token, and the margin covers a token split differently where the field meets
+    them, so the count does not fall below the tokens of the whole row. A hint is
+    only used by a counter whose encoder has the name of the encoding the field was
+    counted with.
+    """
+
+    prefix: str
+    """The row text before the pre-counted field."""
+
+    suffix: str
+    """The row text after the pre-counted field."""
+
+    field_tokens: int
+    """The persisted token count of the field."""
+
+    encoding: str
+    """The name of the encoding the field was counted with."""
+
+
+def row_token_hint(
+    fields: Sequence[str],
+    field: int,
+    field_tokens: int | None,
+    tokens_encoding: str | None,
+    column_delimiter: str = "|",
+) -> TokenHint | None:
+    """Return the hint of a context table row whose fields[field] was pre-counted.
+
+    Returns None, so that the whole row is encoded, when there is no persisted count
+    or no record of the encoding it was made with.
+    """
+    if field_tokens is None or tokens_encoding is None:
+        return None
+    return TokenHint(
+        "".join(value + column_delimiter for value in fields[:field]),
+        "".join(column_delimiter + value for value in fields[field + 1 :]) + "\n",
+        field_tokens,
+        tokens_encoding,
+    )
+
+
+class TokenCounter:
+    """Memoizing token counter for one encoder.
+
+    Counts of recently seen texts are kept in a bounded LRU, so stable strings such as
+    entity, relationship and report rows are encoded once across queries. The LRU is
+    keyed by a 16 byte digest of each text rather than the text itself, so an entry
+    costs the same whatever the length of its text. Texts that are not remembered are
+    encoded together with the encoder's `encode_batch`.
+    """
+
+    def __init__(
+        self,
+        token_encoder: tiktoken.Encoding,
+        max_entries: int = TOKEN_COUNT_CACHE_SIZE,
+    ):
+        self._encoder = token_encoder
+        self._encoding: str | None = getattr(token_encoder, "name", None)
+        self._max_entries = max_entries
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        """Number of token counts remembered, 0 if none are."""
+        return self._max_entries
+
+    def resize(self, max_entries: int) -> None:
+        """Change the number of token counts remembered, evicting the oldest."""
+        with self._lock:
+            self._max_entries = max(max_entries, 0)
+            self._evict()
+
+    def clear(self) -> None:
+        """Forget every remembered token count."""
+        with self._lock:
+            self._counts.clear()
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in the given text."""
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Return the number of tokens of every text."""
+        counts: list[int | None] = [None] * len(texts)
+        missing: dict[str, list[int]] = {}
+        keys = [_digest(text) for text in texts] if self._max_entries else []
+        if not keys:
+            for i, text in enumerate(texts):
+                missing.setdefault(text, []).append(i)
+        else:
+            with self._lock:
+                for i, (text, key) in enumerate(zip(texts, keys, strict=True)):
+                    count = self._counts.get(key)
+                    if count is None:
+                        missing.setdefault(text, []).append(i)
+                    else:
+                        self._counts.move_to_end(key)
+                        counts[i] = count
+        if missing:
+            for text, count in zip(missing, self._encode([*missing]), strict=True):
+                for i in missing[text]:
+                    counts[i] = count
+            if keys:
+                self._remember(missing, keys, counts)
+        return counts  # type: ignore
+
+    def counted(
+        self,
+        rows: Iterable[tuple[str, T] | tuple[str, T, TokenHint | None]],
+        batch_size: int = TOKEN_COUNT_BATCH_SIZE,
+    ) -> Iterator[tuple[str, T, int]]:
+        """Yield every (text, record) row with the token count of its text.
+
+        A row may carry a third TokenHint item, in which case only the text around
+        the pre-counted field is encoded, unless the hint was counted with another
+        encoding. Rows are pulled
+        and encoded batch_size at a time, so a consumer that stops early leaves the
+        remaining rows unbuilt and unencoded.
+        """
+        for batch in batched(iter(rows), batch_size):
+            hints = [
+                row[2] if len(row) > 2 and self._uses(row[2]) else None  # type: ignore
+                for row in batch
+            ]
+            counts = iter(
+                self.count_batch([
+                    text
+                    for row, hint in zip(batch, hints, strict=True)
+                    for text in (
+                        (hint.prefix, hint.suffix) if hint is not None else (row[0],)
+                    )
+                ])
+            )
+            for row, hint in zip(batch, hints, strict=True):
+                count = next(counts)
+                if hint is not None:
+                    count += next(counts) + hint.field_tokens + TOKEN_HINT_MARGIN
+                yield row[0], row[1], count
+
+    def _uses(self, hint: TokenHint | None) -> bool:
+        """Return True if the hint was counted with this counter's encoding."""
+        return hint is not None and hint.encoding == self._encoding
+
+    def _encode(self, texts: list[str]) -> list[int]:
+        encode_batch = getattr(self._encoder, "encode_batch", None)
+        if len(texts) == 1 or encode_batch is None:
+            return [len(self._encoder.encode(text)) for text in texts]
+        return [len(tokens) for tokens in encode_batch(texts)]
+
+    def _remember(
+        self, texts: dict[str, list[int]], keys: list[bytes], counts: list[int | None]
+    ) -> None:
+        with self._lock:
+            for positions in texts.values():
+                self._counts[keys[positions[0]]] = counts[positions[0]]  # type: ignore
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._counts) > self._max_entries:
+            self._counts.popitem(last=False)
+
+
+def _digest(text: str) -> bytes:
+    """Return the key of a text in a `TokenCounter`."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+_token_counters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_token_counters_lock = threading.Lock()
+_token_count_cache_size = TOKEN_COUNT_CACHE_SIZE
+
+
+def set_token_count_cache_size(max_entries: int) -> None:
+    """Set the number of token counts every shared counter remembers.
+
+    Applies to the counters already handed out by `get_token_counter` and to the ones
+    it creates later. 0 turns the memoization off.
+    """
+    global _token_count_cache_size
+    with _token_counters_lock:
+        _token_count_cache_size = max(max_entries, 0)
+        for counter in list(_token_counters.values()):
+            counter.resize(_token_count_cache_size)
+
+
+def get_token_counter(token_encoder: tiktoken.Encoding | None = None) -> TokenCounter:
+    """Return the shared token counter of an encoder, the default encoding if None."""
     if token_encoder is None:
         token_encoder = tiktoken.get_encoding(defs.ENCODING_MODEL)
-    return len(token_encoder.encode(text))  # type: ignore
+    with _token_counters_lock:
+        try:
+            counter = _token_counters.get(token_encoder)
+            if counter is None:
+                counter = _token_counters[token_encoder] = TokenCounter(
+                    token_encoder, _token_count_cache_size
+                )
+        except TypeError:
+            # encoders that cannot be weakly referenced get a private counter
+            return TokenCounter(token_encoder, _token_count_cache_size)
+    return counter
+
+
+class TokenBudget:
+    """Running token count of a context window against its maximum size.
+
+    Shared by the context builders: the header is spent up front, then candidate rows
+    are counted in batches and taken in order until the first one that does not fit.
+    """
+
+    def __init__(self, max_tokens: int, token_encoder: tiktoken.Encoding | None = None):
+        self.max_tokens = max_tokens
+        self.used = 0
+        self._counter = get_token_counter(token_encoder)
+
+    @property
+    def remaining(self) -> int:
+        """Tokens left before the budget is exceeded."""
+        return self.max_tokens - self.used
+
+    def spend(self, text: str) -> int:
+        """Count the text in, even if it exceeds the budget, and return its tokens."""
+        tokens = self._counter.count(text)
+        self.used += tokens
+        return tokens
+
+    def fit(
+        self, rows: Iterable[tuple[str, T] | tuple[str, T, TokenHint | None]]
+    ) -> Iterator[tuple[str, T]]:
+        """Take (text, record) rows in order while their text fits in the budget.
+
+        Rows may carry a TokenHint, see `TokenCounter.counted`.
+        """
+        for text, record, tokens in self._counter.counted(rows):
+            if self.used + tokens > self.max_tokens:
+                return
+            self.used += tokens
+            yield text, record
+
+
+def largest_fitting_prefix(size: int, fits: Callable[[int], bool]) -> int:
+    """Return the largest n in [1, size] such that fits(n), or 0 if fits(1) is False.
+
+    fits must be monotone: once a prefix exceeds the budget, every longer prefix does
+    too. Probes grow exponentially and then bisect, so only O(log n) prefixes are
+    evaluated instead of every one of them.
+    """
+    if size == 0 or not fits(1):
+        return 0
+    low, high = 1, 2
+    while high <= size and fits(high):
+        low, high = high, high * 2
+    high = min(high, size + 1)
+    # fits(low) holds and high is either past the end or does not fit
+    while high - low > 1:
+        middle = (low + high) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle
+    return low
 
 
 def batched(iterable: Iterator, n: int):
@@ -3,6 +3,8 @@
 
 """Basic Context Builder implementation."""
 
+from collections.abc import Mapping
+
 import pandas as pd
 import tiktoken
 
@@ -23,7 +25,7 @@ class BasicSearchContext(BasicContextBuilder):
         self,
         text_embedder: EmbeddingModel,
         text_unit_embeddings: BaseVectorStore,
-        text_units: list[TextUnit] | None = None,
+        text_units: list[TextUnit] | Mapping[str, TextUnit] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = "id",
     ):
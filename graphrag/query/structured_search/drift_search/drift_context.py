@@ -4,6 +4,7 @@
 """DRIFT Context Builder implementation."""
 
 import logging
+from collections.abc import Mapping
 from dataclasses import asdict
 from typing import Any
 
@@ -42,7 +43,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         text_embedder: EmbeddingModel,
         entities: list[Entity],
         entity_text_embeddings: BaseVectorStore,
-        text_units: list[TextUnit] | None = None,
+        text_units: list[TextUnit] | Mapping[str, TextUnit] | None = None,
         reports: list[CommunityReport] | None = None,
         relationships: list[Relationship] | None = None,
         covariates: dict[str, list[Covariate]] | None = None,
@@ -3,6 +3,7 @@
 """Algorithms to build context data for local search prompt."""
 
 import logging
+from collections.abc import Mapping
 from copy import deepcopy
 from typing import Any
 
@@ -39,7 +40,13 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
-from graphrag.query.input.retrieval.text_units import get_candidate_text_units
+from graphrag.query.input.retrieval.covariates import CovariateIndex
+from graphrag.query.input.retrieval.entities import EntityIndex
+from graphrag.query.input.retrieval.relationships import RelationshipIndex
+from graphrag.query.input.retrieval.text_units import (
+    get_candidate_text_units,
+    get_text_units,
+)
 from graphrag.query.llm.text_utils import num_tokens
 from graphrag.query.structured_search.base import LocalContextBuilder
 from graphrag.vector_stores.base import BaseVectorStore
@@ -55,7 +62,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         entities: list[Entity],
         entity_text_embeddings: BaseVectorStore,
         text_embedder: EmbeddingModel,
-        text_units: list[TextUnit] | None = None,
+        text_units: list[TextUnit] | Mapping[str, TextUnit] | None = None,
         community_reports: list[CommunityReport] | None = None,
         relationships: list[Relationship] | None = None,
         covariates: dict[str, list[Covariate]] | None = None,
@@ -71,14 +78,24 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if text_units is None:
             text_units = []
         self.entities = {entity.id: entity for entity in entities}
+        self.entity_index = EntityIndex(self.entities.values())
         self.community_reports = {
             community.community_id: community for community in community_reports
         }
-        self.text_units = {unit.id: unit for unit in text_units}
+        # a mapping, e.g. ArrowRecords, is used as is so rows are only read on lookup
+        self.text_units = (
+            text_units
+            if isinstance(text_units, Mapping)
+            else {unit.id: unit for unit in text_units}
+        )
         self.relationships = {
             relationship.id: relationship for relationship in relationships
         }
+        self.relationship_index = RelationshipIndex(self.relationships.values())
         self.covariates = covariates
+        self.covariate_indexes = {
+            name: CovariateIndex(values) for name, values in covariates.items()
+        }
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
@@ -146,6 +163,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            entity_index=self.entity_index,
         )
 
         # build context
@@ -318,19 +336,23 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_unit_ids_set = set()
 
         unit_info_list = []
-        relationship_values = list(self.relationships.values())
+        # look up every candidate unit at once, so lazily read rows convert in a batch
+        candidate_text_units = get_text_units(
+            self.text_units,
+            (
+                text_id
+                for entity in selected_entities
+                for text_id in entity.text_unit_ids or []
+            ),
+        )
 
         for index, entity in enumerate(selected_entities):
             # get matching relationships
-            entity_relationships = [
-                rel
-                for rel in relationship_values
-                if rel.source == entity.title or rel.target == entity.title
-            ]
+            entity_relationships = self.relationship_index.neighborhood([entity.title])
 
             for text_id in entity.text_unit_ids or []:
-                if text_id not in text_unit_ids_set and text_id in self.text_units:
-                    selected_unit = deepcopy(self.text_units[text_id])
+                if text_id not in text_unit_ids_set and text_id in candidate_text_units:
+                    selected_unit = deepcopy(candidate_text_units[text_id])
                     num_relationships = count_relationships(
                         entity_relationships, selected_unit
                     )
@@ -354,7 +376,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if return_candidate_context:
             candidate_context_data = get_candidate_text_units(
                 selected_entities=selected_entities,
-                text_units=list(self.text_units.values()),
+                text_units=self.text_units,
             )
             context_key = context_name.lower()
             if context_key not in context_data:
@@ -416,7 +438,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=self.relationship_index,
                 token_encoder=self.token_encoder,
                 max_tokens=max_tokens,
                 column_delimiter=column_delimiter,
@@ -435,7 +457,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             for covariate in self.covariates:
                 covariate_context, covariate_context_data = build_covariates_context(
                     selected_entities=added_entities,
-                    covariates=self.covariates[covariate],
+                    covariates=self.covariate_indexes[covariate],
                     token_encoder=self.token_encoder,
                     max_tokens=max_tokens,
                     column_delimiter=column_delimiter,
@@ -462,8 +484,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
                 entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
-                covariates=self.covariates,
+                relationships=self.relationship_index,
+                covariates=self.covariate_indexes,
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
@@ -3,9 +3,10 @@
 
 """Azure Blob Storage implementation of PipelineStorage."""
 
+import asyncio
 import logging
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -208,6 +209,31 @@ class BlobPipelineStorage(PipelineStorage):
         except Exception:
             log.exception("Error setting key %s: %s", key)
 
+    async def set_chunks(
+        self,
+        key: str,
+        chunks: Iterable[str] | Iterable[bytes],
+        encoding: str | None = None,
+    ) -> None:
+        """Upload the chunks as blocks of the blob as they come, in a worker thread."""
+        try:
+            key = self._keyname(key)
+            container_client = self._blob_service_client.get_container_client(
+                self._container_name
+            )
+            blob_client = container_client.get_blob_client(key)
+            coding = encoding or self._encoding
+            await asyncio.to_thread(
+                blob_client.upload_blob,
+                (
+                    chunk.encode(coding) if isinstance(chunk, str) else chunk
+                    for chunk in chunks
+                ),
+                overwrite=True,
+            )
+        except Exception:
+            log.exception("Error setting key %s", key)
+
     def _set_df_json(self, key: str, dataframe: Any) -> None:
         """Set a json dataframe."""
         if self._connection_string is None and self._storage_account_name:
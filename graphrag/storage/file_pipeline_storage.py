@@ -3,11 +3,12 @@
 
 """A module containing 'FileStorage' and 'FilePipelineStorage' models."""
 
+import asyncio
 import logging
 import os
 import re
 import shutil
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
@@ -124,6 +125,20 @@ class FilePipelineStorage(PipelineStorage):
         ) as f:
             await f.write(value)
 
+    async def set_chunks(
+        self,
+        key: str,
+        chunks: Iterable[str] | Iterable[bytes],
+        encoding: str | None = None,
+    ) -> None:
+        """Write the chunks to the file of the key as they come, in a worker thread."""
+        await asyncio.to_thread(
+            _write_chunks,
+            join_path(self._root_dir, key),
+            chunks,
+            encoding or self._encoding,
+        )
+
     async def has(self, key: str) -> bool:
         """Has method definition."""
         return await exists(join_path(self._root_dir, key))
@@ -151,6 +166,10 @@ class FilePipelineStorage(PipelineStorage):
         """Return the keys in the storage."""
         return [item.name for item in Path(self._root_dir).iterdir() if item.is_file()]
 
+    def local_path(self, key: str) -> Path | None:
+        """Return the path of the file of the given key."""
+        return join_path(self._root_dir, key)
+
     async def get_creation_date(self, key: str) -> str:
         """Get the creation date of a file."""
         file_path = Path(join_path(self._root_dir, key))
@@ -166,6 +185,15 @@ def join_path(file_path: str, file_name: str) -> Path:
     return Path(file_path) / Path(file_name).parent / Path(file_name).name
 
 
+def _write_chunks(
+    path: Path, chunks: Iterable[str] | Iterable[bytes], encoding: str
+) -> None:
+    """Write str or bytes chunks to a file, encoding the str chunks."""
+    with path.open("wb") as f:
+        for chunk in chunks:
+            f.write(chunk.encode(encoding) if isinstance(chunk, str) else chunk)
+
+
 def create_file_storage(**kwargs: Any) -> PipelineStorage:
     """Create a file based storage."""
     base_dir = kwargs["base_dir"]
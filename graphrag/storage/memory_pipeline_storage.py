@@ -3,12 +3,12 @@
 
 """A module containing 'InMemoryStorage' model."""
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
 
 from graphrag.storage.file_pipeline_storage import FilePipelineStorage
-
-if TYPE_CHECKING:
-    from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
 
 
 class MemoryPipelineStorage(FilePipelineStorage):
@@ -45,6 +45,15 @@ class MemoryPipelineStorage(FilePipelineStorage):
         """
         self._storage[key] = value
 
+    async def set_chunks(
+        self,
+        key: str,
+        chunks: Iterable[str] | Iterable[bytes],
+        encoding: str | None = None,
+    ) -> None:
+        """Set the value for the given key from a stream of chunks, joined in memory."""
+        await PipelineStorage.set_chunks(self, key, chunks, encoding)
+
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
 
@@ -76,3 +85,7 @@ class MemoryPipelineStorage(FilePipelineStorage):
     def keys(self) -> list[str]:
         """Return the keys in the storage."""
         return list(self._storage.keys())
+
+    def local_path(self, key: str) -> Path | None:
+        """Return None, values are not kept in local files."""
+        return None
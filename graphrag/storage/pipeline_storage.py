@@ -3,10 +3,13 @@
 
 """A module containing 'PipelineStorage' model."""
 
+import asyncio
+import itertools
 import re
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from graphrag.logger.base import ProgressLogger
@@ -50,6 +53,25 @@ class PipelineStorage(metaclass=ABCMeta):
             - value - The value to set.
         """
 
+    async def set_chunks(
+        self,
+        key: str,
+        chunks: Iterable[str] | Iterable[bytes],
+        encoding: str | None = None,
+    ) -> None:
+        """Set the value for the given key from a stream of chunks.
+
+        The chunks are consumed in a worker thread, so that producing them does not
+        block the event loop. Storages that can write a value incrementally override
+        this, the default joins the chunks and sets the value.
+
+        Args:
+            - key - The key to set the value for.
+            - chunks - The chunks of the value, all str or all bytes.
+        """
+        value = await asyncio.to_thread(_join_chunks, chunks)
+        await self.set(key, value, encoding)
+
     @abstractmethod
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
@@ -82,6 +104,14 @@ class PipelineStorage(metaclass=ABCMeta):
     def keys(self) -> list[str]:
         """List all keys in the storage."""
 
+    def local_path(self, key: str) -> Path | None:
+        """Return the path of the given key on the local file system.
+
+        Storages that do not keep their values in local files return None, and callers
+        fall back to `get`.
+        """
+        return None
+
     @abstractmethod
     async def get_creation_date(self, key: str) -> str:
         """Get the creation date for the given key.
@@ -95,6 +125,13 @@ class PipelineStorage(metaclass=ABCMeta):
         """
 
 
+def _join_chunks(chunks: Iterable[str] | Iterable[bytes]) -> str | bytes:
+    """Join str or bytes chunks into one value, an empty stream is an empty str."""
+    iterator = iter(chunks)
+    first = next(iterator, "")
+    return first[:0].join(itertools.chain([first], iterator))  # type: ignore
+
+
 def get_timestamp_formatted_with_local_tz(timestamp: datetime) -> str:
     """Get the formatted timestamp with the local time zone."""
     creation_time_local = timestamp.astimezone()
@@ -3,10 +3,15 @@
 
 """Storage functions for the GraphRAG run module."""
 
+import asyncio
 import logging
-from io import BytesIO
+import os
+import tempfile
+from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from graphrag.storage.pipeline_storage import PipelineStorage
 
@@ -15,18 +20,110 @@ log = logging.getLogger(__name__)
 
 async def load_table_from_storage(name: str, storage: PipelineStorage) -> pd.DataFrame:
     """Load a parquet from the storage instance."""
+    table = await load_arrow_table_from_storage(name, storage)
+    return table.to_pandas()
+
+
+async def load_arrow_table_from_storage(
+    name: str, storage: PipelineStorage, columns: list[str] | None = None
+) -> pa.Table:
+    """Load a parquet from the storage instance as an Arrow table.
+
+    Files on the local file system are read through a memory map instead of an
+    intermediate buffer, but parquet columns are still decoded into memory. Pass
+    columns to only decode the columns that are needed.
+    """
     filename = f"{name}.parquet"
     if not await storage.has(filename):
         msg = f"Could not find {filename} in storage!"
         raise ValueError(msg)
     try:
         log.info("reading table from storage: %s", filename)
-        return pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
+        path = storage.local_path(filename)
+        if path is not None:
+            return pq.read_table(path, columns=columns, memory_map=True)
+        source = pa.BufferReader(await storage.get(filename, as_bytes=True))
+        return pq.read_table(source, columns=columns)
     except Exception:
         log.exception("error loading table from storage: %s", filename)
         raise
 
 
+async def load_memory_mapped_table_from_storage(
+    name: str, storage: PipelineStorage
+) -> pa.Table:
+    """Load a table from the storage instance as an Arrow table that stays on disk.
+
+    The table is served from the Arrow IPC copy written by
+    `write_memory_mappable_table_to_storage`, whose columns are memory-mapped rather
+    than read into memory. Nothing is written: storages without local files, and
+    tables whose copy is missing or older than the parquet file, load the parquet.
+    """
+    parquet_path = storage.local_path(f"{name}.parquet")
+    arrow_path = storage.local_path(f"{name}.arrow")
+    if parquet_path is None or arrow_path is None:
+        return await load_arrow_table_from_storage(name, storage)
+    try:
+        if (
+            parquet_path.exists()
+            and arrow_path.stat().st_mtime < parquet_path.stat().st_mtime
+        ):
+            log.info(
+                "memory-mappable copy %s is stale, loading the parquet", arrow_path
+            )
+            return await load_arrow_table_from_storage(name, storage)
+        return pa.ipc.open_file(pa.memory_map(str(arrow_path))).read_all()
+    except FileNotFoundError:
+        log.info("no memory-mappable copy of %s, loading the parquet", name)
+    except OSError:
+        log.warning(
+            "could not memory-map %s, loading the parquet instead",
+            arrow_path,
+            exc_info=True,
+        )
+    return await load_arrow_table_from_storage(name, storage)
+
+
+async def write_memory_mappable_table_to_storage(
+    table: pd.DataFrame, name: str, storage: PipelineStorage
+) -> None:
+    """Write a table to storage, with a copy that can be used in place.
+
+    Parquet pages are compressed and encoded, so they cannot be used in place. On
+    storages with local files the parquet is also copied to an uncompressed Arrow IPC
+    file, which `load_memory_mapped_table_from_storage` memory-maps.
+    """
+    await write_table_to_storage(table, name, storage)
+    parquet_path = storage.local_path(f"{name}.parquet")
+    arrow_path = storage.local_path(f"{name}.arrow")
+    if parquet_path is None or arrow_path is None:
+        return
+    log.info("writing memory-mappable copy of table: %s", arrow_path)
+    await asyncio.to_thread(_write_arrow_copy, parquet_path, arrow_path)
+
+
+def _write_arrow_copy(parquet_path: Path, arrow_path: Path) -> None:
+    """Write a parquet file as an Arrow IPC file, one row group batch at a time."""
+    parquet = pq.ParquetFile(parquet_path)
+    # a unique name per writer, so readers and other writers never see a partial copy
+    fd, partial_name = tempfile.mkstemp(
+        prefix=f".{arrow_path.name}.", suffix=".partial", dir=arrow_path.parent
+    )
+    os.close(fd)
+    partial_path = Path(partial_name)
+    try:
+        with (
+            pa.OSFile(partial_name, "wb") as sink,
+            pa.ipc.new_file(sink, parquet.schema_arrow) as writer,
+        ):
+            for batch in parquet.iter_batches():
+                writer.write_batch(batch)
+        partial_path.replace(arrow_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+
 async def write_table_to_storage(
     table: pd.DataFrame, name: str, storage: PipelineStorage
 ) -> None:
@@ -6,6 +6,7 @@
 import json
 from typing import Any
 
+import numpy as np
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import DefaultAzureCredential
 from azure.search.documents import SearchClient
@@ -130,7 +131,9 @@ class AzureAISearchVectorStore(BaseVectorStore):
         batch = [
             {
                 "id": doc.id,
-                "vector": doc.vector,
+                "vector": doc.vector.tolist()
+                if isinstance(doc.vector, np.ndarray)
+                else doc.vector,
                 "text": doc.text,
                 "attributes": json.dumps(doc.attributes),
             }
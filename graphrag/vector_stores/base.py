@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from graphrag.data_model.types import TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
@@ -20,7 +22,8 @@ class VectorStoreDocument:
     """unique id for the document"""
 
     text: str | None
-    vector: list[float] | None
+    vector: list[float] | np.ndarray | None
+    """embedding vector, indexing pipelines pass float32 arrays"""
 
     attributes: dict[str, Any] = field(default_factory=dict)
     """store any additional metadata, e.g. title, date ranges, etc"""
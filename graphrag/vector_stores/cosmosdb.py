@@ -6,6 +6,7 @@
 import json
 from typing import Any
 
+import numpy as np
 from azure.cosmos import ContainerProxy, CosmosClient, DatabaseProxy
 from azure.cosmos.partition_key import PartitionKey
 from azure.identity import DefaultAzureCredential
@@ -143,7 +144,9 @@ class CosmosDBVectoreStore(BaseVectorStore):
             if doc.vector is not None:
                 doc_json = {
                     "id": doc.id,
-                    "vector": doc.vector,
+                    "vector": doc.vector.tolist()
+                    if isinstance(doc.vector, np.ndarray)
+                    else doc.vector,
                     "text": doc.text,
                     "attributes": json.dumps(doc.attributes),
                 }
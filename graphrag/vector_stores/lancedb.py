@@ -6,6 +6,7 @@
 import json  # noqa: I001
 from typing import Any
 
+import numpy as np
 import pyarrow as pa
 
 from graphrag.data_model.types import TextEmbedder
@@ -39,19 +40,24 @@ class LanceDBVectorStore(BaseVectorStore):
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
         """Load documents into vector storage."""
-        data = [
-            {
-                "id": document.id,
-                "text": document.text,
-                "vector": document.vector,
-                "attributes": json.dumps(document.attributes),
-            }
-            for document in documents
-            if document.vector is not None
-        ]
-
-        if len(data) == 0:
-            data = None
+        documents = [document for document in documents if document.vector is not None]
+        data = None
+        if len(documents) > 0:
+            # LanceDB stores vectors as fixed size float32 lists, build that column
+            # straight from one contiguous matrix instead of python lists of floats
+            vectors = np.stack([
+                np.asarray(document.vector, dtype=np.float32) for document in documents
+            ])
+            data = pa.table({
+                "id": pa.array([document.id for document in documents]),
+                "text": pa.array([document.text for document in documents]),
+                "vector": pa.FixedSizeListArray.from_arrays(
+                    pa.array(vectors.ravel()), vectors.shape[1]
+                ),
+                "attributes": pa.array([
+                    json.dumps(document.attributes) for document in documents
+                ]),
+            })
 
         schema = pa.schema([
             pa.field("id", pa.string()),
@@ -63,7 +69,7 @@ class LanceDBVectorStore(BaseVectorStore):
         #       The pyarrow format of the 'vector' field may change if the order of operations is changed
         #       and will break vector search.
         if overwrite:
-            if data:
+            if data is not None:
                 self.document_collection = self.db_connection.create_table(
                     self.collection_name, data=data, mode="overwrite"
                 )
@@ -76,7 +82,7 @@ class LanceDBVectorStore(BaseVectorStore):
             self.document_collection = self.db_connection.open_table(
                 self.collection_name
             )
-            if data:
+            if data is not None:
                 self.document_collection.add(data)
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
@@ -0,0 +1,4 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Standalone performance benchmarks, run with `python -m tests.benchmarks.<name>`."""
@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Compare the reference and incremental AST code chunkers on a synthetic corpus.
+
+Usage:
+    python -m tests.benchmarks.bench_code_chunking --lines 100000
+"""
+
+import argparse
+import time
+
+import graphrag.config.defaults as defs
+from graphrag.index.code_splitting.code_splitting import (
+    chunk_code_with_ast_scope,
+    chunk_code_with_ast_scope_incremental,
+)
+from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+
+
+class _EncodeOnly:
+    def __init__(self, encoding_model: str):
+        self.encode, _ = get_encoding_fn(encoding_model)
+
+
+def synthetic_module(n_lines: int) -> str:
+    """Generate a python module of at least `n_lines` lines with nested scopes."""
+    lines = [
+        "import os",
+        "from collections import (",
+        "    OrderedDict,",
+        "    defaultdict,",
+        ")",
+    ]
+    i = 0
+    while len(lines) < n_lines:
+        lines.extend([
+            "",
+            f"class Service{i}:",
+            f'    """Service number {i} handling requests."""',
+            "",
+            "    def handle(self, request, retries=3):",
+            "        results = defaultdict(list)",
+        ])
+        lines.extend(
+            f"        results['k{j}'].append(request.get('field_{j}', os.sep) * {j})"
+            for j in range(20)
+        )
+        lines.extend([
+            "        return OrderedDict(sorted(results.items()))",
+            "",
+            "    async def fetch(self, key):",
+            "        def transform(value):",
+            f"            return str(value).upper() + '{i}'",
+            "",
+            "        return transform(key)",
+        ])
+        i += 1
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument(
+        "--size", type=int, default=defs.graphrag_config_defaults.chunks.size
+    )
+    parser.add_argument(
+        "--overlap", type=int, default=defs.graphrag_config_defaults.chunks.overlap
+    )
+    parser.add_argument("--encoding-model", default=defs.ENCODING_MODEL)
+    parser.add_argument("--skip-reference", action="store_true")
+    args = parser.parse_args()
+
+    code = synthetic_module(args.lines)
+    tokenizer = _EncodeOnly(args.encoding_model)
+
+    start = time.perf_counter()
+    incremental = chunk_code_with_ast_scope_incremental(
+        code, tokenizer, args.size, args.overlap
+    )
+    incremental_seconds = time.perf_counter() - start
+    print(
+        f"incremental: {len(incremental)} chunks from {args.lines} lines "
+        f"in {incremental_seconds:.2f}s"
+    )
+
+    if args.skip_reference:
+        return
+
+    start = time.perf_counter()
+    reference = chunk_code_with_ast_scope(code, tokenizer, args.size, args.overlap)
+    reference_seconds = time.perf_counter() - start
+    print(
+        f"reference:   {len(reference)} chunks from {args.lines} lines "
+        f"in {reference_seconds:.2f}s"
+    )
+    print(f"speedup:     {reference_seconds / incremental_seconds:.1f}x")
+    print(f"identical:   {reference == [chunk for chunk, _ in incremental]}")
+
+
+if __name__ == "__main__":
+    main()
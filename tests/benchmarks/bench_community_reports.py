@@ -0,0 +1,183 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Community report throughput, in reports per minute, with a simulated LLM.
+
+Builds a random community hierarchy and replaces the LLM call with a sleep of random
+latency, so only the scheduling is measured. `levels` runs one level after another
+through derive_from_rows, as summarize_communities did, draining the worker pool at
+every level boundary. `scheduler` is summarize_communities, which starts every report
+as soon as its context is ready. A share of the communities exceed their context
+limit and wait for the reports of their sub-communities.
+
+Usage:
+    python -m tests.benchmarks.bench_community_reports --communities 2000 --levels 3
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+import pandas as pd
+
+import graphrag.data_model.schemas as schemas
+import graphrag.index.operations.summarize_communities.summarize_communities as summarize_module
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.summarize_communities.summarize_communities import (
+    summarize_communities,
+)
+from graphrag.index.utils.derive_from_rows import derive_from_rows
+
+
+def _hierarchy(
+    n_communities: int, n_levels: int, exceed_share: float, rng: random.Random
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # every level holds twice as many communities as the one above it
+    sizes = [2**level for level in range(n_levels)]
+    counts = [max(1, n_communities * size // sum(sizes)) for size in sizes]
+    levels: list[list[int]] = []
+    next_id = 0
+    for count in counts:
+        levels.append(list(range(next_id, next_id + count)))
+        next_id += count
+
+    children: dict[int, list[int]] = {
+        community: [] for level in levels for community in level
+    }
+    for level, communities in enumerate(levels[1:], start=1):
+        for community in communities:
+            children[rng.choice(levels[level - 1])].append(community)
+
+    community_levels = {
+        community: level
+        for level, communities in enumerate(levels)
+        for community in communities
+    }
+    communities = pd.DataFrame({
+        "community": list(children),
+        "level": [community_levels[community] for community in children],
+        "children": list(children.values()),
+    })
+    local_contexts = pd.DataFrame({
+        schemas.COMMUNITY_ID: list(children),
+        schemas.COMMUNITY_LEVEL: [
+            community_levels[community] for community in children
+        ],
+        schemas.CONTEXT_STRING: "local context",
+        schemas.CONTEXT_EXCEED_FLAG: [
+            bool(children[community]) and rng.random() < exceed_share
+            for community in children
+        ],
+    }).sort_values(schemas.COMMUNITY_LEVEL, ascending=False)
+    return communities, local_contexts
+
+
+def _level_context_builder(
+    report_df: pd.DataFrame | None,
+    community_hierarchy_df: pd.DataFrame,
+    local_context_df: pd.DataFrame,
+    level: int,
+    max_tokens: int,
+) -> pd.DataFrame:
+    return local_context_df.loc[local_context_df[schemas.COMMUNITY_LEVEL] == level]
+
+
+def _strategy(latency: float, rng: random.Random) -> Any:
+    async def generate(community, context, level, callbacks, cache, args):
+        await asyncio.sleep(rng.expovariate(1 / latency))
+        return {"community": community, "level": level, "full_content": context}
+
+    return generate
+
+
+async def _levels(local_contexts: pd.DataFrame, strategy: Any, num_threads: int) -> int:
+    generated = 0
+    for level in sorted(local_contexts[schemas.COMMUNITY_LEVEL].unique(), reverse=True):
+
+        async def run_generate(record):
+            return await strategy(
+                record[schemas.COMMUNITY_ID],
+                record[schemas.CONTEXT_STRING],
+                record[schemas.COMMUNITY_LEVEL],
+                None,
+                None,
+                {},
+            )
+
+        reports = await derive_from_rows(
+            local_contexts.loc[local_contexts[schemas.COMMUNITY_LEVEL] == level],
+            run_generate,
+            num_threads=num_threads,
+        )
+        generated += len(reports)
+    return generated
+
+
+async def _scheduler(
+    communities: pd.DataFrame,
+    local_contexts: pd.DataFrame,
+    strategy: Any,
+    num_threads: int,
+) -> int:
+    summarize_module.load_strategy = lambda strategy_type: strategy  # type: ignore
+    reports = await summarize_communities(
+        local_contexts,
+        communities,
+        local_contexts,
+        _level_context_builder,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        {"type": "simulated"},
+        max_input_length=0,
+        num_threads=num_threads,
+    )
+    return len(reports)
+
+
+def _measure(name: str, run: Any) -> None:
+    start = time.perf_counter()
+    reports = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:>9}: {elapsed:8.2f}s  {reports / elapsed * 60:12,.0f} reports/minute  "
+        f"({reports} reports)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--communities", type=int, default=2_000)
+    parser.add_argument("--levels", type=int, default=3)
+    parser.add_argument("--exceed-share", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--num-threads", type=int, default=25)
+    args = parser.parse_args()
+
+    communities, local_contexts = _hierarchy(
+        args.communities, args.levels, args.exceed_share, random.Random(0)
+    )
+
+    _measure(
+        "levels",
+        lambda: _levels(
+            local_contexts,
+            _strategy(args.latency, random.Random(1)),
+            args.num_threads,
+        ),
+    )
+    _measure(
+        "scheduler",
+        lambda: _scheduler(
+            communities,
+            local_contexts,
+            _strategy(args.latency, random.Random(1)),
+            args.num_threads,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
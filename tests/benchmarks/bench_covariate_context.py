@@ -0,0 +1,106 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""p50/p99 latency of local search covariate (claim) context building.
+
+Builds a random claim collection and, per query, grows the selection one entity
+at a time and rebuilds the covariate context, as LocalSearchMixedContext does.
+`list` passes the plain covariate list, `index` the CovariateIndex built once up
+front. Token counts split on whitespace so no tokenizer download is needed.
+
+Usage:
+    python -m tests.benchmarks.bench_covariate_context --claims 100000
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.query.context_builder.local_context import build_covariates_context
+from graphrag.query.input.retrieval.covariates import CovariateIndex
+
+
+class _WordEncoder:
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+def _build_context(
+    selected_entities: list[Entity],
+    covariates: list[Covariate] | CovariateIndex,
+) -> None:
+    added_entities = []
+    for entity in selected_entities:
+        added_entities.append(entity)
+        build_covariates_context(
+            selected_entities=added_entities,
+            covariates=covariates,
+            token_encoder=_WordEncoder(),  # type: ignore
+        )
+
+
+def _measure(
+    name: str,
+    covariates: list[Covariate] | CovariateIndex,
+    queries: list[list[Entity]],
+) -> None:
+    if not queries:
+        return
+    latencies = []
+    for selected_entities in queries:
+        start = time.perf_counter()
+        _build_context(selected_entities, covariates)
+        latencies.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(f"{name:>5}: p50 {p50:10.2f}ms  p99 {p99:10.2f}ms  ({len(queries)} queries)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--claims", type=int, default=100_000)
+    parser.add_argument("--entities", type=int, default=20_000)
+    parser.add_argument("--selected", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--list-queries", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    covariates = [
+        Covariate(
+            id=str(i),
+            short_id=str(i),
+            subject_id=f"ENTITY {rng.randrange(args.entities)}",
+            covariate_type="claim",
+            attributes={
+                "object_id": f"ENTITY {rng.randrange(args.entities)}",
+                "type": "EVENT",
+                "status": rng.choice(["TRUE", "FALSE", "SUSPECTED"]),
+                "description": "claim description",
+            },
+        )
+        for i in range(args.claims)
+    ]
+    queries = [
+        [
+            Entity(id=title, short_id=title, title=title)
+            for title in (
+                f"ENTITY {rng.randrange(args.entities)}" for _ in range(args.selected)
+            )
+        ]
+        for _ in range(max(args.queries, args.list_queries))
+    ]
+
+    start = time.perf_counter()
+    index = CovariateIndex(covariates)
+    print(f"index built in {time.perf_counter() - start:.2f}s")
+
+    _measure("list", covariates, queries[: args.list_queries])
+    _measure("index", index, queries[: args.queries])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tokens per second of chunking a synthetic corpus into base text units.
+
+`rows` is the previous chunking stage: it chunks every document group through a
+one-row DataFrame and chunk_text, which loads the strategy and fetches the encoding
+again, and hashes the chunks row by row. `batched` is create_base_text_units, which
+chunks the groups in batches with `encode_batch`, in `--workers` processes. Tokens
+are the tokens of the corpus, counted once before the runs.
+
+Usage:
+    python -m tests.benchmarks.bench_create_base_text_units --documents 20000 --workers 4
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+from unittest.mock import Mock
+
+import pandas as pd
+import tiktoken
+
+from graphrag.config.enums import ChunkStrategyType
+from graphrag.index.operations.chunk_text.chunk_text import chunk_text
+from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.index.workflows.create_base_text_units import create_base_text_units
+
+WORDS = [f"word{i}" for i in range(5_000)]
+
+
+def _rows(documents: pd.DataFrame, size: int, overlap: int, encoding: str, **_):
+    documents = documents.sort_values(by=["id"])
+    documents["texts"] = [
+        [item] for item in zip(documents["id"], documents["text"], strict=True)
+    ]
+
+    def chunker(row: pd.Series) -> pd.Series:
+        row["chunks"] = chunk_text(
+            pd.DataFrame([row]).reset_index(drop=True),
+            column="texts",
+            size=size,
+            overlap=overlap,
+            encoding_model=encoding,
+            strategy=ChunkStrategyType.tokens,
+            callbacks=Mock(),
+        )[0]
+        return row
+
+    chunks = documents.apply(chunker, axis=1)[["id", "chunks"]].explode("chunks")
+    chunks["id"] = chunks.apply(lambda row: gen_sha512_hash(row, ["chunks"]), axis=1)
+    return chunks
+
+
+def _batched(documents: pd.DataFrame, size: int, overlap: int, encoding: str, workers):
+    return create_base_text_units(
+        documents,
+        Mock(),
+        ["id"],
+        size,
+        overlap,
+        encoding,
+        strategy=ChunkStrategyType.tokens,
+        num_workers=workers,
+    )
+
+
+def _measure(name: str, chunk: Any, documents: pd.DataFrame, tokens: int, **kwargs):
+    start = time.perf_counter()
+    text_units = chunk(documents.copy(), **kwargs)
+    seconds = time.perf_counter() - start
+    print(
+        f"{name:>8}: {seconds:8.2f}s  {tokens / seconds:12,.0f} tokens/s  "
+        f"({len(text_units)} text units)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=20_000)
+    parser.add_argument("--words", type=int, default=1_000)
+    parser.add_argument("--size", type=int, default=1_200)
+    parser.add_argument("--overlap", type=int, default=100)
+    parser.add_argument("--encoding", default="cl100k_base")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    documents = pd.DataFrame({
+        "id": [f"doc{i}" for i in range(args.documents)],
+        "text": [
+            " ".join(rng.choices(WORDS, k=args.words)) for _ in range(args.documents)
+        ],
+    })
+    encoding = tiktoken.get_encoding(args.encoding)
+    tokens = sum(len(ids) for ids in encoding.encode_batch(documents["text"].tolist()))
+    print(f"{args.documents} documents, {tokens} tokens")
+
+    kwargs = {"size": args.size, "overlap": args.overlap, "encoding": args.encoding}
+    _measure("rows", _rows, documents, tokens, **kwargs)
+    _measure("batched", _batched, documents, tokens, **kwargs, workers=1)
+    if args.workers > 1:
+        _measure(
+            f"batched/{args.workers}",
+            _batched,
+            documents,
+            tokens,
+            **kwargs,
+            workers=args.workers,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Peak RSS and throughput of derive_from_rows with a no-op transform.
+
+Each scheduler runs in its own process so peak RSS is measured in isolation.
+`task-per-row` reproduces the previous scheduler, which created one task per row
+up front and let a semaphore admit them.
+
+Usage:
+    python -m tests.benchmarks.bench_derive_from_rows --rows 1000000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import time
+
+import pandas as pd
+
+from graphrag.index.utils.derive_from_rows import derive_from_rows
+
+
+async def _noop(row: pd.Series) -> int:  # noqa: RUF029
+    return 0
+
+
+async def _task_per_row(input: pd.DataFrame, num_threads: int) -> list[int]:
+    semaphore = asyncio.Semaphore(num_threads)
+
+    async def protected(row: pd.Series) -> int:
+        async with semaphore:
+            return await _noop(row)
+
+    tasks = [asyncio.create_task(protected(row)) for _, row in input.iterrows()]
+    return await asyncio.gather(*tasks)
+
+
+def _run(scheduler: str, rows: int, num_threads: int, queue) -> None:
+    input = pd.DataFrame({"id": range(rows), "text": ["some text"] * rows})
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if scheduler == "streaming":
+        asyncio.run(derive_from_rows(input, _noop, num_threads=num_threads))
+    else:
+        asyncio.run(_task_per_row(input, num_threads))
+    seconds = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((seconds, baseline_rss, peak_rss))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--num-threads", type=int, default=4)
+    args = parser.parse_args()
+
+    for scheduler in ["streaming", "task-per-row"]:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=_run, args=(scheduler, args.rows, args.num_threads, queue)
+        )
+        process.start()
+        seconds, baseline_rss, peak_rss = queue.get()
+        process.join()
+        # ru_maxrss is reported in KiB on linux
+        print(
+            f"{scheduler:>12}: {args.rows / seconds:>10,.0f} rows/s, "
+            f"peak RSS {peak_rss / 1024:,.0f} MiB "
+            f"(+{(peak_rss - baseline_rss) / 1024:,.0f} MiB over input)"
+        )
+
+
+if __name__ == "__main__":
+    main()
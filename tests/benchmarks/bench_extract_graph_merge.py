@@ -0,0 +1,103 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Time to merge per text unit extraction results into the entity and relationship tables.
+
+Generates one extraction result per text unit, each with a handful of entity and
+relationship rows drawn from a shared pool of names. `concat` is the previous merge,
+which built two DataFrames per text unit and concatenated them before grouping.
+`columns` appends the rows of every result into one buffer per column and groups once,
+as the extract_graph operation does.
+
+Usage:
+    python -m tests.benchmarks.bench_extract_graph_merge --text-units 100000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from graphrag.index.operations.extract_graph.extract_graph import (
+    ENTITY_COLUMNS,
+    RELATIONSHIP_COLUMNS,
+    _collect_columns,
+    _merge_entities,
+    _merge_relationships,
+)
+
+
+def _concat_merge(results: list) -> Any:
+    entities = pd.concat([pd.DataFrame(result[0]) for result in results])
+    relationships = pd.concat([pd.DataFrame(result[1]) for result in results])
+    return (
+        entities.groupby(["title", "type"], sort=False).agg(
+            description=("description", list),
+            text_unit_ids=("source_id", list),
+            frequency=("source_id", "count"),
+        ),
+        relationships.groupby(["source", "target"], sort=False).agg(
+            description=("description", list),
+            text_unit_ids=("source_id", list),
+            weight=("weight", "sum"),
+        ),
+    )
+
+
+def _columns_merge(results: list) -> Any:
+    return (
+        _merge_entities(_collect_columns(results, 0, ENTITY_COLUMNS)),
+        _merge_relationships(_collect_columns(results, 1, RELATIONSHIP_COLUMNS)),
+    )
+
+
+def _measure(name: str, merge: Callable[[list], Any], results: list) -> None:
+    rows = sum(len(result[0]) + len(result[1]) for result in results)
+    start = time.perf_counter()
+    merge(results)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>8}: {elapsed:8.2f}s  {rows / elapsed:12,.0f} rows/s  ({rows} rows)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--text-units", type=int, default=100_000)
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--entities", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"ENTITY {i}" for i in range(args.entities)]
+    results = []
+    for i in range(args.text_units):
+        source_id = f"t{i}"
+        entities = [
+            {
+                "title": rng.choice(names),
+                "type": "ORGANIZATION",
+                "description": "an entity description",
+                "source_id": source_id,
+            }
+            for _ in range(args.rows)
+        ]
+        relationships = [
+            {
+                "source": rng.choice(names),
+                "target": rng.choice(names),
+                "weight": 1.0,
+                "description": "a relationship description",
+                "source_id": source_id,
+            }
+            for _ in range(args.rows)
+        ]
+        results.append([entities, relationships])
+
+    _measure("concat", _concat_merge, results)
+    _measure("columns", _columns_merge, results)
+
+
+if __name__ == "__main__":
+    main()
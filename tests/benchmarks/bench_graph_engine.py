@@ -0,0 +1,86 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Wall time and peak traced memory of degree and LCC on networkx versus CSRGraph.
+
+Builds a random relationship table, then computes node degrees, combined edge
+degrees and the stable largest connected component with both engines.
+`nx+arrays` only builds the networkx graph and runs the array-backed
+stable_largest_connected_component on it, as graph embedding does.
+
+Usage:
+    python -m tests.benchmarks.bench_graph_engine --edges 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.operations.compute_degree import compute_degree
+from graphrag.index.operations.compute_edge_combined_degree import (
+    compute_edge_combined_degree,
+)
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.index.utils.stable_lcc import (
+    _stable_largest_connected_component_networkx,
+    stable_largest_connected_component,
+    stable_largest_connected_component_csr,
+)
+
+
+def _networkx(relationships: pd.DataFrame) -> None:
+    graph = create_graph(relationships)
+    degrees = compute_degree(graph)
+    compute_edge_combined_degree(
+        relationships, degrees, "title", "degree", "source", "target"
+    )
+    _stable_largest_connected_component_networkx(graph)
+
+
+def _stable_lcc(relationships: pd.DataFrame) -> None:
+    stable_largest_connected_component(create_graph(relationships))
+
+
+def _csr(relationships: pd.DataFrame) -> None:
+    graph = CSRGraph.from_edges(relationships)
+    graph.degree_frame()
+    graph.edge_combined_degree(relationships["source"], relationships["target"])
+    stable_largest_connected_component_csr(graph)
+
+
+def _measure(name: str, fn, relationships: pd.DataFrame) -> None:
+    start = time.perf_counter()
+    fn(relationships)
+    seconds = time.perf_counter() - start
+    # tracing slows Python down a lot, so memory is measured in a second run
+    tracemalloc.start()
+    fn(relationships)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>9}: {seconds:8.2f}s  peak {peak / 2**20:9.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    names = np.asarray([f"ENTITY {i}" for i in range(args.nodes)], dtype=object)
+    relationships = pd.DataFrame({
+        "source": names[rng.integers(0, args.nodes, args.edges)],
+        "target": names[rng.integers(0, args.nodes, args.edges)],
+    }).drop_duplicates(subset=["source", "target"], ignore_index=True)
+
+    _measure("networkx", _networkx, relationships)
+    _measure("nx+arrays", _stable_lcc, relationships)
+    _measure("csr", _csr, relationships)
+
+
+if __name__ == "__main__":
+    main()
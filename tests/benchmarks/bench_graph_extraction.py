@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Throughput of parsing graph extraction output into entities and relationships.
+
+Generates extraction output in the LLM record format, with a small pool of entity names
+so that every entity and relationship is mentioned many times. `networkx` is the
+previous parser, which merged repeated records by splitting and re-joining the
+description and source id strings held on a networkx graph. `graph` is the
+ExtractedGraph parser converted to a networkx graph, `rows` the same parser emitting
+entity and relationship rows as the extract_graph operation consumes them.
+
+Usage:
+    python -m tests.benchmarks.bench_graph_extraction --records 200000 --entities 500
+"""
+
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+import networkx as nx
+
+from graphrag.index.operations.extract_graph.graph_records import ExtractedGraph
+from graphrag.index.utils.string import clean_str
+
+TUPLE_DELIMITER = "<|>"
+RECORD_DELIMITER = "##"
+
+
+def _networkx_parse(results: dict[int, str]) -> nx.Graph:
+    graph = nx.Graph()
+    for source_doc_id, extracted_data in results.items():
+        for record in extracted_data.split(RECORD_DELIMITER):
+            record = re.sub(r"^\(|\)$", "", record.strip())
+            attributes = record.split(TUPLE_DELIMITER)
+            if attributes[0] == '"entity"' and len(attributes) >= 4:
+                name = clean_str(attributes[1].upper())
+                entity_type = clean_str(attributes[2].upper())
+                description = clean_str(attributes[3])
+                if name in graph.nodes():
+                    node = graph.nodes[name]
+                    node["description"] = "\n".join({
+                        *node["description"].split("\n"),
+                        description,
+                    })
+                    node["source_id"] = ", ".join({
+                        *node["source_id"].split(", "),
+                        str(source_doc_id),
+                    })
+                    node["type"] = entity_type or node["type"]
+                else:
+                    graph.add_node(
+                        name,
+                        type=entity_type,
+                        description=description,
+                        source_id=str(source_doc_id),
+                    )
+            if attributes[0] == '"relationship"' and len(attributes) >= 5:
+                source = clean_str(attributes[1].upper())
+                target = clean_str(attributes[2].upper())
+                description = clean_str(attributes[3])
+                source_id = str(source_doc_id)
+                weight = float(attributes[-1])
+                for name in (source, target):
+                    if name not in graph.nodes():
+                        graph.add_node(
+                            name, type="", description="", source_id=source_id
+                        )
+                if graph.has_edge(source, target):
+                    edge = graph.get_edge_data(source, target)
+                    weight += edge["weight"]
+                    description = "\n".join({
+                        *edge["description"].split("\n"),
+                        description,
+                    })
+                    source_id = ", ".join({
+                        *edge["source_id"].split(", "),
+                        source_id,
+                    })
+                graph.add_edge(
+                    source,
+                    target,
+                    weight=weight,
+                    description=description,
+                    source_id=source_id,
+                )
+    return graph
+
+
+def _parse(results: dict[int, str]) -> ExtractedGraph:
+    parsed = ExtractedGraph(TUPLE_DELIMITER, RECORD_DELIMITER)
+    for source_doc_id, extracted_data in results.items():
+        parsed.add_output(str(source_doc_id), extracted_data)
+    return parsed
+
+
+def _rows(results: dict[int, str]) -> Any:
+    parsed = _parse(results)
+    return parsed.entities(), parsed.relationships()
+
+
+def _measure(
+    name: str, parse: Callable[[dict[int, str]], Any], results: dict[int, str]
+) -> None:
+    records = sum(output.count(RECORD_DELIMITER) + 1 for output in results.values())
+    start = time.perf_counter()
+    parse(results)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:>8}: {elapsed:8.2f}s  {records / elapsed:12,.0f} records/s  "
+        f"({records} records)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--documents", type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"ENTITY {i}" for i in range(args.entities)]
+    outputs: list[list[str]] = [[] for _ in range(args.documents)]
+    for i in range(args.records):
+        if rng.random() < 0.5:
+            record = TUPLE_DELIMITER.join([
+                '("entity"',
+                rng.choice(names),
+                "ORGANIZATION",
+                f"description {i % 5000})",
+            ])
+        else:
+            record = TUPLE_DELIMITER.join([
+                '("relationship"',
+                rng.choice(names),
+                rng.choice(names),
+                f"relationship {i % 5000}",
+                "1)",
+            ])
+        outputs[rng.randrange(args.documents)].append(record)
+    results = {
+        doc_index: f"\n{RECORD_DELIMITER}\n".join(records)
+        for doc_index, records in enumerate(outputs)
+    }
+
+    _measure("networkx", _networkx_parse, results)
+    _measure("graph", lambda results: _parse(results).to_networkx(), results)
+    _measure("rows", _rows, results)
+
+
+if __name__ == "__main__":
+    main()
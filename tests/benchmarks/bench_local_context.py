@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""p50/p99 latency of local search relationship context building.
+
+Builds a random relationship collection and, per query, grows the selection one
+entity at a time and rebuilds the relationship context, as LocalSearchMixedContext
+does. `list` selects relationships by scanning the collection, `index` goes through
+the RelationshipIndex built once up front. Token counts split on whitespace so no
+tokenizer download is needed.
+
+Usage:
+    python -m tests.benchmarks.bench_local_context --relationships 1000000
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.query.context_builder.local_context import build_relationship_context
+from graphrag.query.input.retrieval.relationships import RelationshipIndex
+
+
+class _WordEncoder:
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+def _build_context(
+    selected_entities: list[Entity],
+    relationships: list[Relationship] | RelationshipIndex,
+) -> None:
+    added_entities = []
+    for entity in selected_entities:
+        added_entities.append(entity)
+        build_relationship_context(
+            selected_entities=added_entities,
+            relationships=relationships,
+            token_encoder=_WordEncoder(),  # type: ignore
+        )
+
+
+def _measure(
+    name: str,
+    relationships: list[Relationship] | RelationshipIndex,
+    queries: list[list[Entity]],
+) -> None:
+    latencies = []
+    for selected_entities in queries:
+        start = time.perf_counter()
+        _build_context(selected_entities, relationships)
+        latencies.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(f"{name:>5}: p50 {p50:10.2f}ms  p99 {p99:10.2f}ms  ({len(queries)} queries)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--relationships", type=int, default=1_000_000)
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--selected", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--list-queries", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    relationships = [
+        Relationship(
+            id=str(i),
+            short_id=str(i),
+            source=f"ENTITY {rng.randrange(args.entities)}",
+            target=f"ENTITY {rng.randrange(args.entities)}",
+            description="relationship description",
+            weight=1.0,
+            rank=rng.randrange(100),
+        )
+        for i in range(args.relationships)
+    ]
+    queries = [
+        [
+            Entity(id=title, short_id=title, title=title)
+            for title in (
+                f"ENTITY {rng.randrange(args.entities)}" for _ in range(args.selected)
+            )
+        ]
+        for _ in range(max(args.queries, args.list_queries))
+    ]
+
+    start = time.perf_counter()
+    index = RelationshipIndex(relationships)
+    print(f"index built in {time.perf_counter() - start:.2f}s")
+
+    _measure("list", relationships, queries[: args.list_queries])
+    _measure("index", index, queries[: args.queries])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Scaling of co-occurrence edge extraction for the fast (NLP) indexing method.
+
+Generates noun phrase nodes for a growing number of text units, each mentioning a few
+noun phrases drawn from a Zipf-like vocabulary, and times building the PMI weighted
+edges. `rows` is the previous implementation, which generated pairs per text unit in
+Python and ordered and weighted them with row-wise DataFrame.apply. `encoded` is
+build_noun_graph's integer-encoded edge extraction. Both produce the same edges.
+
+Usage:
+    python -m tests.benchmarks.bench_noun_graph_edges --text-units 10000 100000 1000000
+"""
+
+import argparse
+import math
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.operations.build_noun_graph.build_noun_graph import (
+    _extract_edges,
+)
+
+
+def _rows_extract_edges(nodes_df: pd.DataFrame) -> pd.DataFrame:
+    text_units_df = nodes_df.explode("text_unit_ids")
+    text_units_df = text_units_df.rename(columns={"text_unit_ids": "text_unit_id"})
+    text_units_df = (
+        text_units_df.groupby("text_unit_id").agg({"title": list}).reset_index()
+    )
+    text_units_df["edges"] = text_units_df["title"].apply(
+        lambda phrases: [
+            (phrases[i], phrases[j])
+            for i in range(len(phrases) - 1)
+            for j in range(i + 1, len(phrases))
+        ]
+    )
+    edge_df = text_units_df.explode("edges").loc[:, ["edges", "text_unit_id"]]
+    edge_df["source"] = edge_df["edges"].apply(
+        lambda x: x[0] if isinstance(x, tuple) else None
+    )
+    edge_df["target"] = edge_df["edges"].apply(
+        lambda x: x[1] if isinstance(x, tuple) else None
+    )
+    edge_df = edge_df[(edge_df.source.notna()) & (edge_df.target.notna())]
+    edge_df = edge_df.drop(columns=["edges"])
+    edge_df["source"], edge_df["target"] = zip(
+        *edge_df.apply(
+            lambda x: (x["source"], x["target"])
+            if x["source"] < x["target"]
+            else (x["target"], x["source"]),
+            axis=1,
+        ),
+        strict=False,
+    )
+    grouped_edge_df = (
+        edge_df.groupby(["source", "target"]).agg({"text_unit_id": list}).reset_index()
+    )
+    grouped_edge_df = grouped_edge_df.rename(columns={"text_unit_id": "text_unit_ids"})
+    grouped_edge_df["weight"] = grouped_edge_df["text_unit_ids"].apply(len)
+    grouped_edge_df = grouped_edge_df.loc[
+        :, ["source", "target", "weight", "text_unit_ids"]
+    ]
+    return _rows_pmi_edge_weights(nodes_df, grouped_edge_df)
+
+
+def _rows_pmi_edge_weights(
+    nodes_df: pd.DataFrame, edges_df: pd.DataFrame
+) -> pd.DataFrame:
+    node_props = nodes_df.loc[:, ["title"]]
+    node_props["prop_occurrence"] = nodes_df["frequency"] / nodes_df["frequency"].sum()
+    edges_df["prop_weight"] = edges_df["weight"] / edges_df["weight"].sum()
+    for column in ("source", "target"):
+        edges_df = (
+            edges_df.merge(node_props, left_on=column, right_on="title", how="left")
+            .drop(columns=["title"])
+            .rename(columns={"prop_occurrence": f"{column}_prop"})
+        )
+    edges_df["weight"] = edges_df.apply(
+        lambda x: math.log2(x["prop_weight"] / (x["source_prop"] * x["target_prop"])),
+        axis=1,
+    )
+    return edges_df.drop(columns=["prop_weight", "source_prop", "target_prop"])
+
+
+def _nodes(n_text_units: int, n_phrases: int, vocabulary: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    units = np.repeat(np.arange(n_text_units), n_phrases)
+    phrases = rng.zipf(1.3, len(units)) % vocabulary
+    memberships = pd.DataFrame({
+        "title": [f"NOUN PHRASE {phrase}" for phrase in phrases],
+        "text_unit_id": [f"unit-{unit}" for unit in units],
+    }).drop_duplicates()
+    nodes = (
+        memberships.groupby("title")
+        .agg(text_unit_ids=("text_unit_id", list))
+        .reset_index()
+    )
+    nodes["frequency"] = nodes["text_unit_ids"].apply(len)
+    return nodes.loc[:, ["title", "frequency", "text_unit_ids"]]
+
+
+def _measure(
+    name: str, extract: Callable[[pd.DataFrame], pd.DataFrame], nodes: pd.DataFrame
+) -> None:
+    start = time.perf_counter()
+    edges = extract(nodes.copy())
+    elapsed = time.perf_counter() - start
+    print(f"{name:>8}: {elapsed:8.2f}s  ({len(edges)} edges)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--text-units", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--phrases", type=int, default=8)
+    parser.add_argument("--vocabulary", type=int, default=200_000)
+    parser.add_argument(
+        "--rows-max",
+        type=int,
+        default=100_000,
+        help="largest number of text units to run the previous implementation on",
+    )
+    args = parser.parse_args()
+
+    for n_text_units in args.text_units:
+        nodes = _nodes(n_text_units, args.phrases, args.vocabulary)
+        print(f"{n_text_units} text units, {len(nodes)} noun phrases")
+        if n_text_units <= args.rows_max:
+            _measure("rows", _rows_extract_edges, nodes)
+        _measure("encoded", _extract_edges, nodes)
+
+
+if __name__ == "__main__":
+    main()
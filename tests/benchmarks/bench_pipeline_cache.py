@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Write, cold-open and lookup latency of the file and packed pipeline caches.
+
+The file cache stores one JSON file per entry; the packed cache appends every entry
+to a single log. Cold open measures constructing a fresh cache over the populated
+directory, lookups read every key once in random order.
+
+Usage:
+    python -m tests.benchmarks.bench_pipeline_cache --entries 20000
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.packed_pipeline_cache import PackedPipelineCache
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+
+def _file_cache(root: Path) -> PipelineCache:
+    return JsonPipelineCache(FilePipelineStorage(root_dir=str(root)))
+
+
+def _packed_cache(root: Path) -> PipelineCache:
+    return PackedPipelineCache(root / "cache.packed")
+
+
+async def _bench(name: str, factory, entries: int, value: str) -> None:
+    keys = [f"chat-{i:08x}" for i in range(entries)]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        cache = factory(root)
+        start = time.perf_counter()
+        for key in keys:
+            await cache.set(key, value, {"input": key})
+        write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cache = factory(root)
+        cold_open = time.perf_counter() - start
+
+        random.shuffle(keys)
+        start = time.perf_counter()
+        for key in keys:
+            if await cache.has(key):
+                await cache.get(key)
+        lookup = time.perf_counter() - start
+
+    print(
+        f"{name:>7}: write {write:7.2f}s  cold open {cold_open * 1000:8.1f}ms  "
+        f"lookup {lookup / entries * 1e6:7.1f}us/entry"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--value-bytes", type=int, default=2_000)
+    args = parser.parse_args()
+    value = "x" * args.value_bytes
+    asyncio.run(_bench("file", _file_cache, args.entries, value))
+    asyncio.run(_bench("packed", _packed_cache, args.entries, value))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Wall time of pruning a random noun graph with networkx versus node/edge tables.
+
+`networkx` is the previous prune_graph workflow: it builds a networkx graph from the
+entity and relationship tables, removes nodes and edges from it mask by mask and
+merges the remaining nodes and edges back into the tables. `tables` is the
+prune_graph operation, which masks the tables directly. Both apply the degree,
+frequency and edge weight thresholds of the noun graph pruning defaults, with the
+largest connected component step. `networkx` keeps fewer relationships, as it lost
+the rows whose edge networkx lists in the opposite orientation.
+
+Usage:
+    python -m tests.benchmarks.bench_prune_graph --edges 10000000 --no-networkx
+"""
+
+import argparse
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.graph_to_dataframes import graph_to_dataframes
+from graphrag.index.operations.prune_graph import prune_graph
+from graphrag.index.utils.csr_graph import CSRGraph
+
+PRUNING = {
+    "min_node_freq": 2,
+    "max_node_freq_std": 2.0,
+    "min_node_degree": 1,
+    "max_node_degree_std": 2.0,
+    "min_edge_weight_pct": 40,
+    "remove_ego_nodes": True,
+    "lcc_only": True,
+}
+
+
+def _networkx_prune(
+    entities: pd.DataFrame, relationships: pd.DataFrame, **kwargs: Any
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    graph = create_graph(relationships, edge_attr=["weight"], nodes=entities.copy())
+    degrees = list(graph.degree())  # type: ignore
+    if kwargs["remove_ego_nodes"]:
+        graph.remove_nodes_from([max(degrees, key=lambda x: x[1])[0]])
+    graph.remove_nodes_from([
+        node for node, degree in degrees if degree < kwargs["min_node_degree"]
+    ])
+    threshold = _threshold(
+        [degree for _, degree in degrees], kwargs["max_node_degree_std"]
+    )
+    graph.remove_nodes_from([node for node, degree in degrees if degree > threshold])
+    graph.remove_nodes_from([
+        node
+        for node, data in graph.nodes(data=True)
+        if data["frequency"] < kwargs["min_node_freq"]
+    ])
+    threshold = _threshold(
+        [data["frequency"] for _, data in graph.nodes(data=True)],
+        kwargs["max_node_freq_std"],
+    )
+    graph.remove_nodes_from([
+        node for node, data in graph.nodes(data=True) if data["frequency"] > threshold
+    ])
+    min_edge_weight = np.percentile(
+        [data["weight"] for _, _, data in graph.edges(data=True)],
+        kwargs["min_edge_weight_pct"],
+    )
+    graph.remove_edges_from([
+        (source, target)
+        for source, target, data in graph.edges(data=True)
+        if source in graph.nodes()
+        and target in graph.nodes()
+        and data["weight"] < min_edge_weight
+    ])
+    arrays = CSRGraph.from_networkx(graph)
+    graph.remove_nodes_from(arrays.nodes[~arrays.largest_component_mask()].tolist())
+
+    nodes, edges = graph_to_dataframes(
+        graph, node_columns=["title"], edge_columns=["source", "target"]
+    )
+    return (
+        nodes.merge(entities, on="title", how="inner"),
+        edges.merge(relationships, on=["source", "target"], how="inner"),
+    )
+
+
+def _threshold(data: list[float] | list[int], std_trim: float) -> float:
+    return float(np.mean(data) + std_trim * np.std(data))
+
+
+def _measure(
+    name: str, prune: Any, entities: pd.DataFrame, relationships: pd.DataFrame
+) -> None:
+    start = time.perf_counter()
+    pruned_entities, pruned_relationships = prune(entities, relationships, **PRUNING)
+    seconds = time.perf_counter() - start
+    print(
+        f"{name:>8}: {seconds:8.2f}s  {len(pruned_entities)} entities, "
+        f"{len(pruned_relationships)} relationships remaining"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--no-networkx", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    names = np.asarray([f"NOUN {i}" for i in range(args.nodes)], dtype=object)
+    # a skewed noun distribution, as noun phrase co-occurrence graphs have
+    ranks = (args.nodes * rng.random((2, args.edges)) ** 3).astype(np.int64)
+    relationships = pd.DataFrame({
+        "source": names[ranks[0]],
+        "target": names[ranks[1]],
+        "weight": rng.random(args.edges),
+    }).drop_duplicates(subset=["source", "target"], ignore_index=True)
+    entities = pd.DataFrame({
+        "title": names,
+        "frequency": np.minimum(rng.zipf(1.5, args.nodes), 1000),
+    })
+    print(f"{len(entities)} entities, {len(relationships)} relationships")
+
+    if not args.no_networkx:
+        _measure("networkx", _networkx_prune, entities, relationships)
+    _measure("tables", prune_graph, entities, relationships)
+
+
+if __name__ == "__main__":
+    main()
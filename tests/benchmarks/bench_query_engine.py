@@ -0,0 +1,231 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""p50/p99 latency of local search over a random index, per query.
+
+`api` creates a QueryEngine from the index tables for every query, as the DataFrame
+based graphrag.api.query functions do, so every query adapts the tables and builds the
+context builder again. `engine` serves every query from one QueryEngine. Chat and
+embedding models are the test mocks, vector stores return fixed results and token counts
+split on whitespace, so only the query-side overhead is measured and no network access
+or tokenizer download is needed.
+
+Usage:
+    python -m tests.benchmarks.bench_query_engine --entities 50000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import tiktoken
+
+import graphrag.config.defaults as defs
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.embeddings import entity_description_embedding
+from graphrag.config.enums import ModelType
+from graphrag.data_model.types import TextEmbedder
+from graphrag.query.engine import QueryEngine
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+
+class _WordEncoder:
+    def encode(self, text: str, **kwargs: Any) -> list[str]:
+        return text.split()
+
+    def decode(self, tokens: list[str]) -> str:
+        return " ".join(tokens)
+
+
+class _FixedVectorStore(BaseVectorStore):
+    def __init__(self, documents: list[VectorStoreDocument]) -> None:
+        super().__init__("benchmark")
+        self.documents = documents
+
+    def connect(self, **kwargs: Any) -> None:
+        pass
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        self.documents = documents
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        return [
+            VectorStoreSearchResult(document=document, score=1)
+            for document in random.sample(self.documents, k)
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        return self.similarity_search_by_vector(text_embedder(text), k)
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        return None
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        return VectorStoreDocument(id=id, text=None, vector=None)
+
+
+def _index_tables(
+    n_entities: int, n_relationships: int, n_text_units: int, n_communities: int
+) -> dict[str, pd.DataFrame]:
+    rng = random.Random(0)
+    entity_ids = [f"e{i}" for i in range(n_entities)]
+    text_unit_ids = [f"t{i}" for i in range(n_text_units)]
+    entity_text_units = [rng.sample(text_unit_ids, 3) for _ in range(n_entities)]
+    entity_communities = [rng.randrange(n_communities) for _ in range(n_entities)]
+    community_entities = [[] for _ in range(n_communities)]
+    for entity_id, community in zip(entity_ids, entity_communities, strict=True):
+        community_entities[community].append(entity_id)
+
+    entities = pd.DataFrame({
+        "id": entity_ids,
+        "human_readable_id": range(n_entities),
+        "title": [f"ENTITY {i}" for i in range(n_entities)],
+        "type": "ORGANIZATION",
+        "description": "an entity description of a few words",
+        "text_unit_ids": entity_text_units,
+        "frequency": 1,
+        "degree": [rng.randrange(1, 50) for _ in range(n_entities)],
+        "x": 0.0,
+        "y": 0.0,
+    })
+    relationships = pd.DataFrame({
+        "id": [f"r{i}" for i in range(n_relationships)],
+        "human_readable_id": range(n_relationships),
+        "source": [
+            f"ENTITY {rng.randrange(n_entities)}" for _ in range(n_relationships)
+        ],
+        "target": [
+            f"ENTITY {rng.randrange(n_entities)}" for _ in range(n_relationships)
+        ],
+        "description": "a relationship description of a few words",
+        "weight": 1.0,
+        "combined_degree": [rng.randrange(1, 100) for _ in range(n_relationships)],
+        "text_unit_ids": [rng.sample(text_unit_ids, 1) for _ in range(n_relationships)],
+    })
+    text_units = pd.DataFrame({
+        "id": text_unit_ids,
+        "human_readable_id": range(n_text_units),
+        "text": "a text unit " * 50,
+        "n_tokens": 150,
+        "document_ids": [["d0"]] * n_text_units,
+        "entity_ids": [[]] * n_text_units,
+        "relationship_ids": [[]] * n_text_units,
+        "covariate_ids": [[]] * n_text_units,
+    })
+    communities = pd.DataFrame({
+        "id": [f"c{i}" for i in range(n_communities)],
+        "human_readable_id": range(n_communities),
+        "community": range(n_communities),
+        "level": 0,
+        "parent": -1,
+        "children": [[]] * n_communities,
+        "title": [f"Community {i}" for i in range(n_communities)],
+        "entity_ids": community_entities,
+        "relationship_ids": [[]] * n_communities,
+        "text_unit_ids": [[]] * n_communities,
+        "period": "2024-01-01",
+        "size": [len(members) for members in community_entities],
+    })
+    community_reports = pd.DataFrame({
+        "id": [f"report{i}" for i in range(n_communities)],
+        "human_readable_id": range(n_communities),
+        "community": range(n_communities),
+        "level": 0,
+        "parent": -1,
+        "children": [[]] * n_communities,
+        "title": [f"Community {i}" for i in range(n_communities)],
+        "summary": "a community summary",
+        "full_content": "a community report " * 20,
+        "rank": 1.0,
+        "rank_explanation": "",
+        "findings": [[]] * n_communities,
+        "full_content_json": "{}",
+        "period": "2024-01-01",
+        "size": [len(members) for members in community_entities],
+    })
+    return {
+        "entities": entities,
+        "relationships": relationships,
+        "text_units": text_units,
+        "communities": communities,
+        "community_reports": community_reports,
+    }
+
+
+async def _measure(name: str, create_engine: Any, queries: int) -> None:
+    if queries <= 0:
+        return
+    latencies = []
+    for i in range(queries):
+        start = time.perf_counter()
+        engine = create_engine()
+        await engine.local_search(f"question {i}", community_level=0)
+        latencies.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(f"{name:>6}: p50 {p50:10.2f}ms  p99 {p99:10.2f}ms  ({queries} queries)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=50_000)
+    parser.add_argument("--relationships", type=int, default=200_000)
+    parser.add_argument("--text-units", type=int, default=20_000)
+    parser.add_argument("--communities", type=int, default=2_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--api-queries", type=int, default=10)
+    args = parser.parse_args()
+
+    tiktoken.get_encoding = lambda name: _WordEncoder()  # type: ignore
+    config = create_graphrag_config({
+        "models": {
+            defs.DEFAULT_CHAT_MODEL_ID: {
+                "api_key": "NOT_AN_API_KEY",
+                "type": ModelType.MockChat,
+                "model": defs.DEFAULT_CHAT_MODEL,
+                "responses": ["answer"],
+            },
+            defs.DEFAULT_EMBEDDING_MODEL_ID: {
+                "api_key": "NOT_AN_API_KEY",
+                "type": ModelType.MockEmbedding,
+                "model": defs.DEFAULT_EMBEDDING_MODEL,
+            },
+        }
+    })
+    tables = _index_tables(
+        args.entities, args.relationships, args.text_units, args.communities
+    )
+    embedding_stores = {
+        entity_description_embedding: _FixedVectorStore([
+            VectorStoreDocument(id=entity_id, text=None, vector=None)
+            for entity_id in tables["entities"]["id"]
+        ])
+    }
+
+    def create_engine() -> QueryEngine:
+        return QueryEngine(config, **tables, embedding_stores=embedding_stores)
+
+    asyncio.run(_measure("api", create_engine, args.api_queries))
+
+    engine = create_engine()
+    start = time.perf_counter()
+    asyncio.run(engine.local_search("warm up", community_level=0))
+    print(f"engine warmed up in {time.perf_counter() - start:.2f}s")
+    asyncio.run(_measure("engine", lambda: engine, args.queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Wall time, peak traced memory and event loop stall of writing a GraphML snapshot.
+
+`networkx` is the previous snapshot: it builds a networkx graph of the relationships,
+joins the whole `nx.generate_graphml` output into one string on the event loop and
+writes it to storage. `stream` builds the CSRGraph of the same relationships and writes
+it in chunks from worker threads, as finalize_graph does. The stall is the longest a 10ms heartbeat task on the event loop
+waited beyond its interval while the snapshot was written to a file storage.
+
+Usage:
+    python -m tests.benchmarks.bench_snapshot_graphml --edges 1000000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.snapshot_graphml import snapshot_graphml
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+
+async def _networkx(relationships: pd.DataFrame, storage: PipelineStorage) -> None:
+    graph = create_graph(relationships)
+    await storage.set("graph.graphml", "\n".join(nx.generate_graphml(graph)))
+
+
+async def _stream(relationships: pd.DataFrame, storage: PipelineStorage) -> None:
+    graph = await asyncio.to_thread(CSRGraph.from_edges, relationships)
+    await snapshot_graphml(graph, "graph", storage)
+
+
+async def _with_heartbeat(snapshot: Any, relationships: pd.DataFrame, root: str):
+    stall = 0.0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal stall
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stall = max(stall, time.perf_counter() - start - 0.01)
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    await snapshot(relationships, FilePipelineStorage(root))
+    done = True
+    await task
+    return stall
+
+
+def _measure(name: str, snapshot: Any, relationships: pd.DataFrame) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        stall = asyncio.run(_with_heartbeat(snapshot, relationships, root))
+        seconds = time.perf_counter() - start
+        # tracing slows Python down a lot, so memory is measured in a second run
+        tracemalloc.start()
+        asyncio.run(snapshot(relationships, FilePipelineStorage(root)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(
+        f"{name:>8}: {seconds:8.2f}s  peak {peak / 2**20:9.1f} MiB  "
+        f"event loop stall {stall * 1000:9.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    names = np.asarray([f"ENTITY {i}" for i in range(args.nodes)], dtype=object)
+    relationships = pd.DataFrame({
+        "source": names[rng.integers(0, args.nodes, args.edges)],
+        "target": names[rng.integers(0, args.nodes, args.edges)],
+    }).drop_duplicates(subset=["source", "target"], ignore_index=True)
+
+    _measure("networkx", _networkx, relationships)
+    _measure("stream", _stream, relationships)
+
+
+if __name__ == "__main__":
+    main()
@@ -64,3 +64,15 @@ async def test_child():
     await storage.delete("test.txt")
     output = await storage.get("test.txt")
     assert output is None
+
+
+async def test_set_chunks():
+    storage = FilePipelineStorage()
+    await storage.set_chunks("test.txt", iter(["Hello, ", "Wörld", "!"]))
+    output = await storage.get("test.txt")
+    assert output == "Hello, Wörld!"
+
+    await storage.set_chunks("test.txt", iter([b"Hello, ", b"World!"]))
+    output = await storage.get("test.txt", as_bytes=True)
+    assert output == b"Hello, World!"
+    await storage.delete("test.txt")
@@ -158,6 +158,8 @@ def assert_cache_configs(actual: CacheConfig, expected: CacheConfig) -> None:
     assert actual.container_name == expected.container_name
     assert actual.storage_account_blob_url == expected.storage_account_blob_url
     assert actual.cosmosdb_account_url == expected.cosmosdb_account_url
+    assert actual.memory_max_entries == expected.memory_max_entries
+    assert actual.memory_max_bytes == expected.memory_max_bytes
 
 
 def assert_input_configs(actual: InputConfig, expected: InputConfig) -> None:
@@ -208,6 +210,7 @@ def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) ->
     assert actual.encoding_model == expected.encoding_model
     assert actual.prepend_metadata == expected.prepend_metadata
     assert actual.chunk_size_includes_metadata == expected.chunk_size_includes_metadata
+    assert actual.num_workers == expected.num_workers
 
 
 def assert_snapshots_configs(
@@ -249,6 +252,8 @@ def assert_extract_graph_nlp_configs(
     assert actual.normalize_edge_weights == expected.normalize_edge_weights
     assert_text_analyzer_configs(actual.text_analyzer, expected.text_analyzer)
     assert actual.concurrent_requests == expected.concurrent_requests
+    assert actual.batch_size == expected.batch_size
+    assert actual.num_processes == expected.num_processes
 
 
 def assert_prune_graph_configs(
@@ -0,0 +1,101 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+
+from graphrag.cache import embedding_cache
+from graphrag.cache.embedding_cache import EmbeddingCache
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+
+def _vectors(n: int, offset: int = 0) -> list[np.ndarray]:
+    return list(np.arange(offset, offset + n * 4, dtype=np.float32).reshape(n, 4))
+
+
+async def test_lookup_returns_none_for_misses():
+    cache = EmbeddingCache(InMemoryCache(), "model")
+
+    assert await cache.lookup(["a", "b"]) == [None, None]
+
+
+async def test_roundtrip_through_file_cache(tmp_path):
+    backing = JsonPipelineCache(FilePipelineStorage(root_dir=str(tmp_path)))
+    vectors = _vectors(3)
+    await EmbeddingCache(backing, "model").add(["a", "b", "c"], vectors)
+
+    # a fresh instance reloads the persisted segments
+    reloaded = await EmbeddingCache(backing, "model").lookup(["c", "x", "a"])
+
+    assert reloaded[1] is None
+    np.testing.assert_array_equal(reloaded[0], vectors[2])
+    np.testing.assert_array_equal(reloaded[2], vectors[0])
+    assert reloaded[0].dtype == np.float32
+
+
+async def test_models_do_not_share_vectors():
+    backing = InMemoryCache()
+    await EmbeddingCache(backing, "model-a").add(["a"], _vectors(1))
+
+    assert await EmbeddingCache(backing, "model-b").lookup(["a"]) == [None]
+
+
+class CountingCache(InMemoryCache):
+    def __init__(self):
+        super().__init__()
+        self.bytes_written = 0
+
+    async def set_bytes(self, key: str, value: bytes) -> None:
+        self.bytes_written += len(value)
+        await super().set_bytes(key, value)
+
+
+async def test_segments_are_merged_geometrically():
+    backing = CountingCache()
+    cache = EmbeddingCache(backing, "model")
+
+    for i in range(64):
+        await cache.add([f"text {i}"], _vectors(1, offset=i * 4))
+
+    reloaded = EmbeddingCache(backing, "model")
+    result = await reloaded.lookup([f"text {i}" for i in range(64)])
+
+    for i, vector in enumerate(result):
+        np.testing.assert_array_equal(vector, _vectors(1, offset=i * 4)[0])
+    # O(log n) segments, each row rewritten O(log n) times
+    assert len(reloaded._segments) <= 7  # noqa: SLF001
+    row_bytes = 4 * 4 + embedding_cache.DIGEST_SIZE
+    assert backing.bytes_written <= 64 * row_bytes * 8
+    # merged segments are deleted, only the manifest and two entries per segment stay
+    assert len(backing._cache) == 1 + 2 * len(reloaded._segments)  # noqa: SLF001
+
+
+async def test_vectors_are_stored_as_raw_float32(tmp_path):
+    backing = JsonPipelineCache(FilePipelineStorage(root_dir=str(tmp_path)))
+    await EmbeddingCache(backing, "model").add(["a", "b", "c"], _vectors(3))
+
+    vectors = [path for path in tmp_path.iterdir() if path.name.endswith("-vectors")]
+    assert len(vectors) == 1
+    assert vectors[0].read_bytes() == np.stack(_vectors(3)).astype("<f4").tobytes()
+
+
+async def test_json_only_cache_stores_base64(tmp_path):
+    backing = JsonPipelineCache(
+        FilePipelineStorage(root_dir=str(tmp_path)), raw_bytes=False
+    )
+    await EmbeddingCache(backing, "model").add(["a"], _vectors(1))
+
+    reloaded = await EmbeddingCache(backing, "model").lookup(["a"])
+    np.testing.assert_array_equal(reloaded[0], _vectors(1)[0])
+
+
+def test_for_model_shares_instances():
+    backing = InMemoryCache()
+
+    assert EmbeddingCache.for_model(backing, "m") is EmbeddingCache.for_model(
+        backing, "m"
+    )
+    assert EmbeddingCache.for_model(backing, "m") is not EmbeddingCache.for_model(
+        InMemoryCache(), "m"
+    )
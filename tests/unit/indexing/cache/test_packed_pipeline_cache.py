@@ -0,0 +1,148 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import os
+import threading
+
+import graphrag.cache.packed_pipeline_cache as packed
+from graphrag.cache.factory import CacheFactory
+from graphrag.cache.packed_pipeline_cache import PackedPipelineCache
+from graphrag.config.enums import CacheType
+
+
+async def test_roundtrip_and_reload(tmp_path):
+    path = tmp_path / "cache.packed"
+    cache = PackedPipelineCache(path)
+    await cache.set("a", {"x": [1, 2]}, {"input": "prompt"})
+    await cache.set("b", "ü text")
+    await cache.set("none", None)
+
+    assert await cache.get("a") == {"x": [1, 2]}
+    assert await cache.get("missing") is None
+    assert await cache.has("b")
+    assert not await cache.has("none")
+
+    del cache
+    reloaded = PackedPipelineCache(path)
+    assert await reloaded.get("a") == {"x": [1, 2]}
+    assert await reloaded.get("b") == "ü text"
+
+
+async def test_overwrite_and_delete_survive_reload(tmp_path):
+    path = tmp_path / "cache.packed"
+    cache = PackedPipelineCache(path)
+    await cache.set("a", 1)
+    await cache.set("a", 2)
+    await cache.set("b", 3)
+    await cache.delete("b")
+
+    del cache
+    reloaded = PackedPipelineCache(path)
+    assert await reloaded.get("a") == 2
+    assert not await reloaded.has("b")
+
+
+async def test_child_namespaces_and_clear(tmp_path):
+    cache = PackedPipelineCache(tmp_path / "cache.packed")
+    child = cache.child("extract")
+    await cache.set("key", "root")
+    await child.set("key", "child")
+
+    assert await cache.get("key") == "root"
+    assert await child.get("key") == "child"
+    assert await cache.get("extract/key") == "child"
+
+    await child.clear()
+    assert not await child.has("key")
+    assert await cache.get("key") == "root"
+
+    await cache.clear()
+    assert not await cache.has("key")
+    del cache, child
+    reloaded = PackedPipelineCache(tmp_path / "cache.packed")
+    assert not await reloaded.has("key")
+    assert not await reloaded.has("extract/key")
+
+
+async def test_torn_tail_is_truncated(tmp_path):
+    path = tmp_path / "cache.packed"
+    cache = PackedPipelineCache(path)
+    await cache.set("a", "kept")
+    cache.flush()
+    size = path.stat().st_size
+    await cache.set("b", "torn")
+    del cache
+    with path.open("r+b") as file:
+        file.truncate(path.stat().st_size - 3)
+
+    reloaded = PackedPipelineCache(path)
+    assert await reloaded.get("a") == "kept"
+    assert not await reloaded.has("b")
+    assert path.stat().st_size == size
+
+    await reloaded.set("c", "after")
+    del reloaded
+    assert await PackedPipelineCache(path).get("c") == "after"
+
+
+async def test_compaction_drops_dead_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(packed, "COMPACTION_MIN_BYTES", 1024)
+    path = tmp_path / "cache.packed"
+    cache = PackedPipelineCache(path)
+    for i in range(200):
+        await cache.set("hot", "x" * 100 + str(i))
+    await cache.set("cold", "value")
+
+    assert path.stat().st_size < 200 * 100
+    assert await cache.get("hot") == "x" * 100 + "199"
+    del cache
+    reloaded = PackedPipelineCache(path)
+    assert await reloaded.get("hot") == "x" * 100 + "199"
+    assert await reloaded.get("cold") == "value"
+
+
+async def test_fsync_and_compaction_run_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(packed, "COMPACTION_MIN_BYTES", 1024)
+    loop_thread = threading.current_thread()
+    fsync_threads = []
+    fsync = os.fsync
+
+    def recording_fsync(fd):
+        fsync_threads.append(threading.current_thread())
+        fsync(fd)
+
+    monkeypatch.setattr(packed.os, "fsync", recording_fsync)
+    path = tmp_path / "cache.packed"
+    cache = PackedPipelineCache(path, sync_every=8)
+    fsync_threads.clear()
+    for i in range(200):
+        await cache.set_bytes("hot", b"x" * 100 + str(i).encode())
+    await cache.delete("hot")
+
+    # the periodic fsyncs and the compactions, which fsync the rewritten file
+    assert len(fsync_threads) > 25
+    assert loop_thread not in fsync_threads
+    assert path.stat().st_size < 200 * 100
+    assert await cache.get_bytes("hot") is None
+
+
+async def test_caches_on_one_path_share_the_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(packed, "COMPACTION_MIN_BYTES", 1024)
+    path = tmp_path / "cache.packed"
+    first = PackedPipelineCache(path)
+    second = PackedPipelineCache(tmp_path / "." / "cache.packed")
+    # the first cache compacts and replaces the file the second one writes to
+    for i in range(200):
+        await first.set("hot", "x" * 100 + str(i))
+    await second.set("cold", "value")
+
+    assert await first.get("cold") == "value"
+    del first, second
+    assert await PackedPipelineCache(path).get("cold") == "value"
+
+
+def test_factory_creates_packed_cache(tmp_path):
+    cache = CacheFactory.create_cache(
+        CacheType.packed, str(tmp_path), {"base_dir": "cache"}
+    )
+    assert isinstance(cache, PackedPipelineCache)
+    assert os.path.exists(tmp_path / "cache" / "cache.packed")
@@ -0,0 +1,94 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from graphrag.cache.factory import CacheFactory
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
+from graphrag.config.enums import CacheType
+
+
+class CountingCache(InMemoryCache):
+    def __init__(self, name: str | None = None):
+        super().__init__(name)
+        self.gets = 0
+
+    async def get(self, key: str):
+        self.gets += 1
+        return await super().get(key)
+
+
+async def test_repeated_gets_are_served_from_memory():
+    backend = CountingCache()
+    await backend.set("prompt", {"text": "answer"})
+    cache = TieredPipelineCache(backend, max_entries=10, max_bytes=1024)
+
+    for _ in range(3):
+        assert await cache.get("prompt") == {"text": "answer"}
+    assert await cache.get("missing") is None
+
+    assert backend.gets == 2
+    assert cache.stats.snapshot() == {
+        "memory_hits": 2,
+        "backend_hits": 1,
+        "misses": 1,
+        "evictions": 0,
+    }
+
+
+async def test_returned_values_do_not_alias_the_memory_tier():
+    cache = TieredPipelineCache(InMemoryCache(), max_entries=10, max_bytes=1024)
+    await cache.set("key", {"items": [1]})
+    value = await cache.get("key")
+    value["items"].append(2)
+    assert await cache.get("key") == {"items": [1]}
+
+
+async def test_evicts_least_recently_used_by_count_and_size():
+    backend = CountingCache()
+    cache = TieredPipelineCache(backend, max_entries=2, max_bytes=20)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    await cache.get("a")
+    await cache.set("c", "3")
+    assert cache.stats.evictions == 1
+
+    await cache.get("a")
+    await cache.get("c")
+    assert backend.gets == 0
+    await cache.get("b")
+    assert backend.gets == 1
+
+    await cache.set("big", "x" * 30)
+    assert await cache.has("big")
+    await cache.get("big")
+    assert backend.gets == 2
+
+
+async def test_children_share_tier_and_stats():
+    cache = TieredPipelineCache(InMemoryCache(), max_entries=10, max_bytes=1024)
+    first = cache.child("extract")
+    second = cache.child("summarize")
+    await first.set("key", "first")
+    await second.set("key", "second")
+
+    assert await first.get("key") == "first"
+    assert await second.get("key") == "second"
+    assert cache.stats.memory_hits == 2
+
+    await first.delete("key")
+    assert not await first.has("key")
+    assert await second.get("key") == "second"
+
+
+def test_factory_wraps_persistent_caches(tmp_path):
+    kwargs = {"base_dir": "cache", "memory_max_entries": 10, "memory_max_bytes": 100}
+    cache = CacheFactory.create_cache(CacheType.file, str(tmp_path), kwargs)
+    assert isinstance(cache, TieredPipelineCache)
+
+    kwargs["memory_max_entries"] = 0
+    cache = CacheFactory.create_cache(CacheType.file, str(tmp_path), kwargs)
+    assert isinstance(cache, JsonPipelineCache)
+    assert isinstance(
+        CacheFactory.create_cache(CacheType.memory, str(tmp_path), kwargs),
+        InMemoryCache,
+    )
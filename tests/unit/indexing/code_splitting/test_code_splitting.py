@@ -0,0 +1,165 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from graphrag.index.code_splitting import code_splitting
+from graphrag.index.code_splitting.code_splitting import (
+    chunk_code_with_ast_scope,
+    chunk_code_with_ast_scope_incremental,
+    split_code_text_groups,
+    split_multiple_code_texts_on_tokens,
+)
+from graphrag.index.text_splitting.text_splitting import Tokenizer
+
+SOURCE = '''import os
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
+
+
+class Outer:
+    """Outer class."""
+
+    def method(self, value):
+        result = defaultdict(list)
+        for item in value:
+            result[item].append(os.sep)
+        return result
+
+    class Inner:
+        async def fetch(self):
+            return OrderedDict()
+
+
+def top_level(a, b):
+    def nested(c):
+        return c * 2
+
+    return nested(a) + nested(b)
+'''
+
+
+class CharTokenizer:
+    def encode(self, text):
+        return [ord(char) for char in text]
+
+
+class WordTokenizer:
+    """Merges leading whitespace into the next word, so counts are not additive."""
+
+    def encode(self, text):
+        return re.findall(r"\s*\S+|\s+", text)
+
+
+@pytest.mark.parametrize("tokenizer", [CharTokenizer(), WordTokenizer()])
+@pytest.mark.parametrize("max_tokens", [1, 8, 40, 120, 10_000])
+@pytest.mark.parametrize("token_overlap", [0, 5, 50])
+def test_incremental_matches_reference(tokenizer, max_tokens, token_overlap):
+    expected = chunk_code_with_ast_scope(SOURCE, tokenizer, max_tokens, token_overlap)
+    actual = chunk_code_with_ast_scope_incremental(
+        SOURCE, tokenizer, max_tokens, token_overlap
+    )
+
+    assert [chunk for chunk, _ in actual] == expected
+    assert [n_tokens for _, n_tokens in actual] == [
+        len(tokenizer.encode(chunk)) for chunk in expected
+    ]
+
+
+def test_incremental_encodes_linear_amount_of_text():
+    source = "\n".join(f"value_{i} = {i}" for i in range(2_000))
+    reference, incremental = Mock(), Mock()
+    reference.encode.side_effect = incremental.encode.side_effect = list
+
+    chunk_code_with_ast_scope(source, reference, 2_000)
+    chunk_code_with_ast_scope_incremental(source, incremental, 2_000)
+
+    def encoded_chars(tokenizer):
+        return sum(len(call.args[0]) for call in tokenizer.encode.call_args_list)
+
+    assert encoded_chars(incremental) < 5 * len(source)
+    assert encoded_chars(reference) > 10 * encoded_chars(incremental)
+
+
+def test_split_multiple_code_texts_on_tokens():
+    tokenizer = Tokenizer(
+        chunk_overlap=0,
+        tokens_per_chunk=60,
+        decode=lambda tokens: "".join(chr(token) for token in tokens),
+        encode=lambda text: [ord(char) for char in text],
+    )
+    tick = Mock()
+
+    chunks = split_multiple_code_texts_on_tokens([SOURCE, "x = 1"], tokenizer, tick)
+
+    assert chunks[-1].text_chunk == "x = 1"
+    assert chunks[-1].source_doc_indices == [1]
+    assert all(chunk.n_tokens == len(chunk.text_chunk) for chunk in chunks)
+    assert tick.call_count == 2
+
+
+def encode_chars(text):
+    return [ord(char) for char in text]
+
+
+def decode_chars(tokens):
+    return "".join(chr(token) for token in tokens)
+
+
+def test_split_multiple_code_texts_on_tokens_process_pool():
+    tokenizer = Tokenizer(
+        chunk_overlap=10,
+        tokens_per_chunk=80,
+        decode=decode_chars,
+        encode=encode_chars,
+    )
+    texts = [SOURCE, "x = 1", SOURCE.replace("Outer", "Other"), "y = 2"]
+    serial_tick, parallel_tick = Mock(), Mock()
+
+    serial = split_multiple_code_texts_on_tokens(texts, tokenizer, serial_tick)
+    parallel = split_multiple_code_texts_on_tokens(
+        texts, tokenizer, parallel_tick, num_workers=2
+    )
+
+    assert parallel == serial
+    assert [chunk.source_doc_indices[0] for chunk in parallel] == sorted(
+        chunk.source_doc_indices[0] for chunk in parallel
+    )
+    assert parallel_tick.call_count == len(texts)
+
+
+def test_split_code_text_groups_in_one_pool(monkeypatch):
+    pools = []
+
+    class CountingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(code_splitting, "ProcessPoolExecutor", CountingPool)
+    small = Tokenizer(
+        chunk_overlap=0, tokens_per_chunk=60, decode=decode_chars, encode=encode_chars
+    )
+    large = Tokenizer(
+        chunk_overlap=10, tokens_per_chunk=80, decode=decode_chars, encode=encode_chars
+    )
+    groups = [[SOURCE], ["x = 1", SOURCE.replace("Outer", "Other")], ["y = 2"]]
+    tick = Mock()
+
+    parallel = split_code_text_groups(groups, [small, large, small], tick, 2)
+    assert len(pools) == 1
+
+    assert parallel == [
+        split_multiple_code_texts_on_tokens(groups[0], small, Mock()),
+        split_multiple_code_texts_on_tokens(groups[1], large, Mock()),
+        split_multiple_code_texts_on_tokens(groups[2], small, Mock()),
+    ]
+    assert parallel[1][0].source_doc_indices == [0]
+    assert parallel[1][-1].source_doc_indices == [1]
+    assert tick.call_count == 4
@@ -3,8 +3,13 @@
 import unittest
 
 import networkx as nx
+import pandas as pd
 
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.stable_lcc import (
+    _stable_largest_connected_component_networkx,
+    stable_largest_connected_component,
+)
 
 
 class TestStableLCC(unittest.TestCase):
@@ -46,6 +51,45 @@ class TestStableLCC(unittest.TestCase):
             nx.generate_graphml(graph_out_2)
         )
 
+    def test_matches_networkx_implementation_on_fixtures(self):
+        entities = pd.read_parquet("tests/verbs/data/entities.parquet")
+        relationships = pd.read_parquet("tests/verbs/data/relationships.parquet")
+        # lower-case some titles so normalization has nodes to merge
+        relationships.loc[::7, "source"] = relationships.loc[::7, "source"].str.lower()
+        graph = create_graph(
+            relationships,
+            edge_attr=["description", "weight"],
+            nodes=entities.loc[:, ["title", "type", "description", "frequency"]],
+        )
+        graph.add_edge("ISOLATED A", "ISOLATED B")
+
+        expected = _stable_largest_connected_component_networkx(graph)
+        actual = stable_largest_connected_component(graph)
+
+        assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+        assert "".join(nx.generate_graphml(actual)) == "".join(
+            nx.generate_graphml(expected)
+        )
+
+    def test_matches_networkx_implementation_for_edge_key_ties(self):
+        graph = nx.Graph()
+        for source, target in [
+            ("A", "A !"),
+            ("A (X)", "B"),
+            ("A -> B", "A"),
+            ("a", "B"),
+            ("A", "C"),
+            ("B ", "A -"),
+        ]:
+            graph.add_edge(source, target, key=f"{source}|{target}")
+
+        expected = _stable_largest_connected_component_networkx(graph)
+        actual = stable_largest_connected_component(graph)
+
+        assert list(actual.nodes) == list(expected.nodes)
+        assert list(actual.edges) == list(expected.edges)
+
     def _create_strongly_connected_graph(self, digraph=False):
         graph = nx.Graph() if not digraph else nx.DiGraph()
         graph.add_node("1", node_name=1)
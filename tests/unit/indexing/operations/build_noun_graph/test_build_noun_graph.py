@@ -0,0 +1,145 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import math
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.index.operations.build_noun_graph.build_noun_graph import (
+    _extract_nodes,
+    build_noun_graph,
+)
+from graphrag.index.operations.build_noun_graph.np_extractors.base import (
+    BaseNounPhraseExtractor,
+)
+
+
+class SplitExtractor(BaseNounPhraseExtractor):
+    """Treat every comma separated part of the text as a noun phrase."""
+
+    def __init__(self):
+        super().__init__(model_name=None)
+
+    def extract(self, text: str) -> list[str]:
+        return [phrase for phrase in text.split(",") if phrase]
+
+    def __str__(self) -> str:
+        return "split"
+
+
+TEXT_UNITS = pd.DataFrame({
+    "id": ["t2", "t1", "t3", "t4"],
+    "text": ["b,a,c", "c,a", "d", ""],
+})
+
+
+async def test_build_noun_graph_edges():
+    nodes, edges = await build_noun_graph(
+        TEXT_UNITS.copy(), SplitExtractor(), normalize_edge_weights=False
+    )
+
+    assert nodes.to_dict("records") == [
+        {"title": "a", "frequency": 2, "text_unit_ids": ["t2", "t1"]},
+        {"title": "b", "frequency": 1, "text_unit_ids": ["t2"]},
+        {"title": "c", "frequency": 2, "text_unit_ids": ["t2", "t1"]},
+        {"title": "d", "frequency": 1, "text_unit_ids": ["t3"]},
+    ]
+    assert edges.to_dict("records") == [
+        {"source": "a", "target": "b", "weight": 1, "text_unit_ids": ["t2"]},
+        {"source": "a", "target": "c", "weight": 2, "text_unit_ids": ["t1", "t2"]},
+        {"source": "b", "target": "c", "weight": 1, "text_unit_ids": ["t2"]},
+    ]
+
+
+async def test_build_noun_graph_pmi_weights():
+    _, edges = await build_noun_graph(
+        TEXT_UNITS.copy(), SplitExtractor(), normalize_edge_weights=True
+    )
+
+    # 4 co-occurrences over 6 noun phrase occurrences
+    assert edges["weight"].tolist() == [
+        math.log2((1 / 4) / ((2 / 6) * (1 / 6))),
+        math.log2((2 / 4) / ((2 / 6) * (2 / 6))),
+        math.log2((1 / 4) / ((1 / 6) * (2 / 6))),
+    ]
+    assert list(edges.columns) == ["source", "target", "weight", "text_unit_ids"]
+
+
+@pytest.mark.parametrize("texts", [["a", "b"], ["", ""]])
+async def test_build_noun_graph_without_edges(texts):
+    text_units = pd.DataFrame({"id": ["t1", "t2"], "text": texts})
+
+    _, edges = await build_noun_graph(
+        text_units, SplitExtractor(), normalize_edge_weights=True
+    )
+
+    assert edges.empty
+    assert list(edges.columns) == ["source", "target", "weight", "text_unit_ids"]
+
+
+class SharedCache(InMemoryCache):
+    """An in memory cache whose children share its entries."""
+
+    def child(self, name: str) -> InMemoryCache:
+        return self
+
+
+class CountingExtractor(SplitExtractor):
+    """Records the texts that go through batch extraction."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def extract_batch(self, texts, batch_size=100, n_process=1):
+        texts = list(texts)
+        self.batches.append(texts)
+        return super().extract_batch(texts, batch_size=batch_size, n_process=n_process)
+
+
+async def test_extract_nodes_only_extracts_cache_misses():
+    cache = SharedCache()
+    extractor = CountingExtractor()
+    await _extract_nodes(TEXT_UNITS.copy(), extractor, cache=cache)
+    assert extractor.batches == [["b,a,c", "c,a", "d", ""]]
+
+    # the empty text has no noun phrases, so it is looked up as a miss again
+    text_units = pd.concat([TEXT_UNITS, pd.DataFrame({"id": ["t5"], "text": ["e,a"]})])
+    nodes = await _extract_nodes(text_units.copy(), extractor, cache=cache)
+    assert extractor.batches[1] == ["", "e,a"]
+    assert_frame_equal(nodes, await _extract_nodes(text_units.copy(), SplitExtractor()))
+
+
+class FailingExtractor(SplitExtractor):
+    """Fails on the text "fail"."""
+
+    def extract(self, text: str) -> list[str]:
+        if text == "fail":
+            msg = "extraction failed"
+            raise RuntimeError(msg)
+        return super().extract(text)
+
+
+async def test_extract_nodes_caches_batches_as_they_complete():
+    cache = SharedCache()
+    text_units = pd.DataFrame({
+        "id": ["t1", "t2", "t3", "t4"],
+        "text": ["b,a", "c", "d", "fail"],
+    })
+    with pytest.raises(RuntimeError, match="extraction failed"):
+        await _extract_nodes(text_units, FailingExtractor(), cache=cache, batch_size=2)
+
+    # the first batch was cached before the second one failed
+    extractor = CountingExtractor()
+    await _extract_nodes(text_units.iloc[:3].copy(), extractor, cache=cache)
+    assert extractor.batches == [["d"]]
+
+
+def test_extract_batch_with_processes():
+    texts = TEXT_UNITS["text"].tolist()
+    assert list(SplitExtractor().extract_batch(texts, batch_size=1, n_process=2)) == [
+        SplitExtractor().extract(text) for text in texts
+    ]
@@ -11,7 +11,9 @@ import pytest
 from graphrag.config.enums import ChunkStrategyType
 from graphrag.index.operations.chunk_text.chunk_text import (
     _get_num_total,
+    chunk_code_groups,
     chunk_text,
+    chunk_text_groups,
     load_strategy,
     run_strategy,
 )
@@ -178,3 +180,63 @@ def test_chunk_text(mock_progress_ticker, mock_run_strategy, mock_load_strategy)
     mock_run_strategy.assert_called_with(
         mock_load_strategy(), "The Shining", ANY, mock_progress_ticker()
     )
+
+
+class CharEncoding:
+    """An encoding with one token per character."""
+
+    def encode(self, text: str) -> list[int]:
+        return [ord(char) for char in text]
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        return [self.encode(text) for text in texts]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+@mock.patch(
+    "graphrag.index.operations.chunk_text.chunk_text.tiktoken.get_encoding",
+    return_value=CharEncoding(),
+)
+@mock.patch("graphrag.index.operations.chunk_text.chunk_text._TEXTS_PER_BATCH", 2)
+def test_chunk_text_groups(mock_get_encoding):
+    chunks = chunk_text_groups(
+        [["abcdef"], ["ab", "cd"], ["xyz"]],
+        [4, 3, 2],
+        overlap=1,
+        encoding_model="model",
+        callbacks=Mock(),
+    )
+
+    assert chunks == [
+        [TextChunk("abcd", [0], 4), TextChunk("def", [0], 3)],
+        [TextChunk("abc", [0, 1], 3), TextChunk("cd", [1], 2)],
+        [
+            TextChunk("xy", [0], 2),
+            TextChunk("yz", [0], 2),
+            TextChunk("z", [0], 1),
+        ],
+    ]
+    # the first two groups fill a batch, each batch resolves the encoding once
+    assert mock_get_encoding.call_count == 2
+
+
+@mock.patch(
+    "graphrag.index.operations.chunk_text.strategies.tiktoken.get_encoding",
+    return_value=CharEncoding(),
+)
+def test_chunk_code_groups(mock_get_encoding):
+    chunks = chunk_code_groups(
+        [["x = 1\ny = 2\n"], ["a = 1", "b = 2"]],
+        [6, 100],
+        overlap=0,
+        encoding_model="model",
+        callbacks=Mock(),
+    )
+
+    assert chunks == [
+        [TextChunk("x = 1", [0], 5), TextChunk("y = 2\n", [0], 6)],
+        [TextChunk("a = 1", [0], 5), TextChunk("b = 2", [1], 5)],
+    ]
+    assert mock_get_encoding.call_count == 1
@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.embed_text.embed_text import (
+    _text_embed_with_vector_store,
+)
+from graphrag.index.operations.embed_text.strategies.openai import (
+    _reconstitute_embeddings,
+)
+from graphrag.vector_stores.base import BaseVectorStore, VectorStoreDocument
+from graphrag.vector_stores.lancedb import LanceDBVectorStore
+
+
+class RecordingVectorStore(BaseVectorStore):
+    def __init__(self, fail_on_call: int | None = None):
+        super().__init__(collection_name="test")
+        self.calls: list[tuple[list[str], bool]] = []
+        self.fail_on_call = fail_on_call
+
+    def connect(self, **kwargs: Any) -> None:
+        pass
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        if len(self.calls) == self.fail_on_call:
+            msg = "store unavailable"
+            raise ConnectionError(msg)
+        self.calls.append(([str(document.id) for document in documents], overwrite))
+
+    def similarity_search_by_vector(self, query_embedding, k=10, **kwargs):
+        return []
+
+    def similarity_search_by_text(self, text, text_embedder, k=10, **kwargs):
+        return []
+
+    def filter_by_id(self, include_ids):
+        return None
+
+    def search_by_id(self, id):
+        return VectorStoreDocument(id=id, text=None, vector=None)
+
+
+def _input(n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [f"id-{i}" for i in range(n)],
+        "text": [f"text {i}" for i in range(n)],
+    })
+
+
+async def _embed(input: pd.DataFrame, vector_store: BaseVectorStore) -> list:
+    return await _text_embed_with_vector_store(
+        input=input,
+        callbacks=NoopWorkflowCallbacks(),
+        cache=NoopPipelineCache(),
+        embed_column="text",
+        strategy={"type": "mock"},
+        vector_store=vector_store,
+        vector_store_config={"batch_size": 3},
+    )
+
+
+async def test_pipelined_writes_keep_batch_order():
+    store = RecordingVectorStore()
+
+    result = await _embed(_input(10), store)
+
+    assert len(result) == 10
+    assert [ids for ids, _ in store.calls] == [
+        ["id-0", "id-1", "id-2"],
+        ["id-3", "id-4", "id-5"],
+        ["id-6", "id-7", "id-8"],
+        ["id-9"],
+    ]
+    assert [overwrite for _, overwrite in store.calls] == [True, False, False, False]
+
+
+async def test_pipelined_writes_surface_store_errors():
+    store = RecordingVectorStore(fail_on_call=1)
+
+    with pytest.raises(ConnectionError, match="store unavailable"):
+        await _embed(_input(30), store)
+    # no writer is left running
+    await asyncio.sleep(0)
+    assert len(store.calls) == 1
+
+
+async def test_lancedb_stores_float32_vectors(tmp_path):
+    store = LanceDBVectorStore(collection_name="vectors")
+    store.connect(db_uri=str(tmp_path))
+
+    await _embed(_input(7), store)
+
+    schema = store.document_collection.schema
+    assert schema.field("vector").type.value_type == "float"
+    assert store.document_collection.count_rows() == 7
+    results = store.similarity_search_by_vector(
+        np.ones(3, dtype=np.float32).tolist(), k=2
+    )
+    assert len(results) == 2
+
+
+def test_reconstitute_embeddings_returns_float32():
+    raw = list(np.arange(12, dtype=np.float32).reshape(4, 3) + 1)
+
+    embeddings = _reconstitute_embeddings(raw, [1, 0, 3])
+
+    assert embeddings[1] is None
+    assert embeddings[0] is not None
+    assert embeddings[0].dtype == np.float32
+    assert embeddings[2] is not None
+    assert embeddings[2].dtype == np.float32
+    assert np.isclose(np.linalg.norm(embeddings[2]), 1.0)
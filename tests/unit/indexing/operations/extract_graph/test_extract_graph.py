@@ -0,0 +1,119 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+import graphrag.index.operations.extract_graph.extract_graph as extract_graph_module
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.extract_graph.extract_graph import extract_graph
+from graphrag.index.operations.extract_graph.typing import EntityExtractionResult
+
+EXTRACTIONS = {
+    "t1": EntityExtractionResult(
+        entities=[
+            {"title": "A", "type": "PERSON", "description": "a1", "source_id": "t1"},
+            {"title": "B", "type": "GEO", "description": "b1", "source_id": "t1"},
+        ],
+        relationships=[
+            {
+                "source": "A",
+                "target": "B",
+                "weight": 1.0,
+                "description": "ab1",
+                "source_id": "t1",
+            }
+        ],
+        graph=None,
+    ),
+    "t2": EntityExtractionResult(entities=[], relationships=[], graph=None),
+    "t3": EntityExtractionResult(
+        entities=[
+            {"title": "B", "type": "GEO", "description": "b3", "source_id": "t3"},
+            {"title": "A", "type": "PERSON", "description": "a3", "source_id": "t3"},
+        ],
+        # strategies may still hand back relationships as a DataFrame
+        relationships=pd.DataFrame([
+            {
+                "source": "A",
+                "target": "B",
+                "weight": 2.0,
+                "description": "ab3",
+                "source_id": "t3",
+            }
+        ]),
+        graph=None,
+    ),
+}
+
+
+async def fake_strategy(docs, entity_types, callbacks, cache, config):  # noqa: RUF029
+    return EXTRACTIONS[docs[0].id]
+
+
+async def test_extract_graph_merges_results(monkeypatch):
+    monkeypatch.setattr(
+        extract_graph_module, "_load_strategy", lambda strategy_type: fake_strategy
+    )
+    text_units = pd.DataFrame({"id": list(EXTRACTIONS), "text": ["x", "y", "z"]})
+
+    entities, relationships = await extract_graph(
+        text_units,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        text_column="text",
+        id_column="id",
+        strategy=None,
+    )
+
+    assert entities.to_dict("records") == [
+        {
+            "title": "A",
+            "type": "PERSON",
+            "description": ["a1", "a3"],
+            "text_unit_ids": ["t1", "t3"],
+            "frequency": 2,
+        },
+        {
+            "title": "B",
+            "type": "GEO",
+            "description": ["b1", "b3"],
+            "text_unit_ids": ["t1", "t3"],
+            "frequency": 2,
+        },
+    ]
+    assert relationships.to_dict("records") == [
+        {
+            "source": "A",
+            "target": "B",
+            "description": ["ab1", "ab3"],
+            "text_unit_ids": ["t1", "t3"],
+            "weight": 3.0,
+        }
+    ]
+
+
+async def test_extract_graph_without_results(monkeypatch):
+    monkeypatch.setattr(
+        extract_graph_module, "_load_strategy", lambda strategy_type: fake_strategy
+    )
+    text_units = pd.DataFrame({"id": ["t2"], "text": ["y"]})
+
+    entities, relationships = await extract_graph(
+        text_units,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        text_column="text",
+        id_column="id",
+        strategy=None,
+    )
+
+    assert entities.empty
+    assert relationships.empty
+    assert list(entities.columns) == [
+        "title",
+        "type",
+        "description",
+        "text_unit_ids",
+        "frequency",
+    ]
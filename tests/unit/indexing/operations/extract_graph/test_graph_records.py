@@ -0,0 +1,97 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.index.operations.extract_graph.graph_records import ExtractedGraph
+
+FIRST_OUTPUT = """
+("entity"<|>company a<|>organization<|>Company A is a company)
+##
+("entity"<|>PERSON B<|>person<|>Person B runs Company A)
+##
+("relationship"<|>PERSON B<|>COMPANY A<|>Person B runs Company A<|>2)
+##
+<|COMPLETE|>
+""".strip()
+
+SECOND_OUTPUT = """
+("entity"<|>COMPANY A<|><|>Company A is a company)
+##
+("entity"<|>COMPANY A<|>organization<|>Company A makes many things)
+##
+("relationship"<|>COMPANY A<|>PERSON B<|>Person B founded Company A<|>not a number)
+##
+("relationship"<|>COMPANY A<|>CITY C<|>Company A is based in City C<|>1)
+##
+a record that is not a tuple
+""".strip()
+
+
+def parse(join_descriptions: bool = True) -> ExtractedGraph:
+    parsed = ExtractedGraph("<|>", "##", join_descriptions=join_descriptions)
+    parsed.add_output("0", FIRST_OUTPUT)
+    parsed.add_output("1", SECOND_OUTPUT)
+    return parsed
+
+
+def test_entities_are_merged():
+    assert parse().entities() == [
+        {
+            "title": "COMPANY A",
+            "type": "ORGANIZATION",
+            "description": "Company A is a company\nCompany A makes many things",
+            "source_id": "0, 1",
+        },
+        {
+            "title": "PERSON B",
+            "type": "PERSON",
+            "description": "Person B runs Company A",
+            "source_id": "0",
+        },
+        # entities only seen in relationships have no type or description
+        {"title": "CITY C", "type": "", "description": "", "source_id": "1"},
+    ]
+
+
+def test_relationships_are_merged_undirected():
+    assert parse().relationships() == [
+        {
+            "source": "COMPANY A",
+            "target": "PERSON B",
+            "weight": 3.0,
+            "description": "Person B runs Company A\nPerson B founded Company A",
+            "source_id": "0, 1",
+        },
+        {
+            "source": "COMPANY A",
+            "target": "CITY C",
+            "weight": 1.0,
+            "description": "Company A is based in City C",
+            "source_id": "1",
+        },
+    ]
+
+
+def test_without_joined_descriptions():
+    parsed = parse(join_descriptions=False)
+    assert [entity["description"] for entity in parsed.entities()] == [
+        "Company A makes many things",
+        "Person B runs Company A",
+        "",
+    ]
+    # relationships keep the latest description
+    assert [relationship["description"] for relationship in parsed.relationships()] == [
+        "Person B founded Company A",
+        "Company A is based in City C",
+    ]
+
+
+def test_to_networkx():
+    parsed = parse()
+    graph = parsed.to_networkx()
+
+    assert list(graph.nodes) == ["COMPANY A", "PERSON B", "CITY C"]
+    assert graph.nodes["COMPANY A"]["source_id"] == "0, 1"
+    assert list(graph.edges(data="weight")) == [
+        ("COMPANY A", "PERSON B", 3.0),
+        ("COMPANY A", "CITY C", 1.0),
+    ]
@@ -0,0 +1,46 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+import graphrag.data_model.schemas as schemas
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.index.operations.summarize_communities.explode_communities import (
+    explode_communities,
+)
+from graphrag.index.operations.summarize_communities.graph_context.context_builder import (
+    build_local_context,
+)
+from graphrag.index.workflows.create_community_reports import (
+    _prep_edges,
+    _prep_nodes,
+)
+
+DATA_DIR = "tests/verbs/data"
+
+
+async def test_build_local_context_in_process_pool():
+    entities = pd.read_parquet(f"{DATA_DIR}/entities.parquet")
+    communities = pd.read_parquet(f"{DATA_DIR}/communities.parquet")
+    relationships = pd.read_parquet(f"{DATA_DIR}/relationships.parquet")
+    nodes = _prep_nodes(explode_communities(communities, entities))
+    edges = _prep_edges(relationships)
+
+    contexts = {
+        async_mode: await build_local_context(
+            nodes,
+            edges,
+            None,
+            NoopWorkflowCallbacks(),
+            max_tokens=500,
+            async_mode=async_mode,
+            num_threads=2,
+        )
+        for async_mode in [AsyncType.AsyncIO, AsyncType.Process]
+    }
+
+    pd.testing.assert_frame_equal(
+        contexts[AsyncType.Process], contexts[AsyncType.AsyncIO]
+    )
+    assert contexts[AsyncType.Process][schemas.CONTEXT_EXCEED_FLAG].any()
@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+import graphrag.data_model.schemas as schemas
+import graphrag.index.operations.summarize_communities.summarize_communities as summarize_module
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.summarize_communities.summarize_communities import (
+    summarize_communities,
+)
+from graphrag.index.utils.derive_from_rows import ParallelizationError
+
+# community 0 is too big for its local context and has sub-communities 1 and 2,
+# community 3 fits and has sub-community 4
+COMMUNITIES = pd.DataFrame({
+    "community": [0, 3, 1, 2, 4],
+    "level": [0, 0, 1, 1, 1],
+    "children": [[1, 2], [4], [], [], []],
+})
+LOCAL_CONTEXTS = pd.DataFrame({
+    schemas.COMMUNITY_ID: [1, 2, 4, 0, 3],
+    schemas.COMMUNITY_LEVEL: [1, 1, 1, 0, 0],
+    schemas.CONTEXT_STRING: ["local"] * 5,
+    schemas.CONTEXT_EXCEED_FLAG: [False, False, False, True, False],
+})
+NODES = pd.DataFrame({schemas.COMMUNITY_LEVEL: [0, 1]})
+
+
+def level_context_builder(
+    report_df, community_hierarchy_df, local_context_df, level, max_tokens
+):
+    contexts = local_context_df.loc[
+        local_context_df[schemas.COMMUNITY_LEVEL] == level
+    ].copy()
+    if report_df is not None:
+        contexts[schemas.CONTEXT_STRING] = "reports " + ",".join(
+            str(community) for community in sorted(report_df[schemas.COMMUNITY_ID])
+        )
+    return contexts
+
+
+def create_report(community, context, level):
+    return {
+        "community": community,
+        "level": level,
+        "title": f"report {community}",
+        "full_content": context,
+    }
+
+
+async def run(monkeypatch, strategy, num_threads=2) -> pd.DataFrame:
+    monkeypatch.setattr(
+        summarize_module, "load_strategy", lambda strategy_type: strategy
+    )
+    return await summarize_communities(
+        NODES,
+        COMMUNITIES,
+        LOCAL_CONTEXTS,
+        level_context_builder,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        {"type": "fake"},
+        max_input_length=100,
+        num_threads=num_threads,
+    )
+
+
+async def test_parent_waits_only_on_its_sub_communities(monkeypatch):
+    parent_started = asyncio.Event()
+
+    async def strategy(community, context, level, callbacks, cache, args):
+        if community == 0:
+            parent_started.set()
+        if community == 4:
+            # 4 is not a sub-community of 0, so 0 must not wait for it
+            await asyncio.wait_for(parent_started.wait(), timeout=5)
+        return create_report(community, context, level)
+
+    reports = await run(monkeypatch, strategy)
+
+    assert reports["community"].tolist() == [1, 2, 4, 0, 3]
+    contents = dict(zip(reports["community"], reports["full_content"], strict=True))
+    assert contents[0] == "reports 1,2"
+    assert contents[3] == "local"
+
+
+async def test_failed_sub_community_report(monkeypatch):
+    async def strategy(community, context, level, callbacks, cache, args):  # noqa: RUF029
+        if community == 1:
+            return None
+        return create_report(community, context, level)
+
+    reports = await run(monkeypatch, strategy)
+
+    assert reports["community"].tolist() == [2, 4, 0, 3]
+    assert reports["full_content"].tolist()[2] == "reports 2"
+
+
+async def test_errors_raise_after_all_reports(monkeypatch):
+    generated = []
+
+    async def strategy(community, context, level, callbacks, cache, args):  # noqa: RUF029
+        if community == 2:
+            msg = "report failed"
+            raise ValueError(msg)
+        generated.append(community)
+        return create_report(community, context, level)
+
+    with pytest.raises(ParallelizationError, match="1 Errors"):
+        await run(monkeypatch, strategy, num_threads=1)
+    assert sorted(generated) == [0, 1, 3, 4]
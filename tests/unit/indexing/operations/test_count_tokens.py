@@ -0,0 +1,45 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.index.operations.count_tokens import count_tokens
+from graphrag.index.workflows.count_tokens import (
+    TOKEN_COUNT_COLUMNS,
+    add_token_counts,
+)
+
+
+class WordEncoder:
+    name = "words"
+
+    def encode_batch(
+        self, texts: list[str], disallowed_special: tuple = ()
+    ) -> list[list[str]]:
+        return [text.split() for text in texts]
+
+
+def test_count_tokens():
+    texts = pd.Series(["one two", None, "", "<|endoftext|> three"], index=[3, 5, 7, 9])
+    counts = count_tokens(texts, WordEncoder())  # type: ignore
+    assert counts.to_dict() == {3: 2, 5: 0, 7: 0, 9: 2}
+
+
+def test_add_token_counts():
+    reports = pd.DataFrame({
+        "summary": ["a b", "c"],
+        "full_content": ["a b c d", "c d e"],
+    })
+    add_token_counts(
+        reports,
+        TOKEN_COUNT_COLUMNS["community_reports"],
+        WordEncoder(),  # type: ignore
+    )
+    assert reports["summary_n_tokens"].tolist() == [2, 1]
+    assert reports["full_content_n_tokens"].tolist() == [4, 3]
+    assert reports["tokens_encoding"].tolist() == ["words", "words"]
+
+    # tables without the text column are left untouched
+    entities = pd.DataFrame({"title": ["A"]})
+    add_token_counts(entities, TOKEN_COUNT_COLUMNS["entities"], WordEncoder())  # type: ignore
+    assert list(entities.columns) == ["title"]
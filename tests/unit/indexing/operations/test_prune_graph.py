@@ -0,0 +1,47 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.index.operations.prune_graph import prune_graph
+
+# entities in the reverse of the order the relationships first mention them
+ENTITIES = pd.DataFrame({
+    "title": ["F", "E", "D", "C", "B", "A"],
+    "frequency": [2, 2, 2, 2, 2, 2],
+})
+
+RELATIONSHIPS = pd.DataFrame({
+    "source": ["A", "C", "C", "D", "E"],
+    "target": ["B", "B", "A", "E", "D"],
+    "weight": [1.0, 2.0, 3.0, 1.0, 5.0],
+})
+
+
+def test_prune_graph_keeps_table_rows():
+    entities, relationships = prune_graph(ENTITIES, RELATIONSHIPS)
+
+    assert entities["title"].tolist() == ["E", "D", "C", "B", "A"]
+    assert relationships.equals(RELATIONSHIPS)
+
+
+def test_prune_graph_min_edge_weight_pct():
+    # edges weigh 1, 2, 3 and 5, repeated edges keep the weight of their last row
+    _, relationships = prune_graph(ENTITIES, RELATIONSHIPS, min_edge_weight_pct=50)
+
+    assert relationships.to_dict("records") == [
+        {"source": "C", "target": "A", "weight": 3.0},
+        {"source": "D", "target": "E", "weight": 1.0},
+        {"source": "E", "target": "D", "weight": 5.0},
+    ]
+
+
+def test_prune_graph_ties_follow_graph_order():
+    # A, B and C tie on degree and the ego node is the one mentioned first, then
+    # {B, C} and {D, E} tie on size and the component mentioned first is kept
+    entities, relationships = prune_graph(
+        ENTITIES, RELATIONSHIPS, remove_ego_nodes=True, lcc_only=True
+    )
+
+    assert entities["title"].tolist() == ["C", "B"]
+    assert relationships[["source", "target"]].to_numpy().tolist() == [["C", "B"]]
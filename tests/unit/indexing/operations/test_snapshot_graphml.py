@@ -0,0 +1,35 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.snapshot_graphml import snapshot_graphml
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+RELATIONSHIPS = pd.DataFrame({
+    "source": ["A & B", "C", "C", "D\n", "A & B"],
+    "target": ['"C"', "A & B", "<É>", "E", '"C"'],
+})
+
+
+async def test_snapshot_graphml_matches_networkx():
+    storage = MemoryPipelineStorage()
+
+    await snapshot_graphml(CSRGraph.from_edges(RELATIONSHIPS), "graph", storage)
+
+    expected = "\n".join(nx.generate_graphml(create_graph(RELATIONSHIPS)))
+    assert await storage.get("graph.graphml") == expected
+
+
+async def test_snapshot_graphml_empty_graph():
+    storage = MemoryPipelineStorage()
+    edges = pd.DataFrame({"source": [], "target": []})
+
+    await snapshot_graphml(CSRGraph.from_edges(edges), "graph", storage)
+
+    assert await storage.get("graph.graphml") == "\n".join(
+        nx.generate_graphml(nx.Graph())
+    )
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import random
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.index.utils.stable_lcc import (
+    stable_largest_connected_component,
+    stable_largest_connected_component_csr,
+)
+
+NAMES = [
+    "A",
+    "A !",
+    "A (X)",
+    "a",
+    "a ",
+    "A\t",
+    "A -> B",
+    "B",
+    "b",
+    "&amp;",
+    "&AMP;",
+    "C",
+]
+
+
+def _random_edges(seed: int, names: list[str]) -> pd.DataFrame:
+    rng = random.Random(seed)
+    rows = [
+        (rng.choice(names), rng.choice(names), rng.random())
+        for _ in range(rng.randint(1, 40))
+    ]
+    return pd.DataFrame(rows, columns=["source", "target", "weight"])
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_matches_networkx(seed: int):
+    names = [f"N{i}" for i in range(30)] if seed % 2 else NAMES
+    edges = _random_edges(seed, names)
+    expected = create_graph(edges, edge_attr=["weight"])
+    graph = CSRGraph.from_edges(edges, weight="weight")
+
+    assert graph.nodes.tolist() == list(expected.nodes)
+    assert dict(zip(graph.nodes, graph.degree(), strict=True)) == dict(expected.degree)
+    assert graph.edge_list() == list(expected.edges(data="weight"))
+    assert set(graph.nodes[graph.largest_component_mask()]) == max(
+        nx.connected_components(expected), key=len
+    )
+    components = graph.connected_components()
+    for component in nx.connected_components(expected):
+        assert len({components[i] for i in graph.node_ids(list(component))}) == 1
+    assert len(set(components)) == nx.number_connected_components(expected)
+
+
+def test_csr_adjacency():
+    edges = pd.DataFrame({
+        "source": ["a", "b", "a", "c"],
+        "target": ["b", "c", "c", "c"],
+    })
+    graph = CSRGraph.from_edges(edges)
+    assert graph.offsets.tolist() == [0, 2, 4, 8]
+    assert graph.nodes[graph.neighbors].tolist() == [
+        "b", "c", "a", "c", "b", "a", "c", "c"
+    ]  # fmt: skip
+
+
+def test_repeated_edges_are_collapsed():
+    edges = pd.DataFrame({
+        "source": ["a", "b", "a"],
+        "target": ["b", "a", "c"],
+        "weight": [1.0, 2.0, 3.0],
+    })
+    graph = CSRGraph.from_edges(edges, weight="weight")
+    assert graph.edge_list() == [("a", "b", 2.0), ("a", "c", 3.0)]
+    np.testing.assert_array_equal(
+        graph.edge_combined_degree(
+            pd.Series(["a", "b", "x"]), pd.Series(["c", "c", "c"])
+        ),
+        [3, 2, 1],
+    )
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_stable_lcc_matches_networkx(seed: int):
+    edges = _random_edges(seed, NAMES)
+    expected = stable_largest_connected_component(create_graph(edges))
+    actual = stable_largest_connected_component_csr(CSRGraph.from_edges(edges))
+
+    assert actual.nodes.tolist() == list(expected.nodes)
+    assert [edge[:2] for edge in actual.edge_list()] == list(expected.edges)
+
+
+@pytest.mark.parametrize("use_lcc", [True, False])
+def test_cluster_graph_matches_networkx(use_lcc: bool):
+    relationships = pd.read_parquet("tests/verbs/data/relationships.parquet")
+    expected = cluster_graph(create_graph(relationships), 10, use_lcc, seed=42)
+    actual = cluster_graph(CSRGraph.from_edges(relationships), 10, use_lcc, seed=42)
+    assert actual == expected
@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import threading
+
+import pandas as pd
+import pytest
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.index.utils.derive_from_rows import (
+    ParallelizationError,
+    derive_from_rows,
+)
+
+
+async def test_derive_from_rows_preserves_row_order():
+    input = pd.DataFrame({"value": range(50)})
+
+    async def transform(row: pd.Series) -> int:
+        # later rows finish first
+        await asyncio.sleep((50 - row["value"]) / 10_000)
+        return row["value"] * 2
+
+    result = await derive_from_rows(input, transform, num_threads=8)
+
+    assert result == [value * 2 for value in range(50)]
+
+
+async def test_derive_from_rows_bounds_in_flight_rows():
+    input = pd.DataFrame({"value": range(100)})
+    in_flight = 0
+    peak = 0
+
+    async def transform(row: pd.Series) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return row["value"]
+
+    await derive_from_rows(input, transform, num_threads=4)
+
+    assert peak == 4
+
+
+@pytest.mark.parametrize("async_type", [AsyncType.AsyncIO, AsyncType.Threaded])
+async def test_derive_from_rows_aggregates_errors(async_type):
+    input = pd.DataFrame({"value": range(10)})
+
+    async def transform(row: pd.Series) -> int:  # noqa: RUF029
+        if row["value"] % 2:
+            msg = "odd"
+            raise ValueError(msg)
+        return row["value"]
+
+    with pytest.raises(ParallelizationError, match="5 Errors"):
+        await derive_from_rows(input, transform, async_type=async_type)
+
+
+async def test_derive_from_rows_empty_input():
+    async def transform(row: pd.Series) -> int:  # noqa: RUF029
+        return 1
+
+    assert await derive_from_rows(pd.DataFrame({"value": []}), transform) == []
+
+
+def square(row: pd.Series) -> int:
+    if row["value"] < 0:
+        msg = "negative"
+        raise ValueError(msg)
+    return row["value"] ** 2
+
+
+async def test_derive_from_rows_process():
+    input = pd.DataFrame({"value": range(100)})
+    ticks = []
+    callbacks = NoopWorkflowCallbacks()
+    callbacks.progress = lambda progress: ticks.append(progress.completed_items)
+
+    result = await derive_from_rows(
+        input, square, callbacks, num_threads=2, async_type=AsyncType.Process
+    )
+
+    assert result == [value**2 for value in range(100)]
+    assert ticks[-1] == 100
+
+
+async def test_derive_from_rows_process_aggregates_errors():
+    input = pd.DataFrame({"value": [1, -1, 2, -2]})
+
+    with pytest.raises(ParallelizationError, match="2 Errors"):
+        await derive_from_rows(
+            input, square, num_threads=2, async_type=AsyncType.Process
+        )
+
+
+def lock(row: pd.Series) -> threading.Lock:
+    return threading.Lock()
+
+
+async def test_derive_from_rows_process_reports_executor_failures():
+    input = pd.DataFrame({"value": range(4)})
+    reported = []
+    callbacks = NoopWorkflowCallbacks()
+    callbacks.error = lambda message, error, stack, details=None: reported.append(error)
+
+    # results that cannot be pickled back fail the whole batch
+    with pytest.raises(ParallelizationError, match="cannot pickle"):
+        await derive_from_rows(
+            input, lock, callbacks, num_threads=2, async_type=AsyncType.Process
+        )
+    assert reported
+    assert all(isinstance(error, TypeError) for error in reported)
+
+
+async def test_derive_from_rows_process_falls_back_for_closures():
+    offset = 10
+
+    async def transform(row: pd.Series) -> int:  # noqa: RUF029
+        return row["value"] + offset
+
+    result = await derive_from_rows(
+        pd.DataFrame({"value": range(3)}), transform, async_type=AsyncType.Process
+    )
+
+    assert result == [10, 11, 12]
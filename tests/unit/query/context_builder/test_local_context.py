@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.entity import Entity
+from graphrag.query.context_builder.community_context import build_community_context
+from graphrag.query.context_builder.local_context import build_entity_context
+
+
+class WordEncoder:
+    name = "words"
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, text: str) -> list[str]:
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts: list[str]) -> list[list[str]]:
+        return [self.encode(text) for text in texts]
+
+
+def test_entity_context_uses_persisted_token_counts():
+    entities = [
+        Entity(
+            id="a",
+            short_id="1",
+            title="A",
+            description="short",
+            n_tokens=1,
+            tokens_encoding="words",
+        ),
+        Entity(
+            id="b",
+            short_id="2",
+            title="B",
+            description="long",
+            n_tokens=50,
+            tokens_encoding="words",
+        ),
+        Entity(id="c", short_id="3", title="C", description="no count"),
+    ]
+    encoder = WordEncoder()
+    text, records = build_entity_context(
+        entities, token_encoder=encoder, max_tokens=20, include_entity_rank=False
+    )
+
+    # B is charged its persisted 50 tokens, so only A fits
+    assert text == "-----Entities-----\nid|entity|description\n1|A|short\n"
+    assert records["entity"].tolist() == ["A"]
+    assert "1|A|short\n" not in encoder.encoded
+    assert "1|A|" in encoder.encoded
+
+
+def test_community_context_uses_persisted_token_counts():
+    reports = [
+        CommunityReport(
+            id=str(i),
+            short_id=str(i),
+            title=f"R{i}",
+            community_id=str(i),
+            summary="one two three",
+            full_content="one two three four five six",
+            summary_n_tokens=3,
+            full_content_n_tokens=6,
+            tokens_encoding="words",
+        )
+        for i in range(3)
+    ]
+    encoder = WordEncoder()
+    _, records = build_community_context(
+        reports,
+        token_encoder=encoder,  # type: ignore
+        use_community_summary=False,
+        shuffle_data=False,
+        include_community_weight=False,
+        max_tokens=20,
+    )
+
+    # the header costs 2 tokens and every report 1 + 6 plus a margin of 2
+    assert records["reports"]["id"].tolist() == ["0", "1"]
+    assert not any("four five" in text for text in encoder.encoded)
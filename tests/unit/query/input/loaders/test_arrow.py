@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from graphrag.data_model.entity import Entity
+from graphrag.query.indexer_adapters import (
+    read_indexer_text_unit_records,
+    read_indexer_text_units,
+)
+from graphrag.query.input.loaders.arrow import ArrowRecords
+from graphrag.query.input.retrieval.text_units import (
+    get_candidate_text_units,
+    get_text_units,
+)
+
+text_units = pd.DataFrame({
+    "id": ["t1", "t2", "t3", "t4"],
+    "text": ["one", "two", "three", "four"],
+    "n_tokens": [1, 1, 1, 1],
+    "document_ids": [["d1"], ["d1"], ["d2"], ["d2"]],
+    "entity_ids": [["e1"], [], ["e1", "e2"], ["e2"]],
+    "relationship_ids": [[], [], ["r1"], []],
+    "covariate_ids": [[], [], [], []],
+})
+
+
+def test_records_match_eager_read():
+    expected = {unit.id: unit for unit in read_indexer_text_units(text_units)}
+    records = read_indexer_text_unit_records(pa.Table.from_pandas(text_units))
+
+    assert len(records) == 4
+    assert list(records) == ["t1", "t2", "t3", "t4"]
+    assert "t3" in records
+    assert "t9" not in records
+    assert records.materialized == 0
+    assert records.sort_keys(["t4", "t9", "t1", "t4"]) == ["t1", "t4"]
+
+    assert records["t3"] == expected["t3"]
+    assert records.get_many(["t4", "t1", "t3"]) == [
+        expected["t4"],
+        expected["t1"],
+        expected["t3"],
+    ]
+    assert records.materialized == 3
+    # converted rows are kept
+    assert records["t3"] is records["t3"]
+    assert records.column("text").to_pylist() == ["one", "two", "three", "four"]
+
+    with pytest.raises(KeyError):
+        records["t9"]
+
+
+def test_candidate_text_units_from_records():
+    records = read_indexer_text_unit_records(pa.Table.from_pandas(text_units))
+    entities = [Entity(id="e", short_id="e", title="E", text_unit_ids=["t4", "t2"])]
+
+    candidates = get_candidate_text_units(entities, records)
+    assert candidates["text"].tolist() == ["two", "four"]
+    assert records.materialized == 2
+    assert candidates.equals(
+        get_candidate_text_units(entities, read_indexer_text_units(text_units))
+    )
+
+
+def test_get_text_units_reads_records_in_one_batch():
+    batches = []
+
+    def read_rows(rows: pd.DataFrame):
+        batches.append(rows["id"].tolist())
+        return read_indexer_text_units(rows)
+
+    records = ArrowRecords(pa.Table.from_pandas(text_units), read_rows)
+
+    units = get_text_units(records, ["t4", "t9", "t1", "t4"])
+    assert list(units) == ["t4", "t1"]
+    assert units["t1"].text == "one"
+    assert batches == [["t4", "t1"]]
+
+    eager = {unit.id: unit for unit in read_indexer_text_units(text_units)}
+    assert get_text_units(eager, ["t4", "t9", "t1"]) == units
@@ -0,0 +1,91 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.query.input.loaders.dfs import (
+    read_community_reports,
+    read_covariates,
+    read_entities,
+    read_relationships,
+    read_text_units,
+)
+
+
+def test_read_persisted_token_counts():
+    entities = read_entities(
+        pd.DataFrame({
+            "id": ["a"],
+            "human_readable_id": [0],
+            "title": ["A"],
+            "type": ["PERSON"],
+            "description": ["d"],
+            "n_tokens": [4],
+            "tokens_encoding": ["cl100k_base"],
+        })
+    )
+    assert entities[0].n_tokens == 4
+    assert entities[0].tokens_encoding == "cl100k_base"
+
+    relationships = read_relationships(
+        pd.DataFrame({
+            "id": ["r"],
+            "human_readable_id": [0],
+            "source": ["A"],
+            "target": ["B"],
+            "description": ["d"],
+            "n_tokens": [2],
+        })
+    )
+    assert relationships[0].n_tokens == 2
+
+    covariates = read_covariates(
+        pd.DataFrame({
+            "id": ["c"],
+            "human_readable_id": [0],
+            "subject_id": ["A"],
+            "type": ["claim"],
+            "n_tokens": [3],
+        })
+    )
+    assert covariates[0].n_tokens == 3
+
+    reports = read_community_reports(
+        pd.DataFrame({
+            "id": ["1"],
+            "title": ["R"],
+            "community": [1],
+            "summary": ["s"],
+            "full_content": ["f"],
+            "summary_n_tokens": [1],
+            "full_content_n_tokens": [5],
+        })
+    )
+    assert reports[0].summary_n_tokens == 1
+    assert reports[0].full_content_n_tokens == 5
+
+    text_units = read_text_units(
+        pd.DataFrame({
+            "id": ["t"],
+            "text": ["meta.\nchunk"],
+            "n_tokens": [1],
+            "text_n_tokens": [3],
+        })
+    )
+    assert text_units[0].n_tokens == 1
+    assert text_units[0].text_n_tokens == 3
+
+
+def test_read_without_token_counts():
+    # indexes built before the counts were persisted load without them
+    entities = read_entities(
+        pd.DataFrame({
+            "id": ["a"],
+            "human_readable_id": [0],
+            "title": ["A"],
+            "type": ["PERSON"],
+            "description": ["d"],
+        })
+    )
+    assert entities[0].n_tokens is None
+    assert entities[0].tokens_encoding is None
@@ -0,0 +1,74 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.query.context_builder.local_context import build_covariates_context
+from graphrag.query.input.retrieval.covariates import (
+    CovariateIndex,
+    get_candidate_covariates,
+)
+
+
+class WordEncoder:
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+covariates = [
+    Covariate(id="c1", short_id="1", subject_id="A", attributes={"status": "TRUE"}),
+    Covariate(id="c2", short_id="2", subject_id="B", attributes={"status": "FALSE"}),
+    Covariate(id="c3", short_id="3", subject_id="A", attributes={"status": None}),
+    Covariate(id="c4", short_id="4", subject_id="C", attributes={"status": "TRUE"}),
+]
+
+
+def selection(names: list[str]) -> list[Entity]:
+    return [Entity(id=name, short_id=name, title=name) for name in names]
+
+
+def test_get_candidate_covariates():
+    index = CovariateIndex(covariates)
+    for names in [[], ["A"], ["C", "A"], ["B", "missing"]]:
+        expected = get_candidate_covariates(selection(names), covariates)
+        assert get_candidate_covariates(selection(names), index) == expected
+    assert [
+        covariate.id
+        for covariate in get_candidate_covariates(selection(["C", "A"]), index)
+    ] == ["c1", "c3", "c4"]
+
+
+def test_build_covariates_context():
+    for source in [covariates, CovariateIndex(covariates)]:
+        text, records = build_covariates_context(
+            selection(["C", "A"]), source, token_encoder=WordEncoder()
+        )
+        assert (
+            text == "-----Covariates-----\nid|entity|status\n4|C|TRUE\n1|A|TRUE\n3|A|\n"
+        )
+        assert records.to_dict("records") == [
+            {"id": "4", "entity": "C", "status": "TRUE"},
+            {"id": "1", "entity": "A", "status": "TRUE"},
+            {"id": "3", "entity": "A", "status": ""},
+        ]
+
+
+def test_build_covariates_context_token_budget():
+    # the header costs 2 tokens and every record 1, so only one record fits
+    text, records = build_covariates_context(
+        selection(["A"]),
+        CovariateIndex(covariates),
+        token_encoder=WordEncoder(),
+        max_tokens=3,
+    )
+    assert text == "-----Covariates-----\nid|entity|status\n1|A|TRUE\n"
+    assert records["id"].tolist() == ["1"]
+
+    text, records = build_covariates_context(
+        selection(["A"]),
+        CovariateIndex(covariates),
+        token_encoder=WordEncoder(),
+        max_tokens=2,
+    )
+    assert text == "-----Covariates-----\nid|entity|status\n"
+    assert records.empty
@@ -3,8 +3,10 @@
 
 from graphrag.data_model.entity import Entity
 from graphrag.query.input.retrieval.entities import (
+    EntityIndex,
     get_entity_by_id,
     get_entity_by_key,
+    get_entity_by_name,
 )
 
 
@@ -165,3 +167,33 @@ def test_get_entity_by_key():
         "rank",
         2,
     ) == Entity(id="id2", short_id="sid2", title="title2a", rank=2)
+
+
+def test_entity_index_matches_lookups():
+    entities = [
+        Entity(id="7c6f2bc947c9445393a3d2e174a02cd9", short_id="sid1", title="a"),
+        Entity(id="id2", short_id="sid2", title="b", rank=2),
+        Entity(id="7c6f2bc9-47c9-4453-93a3-d2e174a02cd9", short_id="sid3", title="c"),
+        Entity(id="id4", short_id="sid2", title="b", rank=5),
+        Entity(id="id5", short_id="sid5", title="e", rank=2, text_unit_ids=["t1"]),
+    ]
+    index = EntityIndex(entities)
+
+    for key, value in [
+        # the dash-stripped form appears first, so it wins over the exact match
+        ("id", "7c6f2bc9-47c9-4453-93a3-d2e174a02cd9"),
+        ("id", "7c6f2bc947c9445393a3d2e174a02cd9"),
+        ("id", "00000000-0000-0000-0000-000000000000"),
+        ("id", "id4"),
+        ("short_id", "sid2"),
+        ("title", "c"),
+        ("title", "missing"),
+        ("rank", 2),
+        ("text_unit_ids", "t1"),
+    ]:
+        assert index.get_by_key(key, value) is get_entity_by_key(entities, key, value)
+
+    for name in ["a", "b", "missing"]:
+        assert index.get_by_name(name) == get_entity_by_name(entities, name)
+
+    assert [entity.id for entity in index.top_ranked(3)] == ["id4", "id2", "id5"]
@@ -0,0 +1,111 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import random
+from copy import deepcopy
+
+import pytest
+
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.query.context_builder.local_context import build_relationship_context
+from graphrag.query.input.retrieval.relationships import (
+    RelationshipIndex,
+    get_candidate_relationships,
+    get_in_network_relationships,
+    get_out_network_relationships,
+)
+
+
+class WordEncoder:
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+def make_relationships(count: int, seed: int = 0) -> list[Relationship]:
+    rng = random.Random(seed)
+    relationships = []
+    for i in range(count):
+        source = f"E{rng.randrange(40)}"
+        target = f"E{rng.randrange(40)}"
+        relationships.append(
+            Relationship(
+                id=f"r{i}",
+                short_id=str(i),
+                source=source,
+                target=target,
+                description=f"{source} relates to {target}",
+                # few distinct values, so that ties are frequent
+                weight=float(rng.randrange(4)),
+                rank=rng.choice([None, 1, 2, 3]),
+                attributes={"score": rng.randrange(3)},
+            )
+        )
+    return relationships
+
+
+def selection(names: list[str]) -> list[Entity]:
+    return [Entity(id=name, short_id=name, title=name) for name in names]
+
+
+def ids(relationships: list[Relationship]) -> list[str]:
+    return [relationship.id for relationship in relationships]
+
+
+@pytest.mark.parametrize("ranking_attribute", ["rank", "weight", "score", "missing"])
+def test_index_matches_list_selection(ranking_attribute: str):
+    relationships = make_relationships(600)
+    index = RelationshipIndex(relationships)
+    rng = random.Random(1)
+    for size in [0, 1, 2, 5, 12]:
+        entities = selection([f"E{i}" for i in rng.sample(range(45), size)])
+        assert ids(
+            get_in_network_relationships(entities, index, ranking_attribute)
+        ) == ids(
+            get_in_network_relationships(entities, relationships, ranking_attribute)
+        )
+        assert ids(
+            get_out_network_relationships(entities, index, ranking_attribute)
+        ) == ids(
+            get_out_network_relationships(entities, relationships, ranking_attribute)
+        )
+        assert ids(get_candidate_relationships(entities, index)) == ids(
+            get_candidate_relationships(entities, relationships)
+        )
+
+
+def test_index_self_loops_and_unknown_entities():
+    relationships = [
+        Relationship(id="a", short_id="a", source="A", target="A", rank=1),
+        Relationship(id="b", short_id="b", source="A", target="B", rank=1),
+        Relationship(id="c", short_id="c", source="C", target="A", rank=1),
+    ]
+    index = RelationshipIndex(relationships)
+
+    assert ids(index.neighborhood(["A"])) == ["a", "b", "c"]
+    assert ids(index.neighborhood(["Z"])) == []
+    assert ids(get_in_network_relationships(selection(["A"]), index)) == ["a"]
+    # outgoing relationships come before incoming ones on equal rank
+    assert ids(get_out_network_relationships(selection(["A"]), index)) == ["b", "c"]
+
+
+def test_relationship_context_matches_list_selection():
+    relationships = make_relationships(400, seed=3)
+    for relationship in relationships:
+        relationship.rank = relationship.rank or 0
+    entities = selection(["E1", "E2", "E3", "E7"])
+    by_list = deepcopy(relationships)
+    by_index = deepcopy(relationships)
+
+    expected = build_relationship_context(
+        entities, by_list, token_encoder=WordEncoder(), max_tokens=10_000
+    )
+    actual = build_relationship_context(
+        entities,
+        RelationshipIndex(by_index),
+        token_encoder=WordEncoder(),
+        max_tokens=10_000,
+    )
+
+    assert actual[0] == expected[0]
+    assert actual[1].equals(expected[1])
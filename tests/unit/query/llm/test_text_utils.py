@@ -0,0 +1,173 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.query.llm.text_utils import (
+    TOKEN_COUNT_CACHE_SIZE,
+    TOKEN_HINT_MARGIN,
+    TokenBudget,
+    TokenCounter,
+    TokenHint,
+    get_token_counter,
+    largest_fitting_prefix,
+    num_tokens,
+    row_token_hint,
+    set_token_count_cache_size,
+)
+
+
+class WordEncoder:
+    name = "words"
+
+    def __init__(self):
+        self.encoded: list[str] = []
+        self.batches: list[list[str]] = []
+
+    def encode(self, text: str) -> list[str]:
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts: list[str]) -> list[list[str]]:
+        self.batches.append(texts)
+        return [text.split() for text in texts]
+
+
+def test_token_counter_memoizes_and_batches():
+    encoder = WordEncoder()
+    counter = TokenCounter(encoder, max_entries=3)  # type: ignore
+
+    assert counter.count_batch(["a b", "c", "a b", "d e f"]) == [2, 1, 2, 3]
+    assert encoder.batches == [["a b", "c", "d e f"]]
+
+    assert counter.count("c") == 1
+    assert counter.count_batch(["a b", "d e f"]) == [2, 3]
+    assert encoder.encoded == []
+    assert len(encoder.batches) == 1
+
+    # "c" was used least recently and is evicted by the fourth entry
+    assert counter.count("g h") == 2
+    assert counter.count("c") == 1
+    assert encoder.encoded == ["g h", "c"]
+
+
+def test_token_counter_resize_and_clear():
+    encoder = WordEncoder()
+    counter = TokenCounter(encoder, max_entries=3)  # type: ignore
+    long_text = " ".join(["word"] * 10_000)
+    assert counter.count_batch(["a", "b", long_text]) == [1, 1, 10_000]
+
+    # texts of any length are remembered by digest
+    assert counter.count(long_text) == 10_000
+    assert len(encoder.batches) == 1
+
+    counter.resize(1)
+    assert counter.max_entries == 1
+    assert counter.count_batch([long_text, "a"]) == [10_000, 1]
+    assert encoder.encoded == ["a"]
+
+    counter.clear()
+    assert counter.count("a") == 1
+    assert encoder.encoded == ["a", "a"]
+
+    counter.resize(0)
+    assert counter.count_batch(["a", "a"]) == [1, 1]
+    assert counter.count("a") == 1
+    assert encoder.encoded == ["a", "a", "a", "a"]
+
+
+def test_set_token_count_cache_size():
+    encoder = WordEncoder()
+    counter = get_token_counter(encoder)  # type: ignore
+    try:
+        set_token_count_cache_size(0)
+        assert counter.max_entries == 0
+        assert get_token_counter(WordEncoder()).max_entries == 0  # type: ignore
+    finally:
+        set_token_count_cache_size(TOKEN_COUNT_CACHE_SIZE)
+    assert counter.max_entries == TOKEN_COUNT_CACHE_SIZE
+
+
+def test_shared_counter_per_encoder():
+    encoder = WordEncoder()
+    assert get_token_counter(encoder) is get_token_counter(encoder)  # type: ignore
+    assert num_tokens("one two three", encoder) == 3  # type: ignore
+    assert num_tokens("one two three", encoder) == 3  # type: ignore
+    assert encoder.encoded == ["one two three"]
+
+
+def test_token_budget_stops_at_first_row_over_budget():
+    encoder = WordEncoder()
+    budget = TokenBudget(max_tokens=6, token_encoder=encoder)  # type: ignore
+    assert budget.spend("h1 h2") == 2
+    built = []
+
+    def rows():
+        for i, text in enumerate(["a b", "c", "d e", "f", "g"]):
+            built.append(i)
+            yield text, i
+
+    assert [record for _, record in budget.fit(rows())] == [0, 1]
+    assert budget.used == 5
+    assert budget.remaining == 1
+    # rows are built and encoded a batch at a time, here all in the first batch
+    assert built == [0, 1, 2, 3, 4]
+
+
+def test_token_budget_header_over_budget():
+    budget = TokenBudget(max_tokens=1, token_encoder=WordEncoder())  # type: ignore
+    budget.spend("h1 h2")
+    assert list(budget.fit([("a", 1)])) == []
+
+
+def test_token_budget_uses_persisted_field_counts():
+    encoder = WordEncoder()
+    budget = TokenBudget(max_tokens=10, token_encoder=encoder)  # type: ignore
+    rows = [
+        (
+            "1 | long text here\n",
+            1,
+            row_token_hint(["1 ", " long text here"], 1, 3, "words"),
+        ),
+        ("2 | more\n", 2, None),
+        ("3 | even longer text\n", 3, TokenHint("3 |", "\n", 10, "words")),
+    ]
+
+    # a hinted row costs its prefix, suffix and field tokens plus the margin
+    assert [record for _, record in budget.fit(rows)] == [1, 2]
+    assert budget.used == 2 + 0 + 3 + TOKEN_HINT_MARGIN + 3
+    # only the text around the fields with a persisted count was encoded
+    assert encoder.batches == [["1 |", "\n", "2 | more\n", "3 |"]]
+
+
+def test_token_budget_ignores_counts_of_another_encoding():
+    encoder = WordEncoder()
+    budget = TokenBudget(max_tokens=8, token_encoder=encoder)  # type: ignore
+    rows = [("1 | long text here\n", 1, TokenHint("1 |", "\n", 1, "other"))]
+
+    assert [record for _, record in budget.fit(rows)] == [1]
+    assert budget.used == 5
+    # the whole row is encoded
+    assert encoder.encoded == ["1 | long text here\n"]
+
+
+def test_row_token_hint():
+    assert row_token_hint(["1", "A", "text"], 2, None, "words") is None
+    assert row_token_hint(["1", "A", "text"], 2, 7, None) is None
+    assert row_token_hint(["1", "A", "text", "5"], 2, 7, "words") == TokenHint(
+        "1|A|", "|5\n", 7, "words"
+    )
+    assert row_token_hint(["text", "5"], 0, 7, "words") == TokenHint(
+        "", "|5\n", 7, "words"
+    )
+
+
+def test_largest_fitting_prefix():
+    for size in range(8):
+        for limit in range(10):
+            probed = []
+
+            def fits(n, limit=limit, probed=probed):
+                probed.append(n)
+                return n <= limit
+
+            assert largest_fitting_prefix(size, fits) == min(size, limit)
+            assert all(1 <= n <= size for n in probed)
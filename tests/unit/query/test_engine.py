@@ -0,0 +1,244 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import graphrag.config.defaults as defs
+import graphrag.query.engine as engine_module
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.embeddings import (
+    entity_description_embedding,
+    text_unit_text_embedding,
+)
+from graphrag.config.enums import ModelType
+from graphrag.data_model.types import TextEmbedder
+from graphrag.query.engine import QueryEngine
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import write_table_to_storage
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+DATA_DIR = "tests/verbs/data"
+TABLES = ["entities", "communities", "community_reports", "text_units", "relationships"]
+
+
+class WordEncoder:
+    def encode(self, text: str, **kwargs: Any) -> list[str]:
+        return text.split()
+
+    def decode(self, tokens: list[str]) -> str:
+        return " ".join(tokens)
+
+
+class MockVectorStore(BaseVectorStore):
+    def __init__(self, documents: list[VectorStoreDocument]) -> None:
+        super().__init__("mock")
+        self.documents = documents
+        self.searches = 0
+
+    def connect(self, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        raise NotImplementedError
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        self.searches += 1
+        return [
+            VectorStoreSearchResult(document=document, score=1)
+            for document in self.documents[:k]
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        return self.similarity_search_by_vector(text_embedder(text), k)
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        return [document for document in self.documents if document.id in include_ids]
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        return next(document for document in self.documents if document.id == id)
+
+
+@pytest.fixture(autouse=True)
+def word_encoder(monkeypatch):
+    monkeypatch.setattr("tiktoken.get_encoding", lambda name: WordEncoder())
+
+
+def load_tables() -> dict[str, pd.DataFrame]:
+    return {name: pd.read_parquet(f"{DATA_DIR}/{name}.parquet") for name in TABLES}
+
+
+def create_config():
+    return create_graphrag_config({
+        "models": {
+            "default_chat_model": {
+                "api_key": "NOT_AN_API_KEY",
+                "type": ModelType.MockChat,
+                "model": defs.DEFAULT_CHAT_MODEL,
+                "responses": ["mock answer"],
+            },
+            "default_embedding_model": {
+                "api_key": "NOT_AN_API_KEY",
+                "type": ModelType.MockEmbedding,
+                "model": defs.DEFAULT_EMBEDDING_MODEL,
+            },
+        }
+    })
+
+
+def create_embedding_stores(tables: dict[str, pd.DataFrame]) -> dict:
+    return {
+        entity_description_embedding: MockVectorStore([
+            VectorStoreDocument(id=row.id, text=row.description, vector=[1.0])
+            for row in tables["entities"].head(5).itertuples()
+        ]),
+        text_unit_text_embedding: MockVectorStore([
+            VectorStoreDocument(id=row.id, text=row.text, vector=[1.0])
+            for row in tables["text_units"].head(3).itertuples()
+        ]),
+    }
+
+
+def count_calls(monkeypatch, name: str) -> list:
+    """Record the results of an engine dependency each time it is called."""
+    results = []
+    function = getattr(engine_module, name)
+
+    def wrapper(*args, **kwargs):
+        results.append(function(*args, **kwargs))
+        return results[-1]
+
+    monkeypatch.setattr(engine_module, name, wrapper)
+    return results
+
+
+async def test_local_search_reuses_loaded_index(monkeypatch):
+    entities_reads = count_calls(monkeypatch, "read_indexer_entities")
+    search_engines = count_calls(monkeypatch, "get_local_search_engine")
+    tables = load_tables()
+    engine = QueryEngine(
+        create_config(), **tables, embedding_stores=create_embedding_stores(tables)
+    )
+
+    response, context_data = await engine.local_search("who is company a?")
+    assert response == "mock answer"
+    assert len(context_data["entities"]) == 5
+
+    second_response, second_context_data = await engine.local_search(
+        "who is company a?"
+    )
+    assert second_response == response
+    assert second_context_data.keys() == context_data.keys()
+    assert len(entities_reads) == 1
+    # every search gets its own search object around the same context builder
+    assert search_engines[0] is not search_engines[1]
+    assert search_engines[0].context_builder is search_engines[1].context_builder
+
+    # a different community level adapts the tables again
+    await engine.local_search("who is company a?", community_level=0)
+    assert len(entities_reads) == 2
+    assert search_engines[2].context_builder is not search_engines[0].context_builder
+
+
+async def test_concurrent_searches_share_engine():
+    tables = load_tables()
+    stores = create_embedding_stores(tables)
+    engine = QueryEngine(create_config(), **tables, embedding_stores=stores)
+
+    results = await asyncio.gather(
+        engine.local_search("first question"),
+        engine.global_search("second question"),
+        engine.basic_search("third question"),
+        engine.local_search("fourth question"),
+    )
+
+    assert all(response for response, _ in results)
+    assert len(results[2][1]["sources"]) == 3
+    assert stores[entity_description_embedding].searches == 2
+    assert stores[text_unit_text_embedding].searches == 1
+
+
+def test_dynamic_global_search_from_several_event_loops(monkeypatch):
+    monkeypatch.setattr("tiktoken.encoding_for_model", lambda name: WordEncoder())
+    search_engines = count_calls(monkeypatch, "get_global_search_engine")
+    engine = QueryEngine(create_config(), **load_tables())
+
+    for _ in range(2):
+        response, _ = asyncio.run(
+            engine.global_search("a question", dynamic_community_selection=True)
+        )
+        assert response
+    # the context builder of a dynamic selection is bound to the loop of its search
+    assert search_engines[0].context_builder is not search_engines[1].context_builder
+
+
+async def test_streaming_search_reports_context():
+    tables = load_tables()
+    engine = QueryEngine(
+        create_config(), **tables, embedding_stores=create_embedding_stores(tables)
+    )
+    context = []
+    callbacks = NoopQueryCallbacks()
+    callbacks.on_context = context.append
+
+    chunks = [
+        chunk
+        async for chunk in engine.basic_search_streaming(
+            "question", callbacks=[callbacks]
+        )
+    ]
+
+    assert "".join(chunks) == "mock answer"
+    assert len(context) == 1
+
+
+async def test_missing_table_raises():
+    tables = load_tables()
+    engine = QueryEngine(
+        create_config(),
+        text_units=tables["text_units"],
+        embedding_stores=create_embedding_stores(tables),
+    )
+
+    response, _ = await engine.basic_search("question")
+    assert response == "mock answer"
+    with pytest.raises(ValueError, match="table is required"):
+        await engine.local_search("question")
+
+
+async def test_load_from_storage(monkeypatch):
+    text_unit_reads = count_calls(monkeypatch, "read_indexer_text_unit_records")
+    tables = load_tables()
+    storage = MemoryPipelineStorage()
+    for name, table in tables.items():
+        await write_table_to_storage(table, name, storage)
+
+    engine = await QueryEngine.load(
+        create_config(),
+        storage=storage,
+        embedding_stores=create_embedding_stores(tables),
+    )
+
+    response, context_data = await engine.local_search("who is company a?")
+    assert response == "mock answer"
+    assert len(context_data["entities"]) == 5
+    assert context_data["claims"].empty
+
+    [text_units] = text_unit_reads
+    assert len(text_units) == len(tables["text_units"])
+    # only the text units referenced by the selected entities were converted
+    assert 0 < text_units.materialized < len(text_units)
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import (
+    load_arrow_table_from_storage,
+    load_memory_mapped_table_from_storage,
+    load_table_from_storage,
+    write_memory_mappable_table_to_storage,
+    write_table_to_storage,
+)
+
+table = pd.DataFrame({
+    "id": ["a", "b"],
+    "text": ["first", "second"],
+    "text_unit_ids": [["1", "2"], []],
+})
+
+
+@pytest.mark.parametrize("storage_type", ["file", "memory"])
+async def test_load_table_from_storage(tmp_path, storage_type: str):
+    storage = (
+        FilePipelineStorage(str(tmp_path))
+        if storage_type == "file"
+        else MemoryPipelineStorage()
+    )
+    await write_table_to_storage(table, "units", storage)
+
+    loaded = await load_table_from_storage("units", storage)
+    assert loaded["id"].tolist() == ["a", "b"]
+    assert [list(ids) for ids in loaded["text_unit_ids"]] == [["1", "2"], []]
+
+    arrow_table = await load_arrow_table_from_storage("units", storage, ["text"])
+    assert arrow_table.column_names == ["text"]
+    assert arrow_table.column("text").to_pylist() == ["first", "second"]
+
+    with pytest.raises(ValueError, match="Could not find missing.parquet"):
+        await load_arrow_table_from_storage("missing", storage)
+
+
+def test_local_path(tmp_path):
+    assert FilePipelineStorage(str(tmp_path)).local_path("units.parquet") == (
+        tmp_path / "units.parquet"
+    )
+    assert MemoryPipelineStorage().local_path("units.parquet") is None
+
+
+async def test_load_memory_mapped_table_from_storage(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    units = pd.DataFrame({
+        "id": [str(i) for i in range(1000)],
+        "text": ["x" * 1000] * 1000,
+    })
+    await write_memory_mappable_table_to_storage(units, "units", storage)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "units.arrow",
+        "units.parquet",
+    ]
+
+    allocated = pa.total_allocated_bytes()
+    loaded = await load_memory_mapped_table_from_storage("units", storage)
+    # the columns are backed by the mapped file, not by allocated memory
+    assert pa.total_allocated_bytes() - allocated < 100_000
+    assert loaded.column("text").to_pylist() == units["text"].tolist()
+
+    # a newer parquet is loaded instead of the stale copy, which is left alone
+    arrow_bytes = (tmp_path / "units.arrow").read_bytes()
+    await write_table_to_storage(table, "units", storage)
+    parquet_mtime = (tmp_path / "units.arrow").stat().st_mtime + 1
+    os.utime(tmp_path / "units.parquet", (parquet_mtime, parquet_mtime))
+    loaded = await load_memory_mapped_table_from_storage("units", storage)
+    assert loaded.column("text").to_pylist() == ["first", "second"]
+    assert (tmp_path / "units.arrow").read_bytes() == arrow_bytes
+
+
+async def test_load_memory_mapped_table_without_copy(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await write_table_to_storage(table, "units", storage)
+
+    loaded = await load_memory_mapped_table_from_storage("units", storage)
+    assert loaded.column("id").to_pylist() == ["a", "b"]
+    # loading never writes to the storage
+    assert [path.name for path in tmp_path.iterdir()] == ["units.parquet"]
+
+
+async def test_load_memory_mapped_table_without_local_files():
+    storage = MemoryPipelineStorage()
+    await write_memory_mappable_table_to_storage(table, "units", storage)
+
+    loaded = await load_memory_mapped_table_from_storage("units", storage)
+    assert loaded.column("id").to_pylist() == ["a", "b"]
+    assert storage.keys() == ["units.parquet"]
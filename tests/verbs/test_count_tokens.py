@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import tiktoken
+
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.workflows.count_tokens import (
+    run_workflow,
+)
+from graphrag.utils.storage import load_table_from_storage
+
+from .util import (
+    DEFAULT_MODEL_CONFIG,
+    create_test_context,
+)
+
+
+async def test_count_tokens():
+    context = await create_test_context(
+        storage=["entities", "relationships", "community_reports", "text_units"],
+    )
+
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+
+    await run_workflow(config, context)
+
+    entities = await load_table_from_storage("entities", context.storage)
+    relationships = await load_table_from_storage("relationships", context.storage)
+    reports = await load_table_from_storage("community_reports", context.storage)
+    text_units = await load_table_from_storage("text_units", context.storage)
+
+    assert len(entities) == 251
+    # a few entities have no description
+    assert ((entities["n_tokens"] == 0) == (entities["description"] == "")).all()
+    assert (relationships["n_tokens"] > 0).all()
+    assert (reports["summary_n_tokens"] > 0).all()
+    assert (reports["full_content_n_tokens"] > reports["summary_n_tokens"]).all()
+    assert (text_units["text_n_tokens"] > 0).all()
+    encoding = tiktoken.get_encoding(config.chunks.encoding_model).name
+    assert (entities["tokens_encoding"] == encoding).all()
+    # claim extraction is off, so there is no covariates table to count
+    assert not await context.storage.has("covariates.parquet")